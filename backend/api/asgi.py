@@ -0,0 +1,109 @@
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from urllib.parse import parse_qsl
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from asgiref.wsgi import WsgiToAsgi
+
+from index import app as flask_app, HIGH_FREQUENCY_ROUTES, LOG_SAMPLE_RATE, start_background_workers
+from routes.interviews_async import ASYNC_ROUTES as INTERVIEW_ROUTES
+from routes.scheduler_async import ASYNC_ROUTES as SCHEDULER_ROUTES
+from services import metrics
+
+# Async serving mode:
+#     uvicorn asgi:app --host 0.0.0.0 --port 5000
+# The LLM-bound endpoints in routes/interviews_async.py and the /wait long
+# poll in routes/scheduler_async.py run on the event loop; every other
+# request goes to the Flask app through a WSGI adapter.
+
+logger = logging.getLogger("api.requests")
+
+wsgi_app = WsgiToAsgi(flask_app)
+
+ASYNC_ROUTES = INTERVIEW_ROUTES + SCHEDULER_ROUTES
+
+
+async def read_json(receive):
+    """Read the whole request body and parse it as JSON (None if empty or invalid)"""
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body"):
+            break
+    try:
+        return json.loads(b"".join(chunks) or b"null")
+    except ValueError:
+        return None
+
+
+async def send_json(send, payload, status):
+    body = json.dumps(payload).encode()
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            # Same default policy as CORS(app) on the Flask side
+            (b"access-control-allow-origin", b"*"),
+        ]
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+async def lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            # The async routes skip Flask's before_request, so start them here
+            start_background_workers()
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        await lifespan(receive, send)
+        return
+
+    if scope["type"] == "http":
+        for method, pattern, rule, handler, reads in ASYNC_ROUTES:
+            match = pattern.fullmatch(scope["path"])
+            if not match or scope["method"] != method:
+                continue
+
+            started = time.perf_counter()
+            query = dict(parse_qsl(scope.get("query_string", b"").decode()))
+            if reads == "json":
+                payload, status = await handler(await read_json(receive))
+            elif reads == "query":
+                payload, status = await handler(query)
+            else:
+                payload, status = await handler(**match.groupdict())
+            await send_json(send, payload, status)
+
+            # Flask's request hooks don't see these requests, so log and count here
+            duration = time.perf_counter() - started
+            metrics.observe("http_request_duration_seconds", duration, route=rule, method=method)
+            metrics.inc("http_requests_total", route=rule, method=method, status=status)
+            fields = {
+                "route": rule,
+                "method": method,
+                "status": status,
+                "duration_ms": round(duration * 1000, 2),
+                "interview_id": match.groupdict().get("interview_id") or query.get("id")
+            }
+            if rule in HIGH_FREQUENCY_ROUTES:
+                fields["sample_rate"] = LOG_SAMPLE_RATE
+            logger.info("request completed", extra=fields)
+            return
+
+    await wsgi_app(scope, receive, send)
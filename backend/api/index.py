@@ -1,9 +1,11 @@
+import logging
 import os
 import sys
+import threading
+import time
 from pathlib import Path
-from flask import Flask
+from flask import Flask, Response, g, request
 from flask_cors import CORS
-from flask_mail import Mail
 from dotenv import load_dotenv
 
 # Add current directory to path
@@ -11,6 +13,22 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 load_dotenv()
 
+from utils.logging_config import configure_logging
+configure_logging()
+
+logger = logging.getLogger("api.requests")
+
+# Polled endpoints: only a sample of their request logs is kept
+HIGH_FREQUENCY_ROUTES = {
+    '/api/health',
+    '/api/metrics',
+    '/api/warmup',
+    '/api/scheduler/status',
+    '/api/scheduler/wait',
+    '/api/interviews/upload-status/<job_id>'
+}
+LOG_SAMPLE_RATE = float(os.getenv('LOG_SAMPLE_RATE', 0.05))
+
 app = Flask(__name__)
 CORS(app)
 
@@ -22,20 +40,116 @@ app.config['MAIL_USERNAME'] = os.getenv('MAIL_USERNAME')
 app.config['MAIL_PASSWORD'] = os.getenv('MAIL_PASSWORD')
 app.config['MAIL_DEFAULT_SENDER'] = os.getenv('MAIL_USERNAME')
 
-# Initialize Mail
-mail = Mail(app)
+from services import email_outbox, lifecycle_sweeper
 
 # Import blueprints (after app initialization)
 from routes.scheduler import scheduler_bp
 from routes.interviews import interviews_bp
+from routes.analytics import analytics_bp
+
+# Per-route latency histograms for /api/metrics
+from services.metrics import register_blueprint_timing, render_prometheus
+register_blueprint_timing(scheduler_bp)
+register_blueprint_timing(interviews_bp)
+register_blueprint_timing(analytics_bp)
 
 # Register blueprints
 app.register_blueprint(scheduler_bp)
 app.register_blueprint(interviews_bp)
+app.register_blueprint(analytics_bp)
+
+_background_started = False
+_background_lock = threading.Lock()
+
+
+def start_background_workers():
+    """Start the email outbox sender and the lifecycle sweeper, once per process
+
+    Run on the first request rather than at import, so importing the app
+    (gunicorn --preload, scripts, tests) starts no threads and each forked
+    worker starts its own. EMAIL_OUTBOX_SENDER / LIFECYCLE_SWEEPER=false
+    still turn either one off.
+    """
+    global _background_started
+
+    if _background_started:
+        return
+    with _background_lock:
+        if _background_started:
+            return
+        # Deliver queued emails in the background (Flask-Mail is set up on first send)
+        email_outbox.init_app(app)
+        # Expire and abandon interviews in the background
+        lifecycle_sweeper.start()
+        _background_started = True
+
+
+@app.before_request
+def start_request_timer():
+    start_background_workers()
+    g.request_started = time.perf_counter()
+
+
+@app.after_request
+def log_request(response):
+    started = getattr(g, 'request_started', None)
+    route = request.url_rule.rule if request.url_rule else request.path
+
+    fields = {
+        "route": route,
+        "method": request.method,
+        "status": response.status_code,
+        "duration_ms": round((time.perf_counter() - started) * 1000, 2) if started else None,
+        "interview_id": (request.view_args or {}).get('interview_id') or request.args.get('id')
+    }
+    if route in HIGH_FREQUENCY_ROUTES:
+        fields["sample_rate"] = LOG_SAMPLE_RATE
+
+    logger.info("request completed", extra=fields)
+    return response
+
 
 @app.route('/api/health', methods=['GET'])
 def health():
     return {'status': 'ok', 'message': 'Backend is running'}, 200
 
+
+@app.route('/api/metrics', methods=['GET'])
+def metrics():
+    return Response(render_prometheus(), mimetype='text/plain; version=0.0.4')
+
+
+def _time_init(init):
+    """Run one lazy initializer and report whether it came up and how long it took"""
+    started = time.perf_counter()
+    try:
+        result = {"ok": init() is not None}
+    except Exception as e:
+        result = {"ok": False, "error": str(e)}
+    result["duration_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    return result
+
+
+@app.route('/api/warmup', methods=['GET'])
+def warmup():
+    """Create the lazily initialized clients ahead of real traffic
+
+    Nothing here is required: every client is also created on first use.
+    Calling this after a deploy (or from a scheduled ping) moves that cost
+    off the first candidate request.
+    """
+    from services import drive_service, mongodb_service
+    from services.llm_client import llm_client
+    from services.session_store import get_session_store
+
+    components = {
+        "mongo": mongodb_service.get_db,
+        "session_store": get_session_store,
+        "drive": drive_service.get_drive_service,
+        "mail": lambda: email_outbox.get_mail(app),
+        "openai": llm_client.get_client
+    }
+    return {name: _time_init(init) for name, init in components.items()}, 200
+
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
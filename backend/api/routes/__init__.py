@@ -2,5 +2,6 @@
 # Import blueprints for easier access
 from .scheduler import scheduler_bp
 from .interviews import interviews_bp
+from .analytics import analytics_bp
 
-__all__ = ['scheduler_bp', 'interviews_bp']
+__all__ = ['scheduler_bp', 'interviews_bp', 'analytics_bp']
@@ -0,0 +1,62 @@
+from flask import Blueprint, request, jsonify
+import logging
+import re
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.analytics import get_summary, list_roles
+from services.question_cache import jd_hash as compute_jd_hash
+
+analytics_bp = Blueprint('analytics', __name__, url_prefix='/api/analytics')
+
+logger = logging.getLogger(__name__)
+
+DAY_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+@analytics_bp.route('/roles', methods=['GET'])
+def roles():
+    """All-time score summaries per job description"""
+    try:
+        try:
+            limit = min(max(int(request.args.get("limit", 100)), 1), 1000)
+        except ValueError:
+            return jsonify({"error": "Invalid limit"}), 400
+
+        return jsonify({"status": "success", "roles": list_roles(limit)}), 200
+
+    except Exception as e:
+        logger.exception("Analytics roles error: %s", e)
+        return jsonify({"error": str(e)}), 500
+
+
+@analytics_bp.route('', methods=['GET'])
+@analytics_bp.route('/summary', methods=['GET'])
+def summary():
+    """Score distribution for one job description (by jd_hash or jd text)"""
+    try:
+        jd_hash = request.args.get("jd_hash")
+        if not jd_hash and request.args.get("jd"):
+            jd_hash = compute_jd_hash(request.args["jd"])
+
+        if not jd_hash:
+            return jsonify({"error": "jd_hash or jd required"}), 400
+
+        start_day = request.args.get("from")
+        end_day = request.args.get("to")
+        for day in (start_day, end_day):
+            if day and not DAY_PATTERN.match(day):
+                return jsonify({"error": "Dates must be YYYY-MM-DD"}), 400
+
+        result = get_summary(jd_hash, start_day, end_day)
+        if result is None:
+            return jsonify({"error": "Database not connected"}), 500
+
+        return jsonify({"status": "success", "summary": result}), 200
+
+    except Exception as e:
+        logger.exception("Analytics summary error: %s", e)
+        return jsonify({"error": str(e)}), 500
@@ -1,6 +1,7 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, redirect, request, jsonify
 from datetime import datetime
 import json
+import logging
 import os
 import sys
 from pathlib import Path
@@ -9,29 +10,20 @@ import pytz
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from services.mongodb_service import save_interview_result
-from services.drive_service import upload_to_drive
-from utils.helpers import parse_iso_datetime
+from services.mongodb_service import save_interview_result, get_recording_fields
+from services.upload_queue import upload_queue, UploadQueueFull
+from services import recording_chunks
+from services.recording_storage import get_recording_storage, iter_file_range
+from services import status_cache
+from services.session_store import get_session_store
+from services.question_cache import get_question_cache
+from services.answer_scoring import submit_answer_scoring, collect_scores, discard_pending
+from services.llm_client import llm_client
+from utils.helpers import parse_byte_range, spool_to_tempfile
 
 interviews_bp = Blueprint('interviews', __name__, url_prefix='/api/interviews')
 
-# Initialize OpenAI lazily to avoid import errors
-client = None
-
-def get_openai_client():
-    global client
-    if client is None:
-        try:
-            from openai import OpenAI
-            api_key = os.getenv("OPENAI_API_KEY")
-            if not api_key:
-                raise ValueError("OPENAI_API_KEY not set in environment variables")
-            client = OpenAI(api_key=api_key)
-            print("✅ OpenAI client initialized")
-        except Exception as e:
-            print(f"❌ Error initializing OpenAI: {e}")
-            raise
-    return client
+logger = logging.getLogger(__name__)
 
 UTC = pytz.utc
 IST = pytz.timezone("Asia/Kolkata")
@@ -43,9 +35,6 @@ Ask only one question at a time.
 Make questions specific to the job description provided.
 """
 
-# In-memory storage for current interview session
-interview_sessions = {}
-
 @interviews_bp.route('/generate-questions', methods=['POST'])
 def generate_questions():
     """Generate interview questions based on job description"""
@@ -74,10 +63,14 @@ def generate_questions():
                     "interview_status": "started",
                     "started_at": datetime.utcnow()
                 }
-            }
+            },
+            # The pre-update document carries any pre-generated questions
+            projection={"questions": 1}
         )
 
-        if not update_result:
+        if update_result:
+            status_cache.invalidate(interview_id)
+        else:
             # Interview is already started, completed, or doesn't exist
             existing = scheduled_interviews.find_one({"interview_id": interview_id})
             
@@ -100,7 +93,27 @@ def generate_questions():
             }), 403
 
         # ✅ Continue only if lock succeeded
-        prompt = f"""
+        questions = update_result.get("questions")
+        if not questions:
+            # Pre-generation failed or hasn't finished yet
+            questions = get_question_cache().get_or_generate(jd_text, generate_question_list)
+
+        get_session_store().create(interview_id, questions)
+
+        return jsonify({
+            "status": "success",
+            "total": len(questions),
+            "questions": questions
+        }), 200
+
+    except Exception as e:
+        logger.exception("Error generating questions: %s", e)
+        return jsonify({"error": str(e)}), 500
+
+
+def build_question_messages(jd_text):
+    """Build the chat messages that ask for questions for a job description"""
+    prompt = f"""
 Based on the following Job Description, generate exactly 5 interview questions.
 Questions should be technical and role-specific.
 Make them clear and conversational.
@@ -111,63 +124,43 @@ Job Description:
 Return ONLY the numbered questions, one per line.
 """
 
-        openai_client = get_openai_client()
-        response = openai_client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.4
-        )
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": prompt}
+    ]
 
-        raw_text = response.choices[0].message.content
-        questions = parse_questions(raw_text)
 
-        interview_sessions[interview_id] = {
-            "questions": questions,
-            "current_index": 0,
-            "qna": []
-        }
+def generate_question_list(jd_text):
+    """Ask the LLM for a fresh set of questions for a job description"""
+    response = llm_client.chat(
+        "questions",
+        build_question_messages(jd_text),
+        temperature=0.4
+    )
 
-        return jsonify({
-            "status": "success",
-            "total": len(questions),
-            "questions": questions
-        }), 200
+    raw_text = response.choices[0].message.content
+    return parse_questions(raw_text)
 
-    except Exception as e:
-        print(f"Error generating questions: {e}")
-        return jsonify({"error": str(e)}), 500
 
+@interviews_bp.route('/question-cache/stats', methods=['GET'])
+def question_cache_stats():
+    """Get question cache hit/miss counters"""
+    return jsonify(get_question_cache().stats()), 200
 
 
 @interviews_bp.route('/next-question/<interview_id>', methods=['GET'])
 def next_question(interview_id):
     """Get next interview question"""
     try:
-        if interview_id not in interview_sessions:
+        result = get_session_store().next_question(interview_id)
+
+        if result is None:
             return jsonify({"error": "Interview session not found"}), 404
         
-        session = interview_sessions[interview_id]
-        current_index = session["current_index"]
-        questions = session["questions"]
-        
-        if current_index >= len(questions):
-            return jsonify({"done": True, "question": ""}), 200
-        
-        question = questions[current_index]
-        session["current_index"] += 1
-        
-        return jsonify({
-            "done": False,
-            "question": question,
-            "questionNumber": current_index + 1,
-            "totalQuestions": len(questions)
-        }), 200
+        return jsonify(result), 200
     
     except Exception as e:
-        print(f"Error getting next question: {e}")
+        logger.exception("Error getting next question: %s", e, extra={"interview_id": interview_id})
         return jsonify({"error": str(e)}), 500
 
 
@@ -175,9 +168,6 @@ def next_question(interview_id):
 def submit_answer(interview_id):
     """Submit answer to a question"""
     try:
-        if interview_id not in interview_sessions:
-            return jsonify({"error": "Interview session not found"}), 404
-        
         data = request.json
         question = data.get("question")
         answer = data.get("answer")
@@ -185,13 +175,20 @@ def submit_answer(interview_id):
         if not question or not answer:
             return jsonify({"error": "Question and answer required"}), 400
         
-        session = interview_sessions[interview_id]
-        session["qna"].append({
+        qa = {
             "question": question,
             "answer": answer
-        })
+        }
+        store = get_session_store()
+        index = store.append_answer(interview_id, qa)
+
+        if index is None:
+            return jsonify({"error": "Interview session not found"}), 404
         
-        print(f"✅ Answer saved for interview {interview_id}")
+        # Score in the background while the candidate moves on
+        submit_answer_scoring(store, interview_id, index, qa, score_answer)
+
+        logger.debug("Answer saved", extra={"interview_id": interview_id, "answer_index": index})
         
         return jsonify({
             "status": "success",
@@ -199,7 +196,7 @@ def submit_answer(interview_id):
         }), 200
     
     except Exception as e:
-        print(f"Error submitting answer: {e}")
+        logger.exception("Error submitting answer: %s", e, extra={"interview_id": interview_id})
         return jsonify({"error": str(e)}), 500
 
 
@@ -207,82 +204,208 @@ def submit_answer(interview_id):
 def evaluate_interview(interview_id):
     """Get AI evaluation of interview"""
     try:
-        if interview_id not in interview_sessions:
+        qna = collect_scores(get_session_store(), interview_id, score_answer)
+
+        if qna is None:
             return jsonify({"error": "Interview session not found"}), 404
         
-        session = interview_sessions[interview_id]
-        qna = session["qna"]
-        
         if not qna:
             return jsonify({"error": "No interview data"}), 400
         
-        # Prepare combined text
-        combined_text = ""
-        for idx, qa in enumerate(qna, start=1):
-            combined_text += f"""
-Q{idx}: {qa['question']}
-A{idx}: {qa['answer']}
-"""
+        # Answers are already scored, so only a short summary call is left
+        response = llm_client.chat(
+            "summary",
+            build_summary_messages(qna),
+            temperature=0.2
+        )
+        
+        result = build_evaluation(qna, response.choices[0].message.content)
+        save_evaluation(interview_id, qna, result)
         
-        prompt = f"""
+        return jsonify(result), 200
+    
+    except Exception as e:
+        logger.exception("Evaluation error: %s", e, extra={"interview_id": interview_id})
+        return jsonify({"error": str(e)}), 500
+
+
+@interviews_bp.route('/evaluate-stream/<interview_id>', methods=['GET'])
+def evaluate_interview_stream(interview_id):
+    """Stream the AI evaluation as Server-Sent Events"""
+    session = get_session_store().get(interview_id)
+
+    if session is None:
+        return jsonify({"error": "Interview session not found"}), 404
+
+    qna = session["qna"]
+
+    if not qna:
+        return jsonify({"error": "No interview data"}), 400
+
+    def generate():
+        yield sse_event("progress", {"stage": "scoring", "answers": len(qna)})
+
+        try:
+            scored_qna = collect_scores(get_session_store(), interview_id, score_answer)
+
+            yield sse_event("progress", {"stage": "summarizing"})
+
+            stream = llm_client.chat_stream(
+                "summary_stream",
+                build_summary_messages(scored_qna),
+                temperature=0.2
+            )
+
+            parts = []
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                token = chunk.choices[0].delta.content
+                if token:
+                    parts.append(token)
+                    yield sse_event("token", {"text": token})
+
+            yield sse_event("progress", {"stage": "saving"})
+
+            result = build_evaluation(scored_qna, "".join(parts))
+            save_evaluation(interview_id, scored_qna, result)
+
+            yield sse_event("result", result)
+
+        except Exception as e:
+            logger.exception("Evaluation stream error: %s", e, extra={"interview_id": interview_id})
+            yield sse_event("error", {"error": str(e)})
+
+    return Response(generate(), mimetype='text/event-stream', headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no"
+    })
+
+
+def sse_event(event, data):
+    """Format one Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def extract_json(result_text):
+    """Parse JSON from an LLM reply, stripping markdown fences"""
+    result_text = result_text.strip()
+
+    # Clean JSON response
+    if "```json" in result_text:
+        result_text = result_text.split("```json")[1].split("```")[0].strip()
+    elif "```" in result_text:
+        result_text = result_text.split("```")[1].split("```")[0].strip()
+    
+    return json.loads(result_text)
+
+
+def clamp_score(value):
+    """Coerce a score to an integer between 0 and 10"""
+    return max(0, min(10, int(round(float(value)))))
+
+
+def score_answer(qa):
+    """Score a single Q&A pair with a small LLM call"""
+    prompt = f"""
+You are a senior technical interview evaluator.
+Score this single answer.
+
+Question: {qa['question']}
+Answer: {qa['answer']}
+
+Return ONLY valid JSON (no markdown, no extra text), scores are integers 0-10:
+{{
+  "technical_score": 0,
+  "communication_score": 0,
+  "note": "One sentence on strengths or gaps"
+}}
+"""
+
+    response = llm_client.chat(
+        "scoring",
+        [
+            {"role": "system", "content": "You are a strict evaluator. Return only valid JSON."},
+            {"role": "user", "content": prompt}
+        ],
+        temperature=0.2,
+        max_tokens=150
+    )
+
+    score = extract_json(response.choices[0].message.content)
+    return {
+        "technical_score": clamp_score(score.get("technical_score", 0)),
+        "communication_score": clamp_score(score.get("communication_score", 0)),
+        "note": str(score.get("note", ""))
+    }
+
+
+def build_summary_messages(qna):
+    """Build the chat messages that summarize already-scored answers"""
+    # Prepare per-question scores (answers themselves are not resent)
+    combined_text = ""
+    for idx, qa in enumerate(qna, start=1):
+        score = qa["score"]
+        combined_text += (
+            f"Q{idx}: technical {score['technical_score']}/10, "
+            f"communication {score['communication_score']}/10 - {score['note']}\n"
+        )
+
+    prompt = f"""
 You are a senior technical interview evaluator.
-Evaluate the candidate based on their answers.
+Each answer has already been scored. Summarize the interview.
 
 STRICT RULES:
 - Return ONLY valid JSON (no markdown, no extra text)
-- All scores MUST be integers 0-10
 - Recommendation MUST be: "Yes", "Maybe", or "No"
 
-Interview:
+Per-question scores:
 {combined_text}
-
 Return this JSON format exactly:
 {{
-  "technical_score": 0,
-  "communication_score": 0,
-  "overall_score": 0,
   "recommendation": "Yes",
   "feedback": "Brief evaluation"
 }}
 """
-        
-        openai_client = get_openai_client()
-        response = openai_client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "You are a strict evaluator. Return only valid JSON."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.2
-        )
-        
-        result_text = response.choices[0].message.content.strip()
-        
-        # Clean JSON response
-        if "```json" in result_text:
-            result_text = result_text.split("```json")[1].split("```")[0].strip()
-        elif "```" in result_text:
-            result_text = result_text.split("```")[1].split("```")[0].strip()
-        
-        result = json.loads(result_text)
-        
-        # Save to MongoDB
-        interview_data = {
-            "interview_id": interview_id,
-            "timestamp": datetime.utcnow().isoformat(),
-            "qna": qna,
-            "evaluation": result
-        }
-        
-        save_interview_result(interview_data)
-        
-        print(f"✅ Interview {interview_id} evaluated and saved")
-        
-        return jsonify(result), 200
+
+    return [
+        {"role": "system", "content": "You are a strict evaluator. Return only valid JSON."},
+        {"role": "user", "content": prompt}
+    ]
+
+
+def build_evaluation(qna, summary_text):
+    """Combine per-question scores with the summary into the final evaluation"""
+    summary = extract_json(summary_text)
+
+    technical = sum(qa["score"]["technical_score"] for qa in qna) / len(qna)
+    communication = sum(qa["score"]["communication_score"] for qa in qna) / len(qna)
+
+    recommendation = summary.get("recommendation")
+    if recommendation not in ("Yes", "Maybe", "No"):
+        raise ValueError(f"Invalid recommendation: {recommendation}")
+
+    return {
+        "technical_score": clamp_score(technical),
+        "communication_score": clamp_score(communication),
+        "overall_score": clamp_score((technical + communication) / 2),
+        "recommendation": recommendation,
+        "feedback": str(summary.get("feedback", ""))
+    }
+
+
+def save_evaluation(interview_id, qna, result):
+    """Save the Q&A and evaluation to MongoDB"""
+    interview_data = {
+        "interview_id": interview_id,
+        "timestamp": datetime.utcnow().isoformat(),
+        "qna": qna,
+        "evaluation": result
+    }
     
-    except Exception as e:
-        print(f"Evaluation error: {e}")
-        return jsonify({"error": str(e)}), 500
+    save_interview_result(interview_data)
+    
+    logger.info("Interview evaluated and saved", extra={"interview_id": interview_id})
 
 
 @interviews_bp.route('/upload-video/<interview_id>', methods=['POST'])
@@ -294,48 +417,198 @@ def upload_video(interview_id):
         
         video_file = request.files['video']
         candidate_name = request.form.get('candidate_name', 'Candidate')
-        candidate_email = request.form.get('candidate_email', '')
 
         
         if video_file.filename == '':
             return jsonify({"error": "No selected file"}), 400
         
-        file_content = video_file.read()
         filename = f"Interview_{candidate_name}_{interview_id}.webm"
-        
-        # Upload to Google Drive
-        result = upload_to_drive(file_content, filename)
-
-        from services.mongodb_service import scheduled_interviews
 
-        scheduled_interviews.update_one(
-            {"interview_id": interview_id},
-            {
-                "$set": {
-                    "interview_status": "completed",
-                    "completed_at": datetime.utcnow()
-                }
-            }
-        )
+        # Spool the recording to disk in chunks instead of reading it into memory
+        spool_path = spool_to_tempfile(video_file.stream, suffix='.webm')
 
-        
-        if result and result.get('id'):
-            print(f"✅ Video uploaded to Google Drive: {result.get('id')}")
+        # Hand the upload to the background queue so this worker is freed
+        try:
+            job_id = upload_queue.submit(spool_path, filename, interview_id)
+        except UploadQueueFull:
+            os.remove(spool_path)
             return jsonify({
-                "status": "success",
-                "message": "Video uploaded successfully",
-                "file_id": result.get('id'),
-                "file_link": result.get('link')
-            }), 200
+                "status": "error",
+                "message": "Upload queue is full, please retry shortly"
+            }), 503
 
-        else:
+        logger.info("Video queued for upload: job %s", job_id, extra={"interview_id": interview_id})
+
+        return jsonify({
+            "status": "queued",
+            "message": "Video accepted for upload",
+            "job_id": job_id,
+            "status_url": f"{interviews_bp.url_prefix}/upload-status/{job_id}"
+        }), 202
+    
+    except Exception as e:
+        logger.exception("Error uploading video: %s", e, extra={"interview_id": interview_id})
+        return jsonify({"error": str(e)}), 500
+
+
+@interviews_bp.route('/recording-chunks/<interview_id>/<int:index>', methods=['PUT'])
+def upload_recording_chunk(interview_id, index):
+    """Store one numbered chunk of the recording while the interview runs
+
+    The body is the raw chunk. Chunks can be retried and can arrive out of
+    order; the response says how many leading chunks the server holds.
+    """
+    try:
+        if not recording_chunks.valid_interview_id(interview_id):
+            return jsonify({"error": "Invalid interview id"}), 400
+        if index >= recording_chunks.MAX_CHUNKS:
+            return jsonify({"error": "Chunk index out of range"}), 400
+        if request.content_length is None:
+            return jsonify({"error": "Content-Length required"}), 411
+        if request.content_length > recording_chunks.CHUNK_MAX_BYTES:
+            return jsonify({"error": "Chunk too large"}), 413
+
+        try:
+            stored, state = recording_chunks.store_chunk(interview_id, index, request.stream)
+        except recording_chunks.RecordingCompleted:
+            return jsonify({"index": index, "status": "completed"}), 409
+
+        return jsonify({
+            "index": index,
+            "status": "stored" if stored else "duplicate",
+            "received": state["next_index"]
+        }), 200
+
+    except Exception as e:
+        logger.exception("Error storing recording chunk %d: %s", index, e, extra={"interview_id": interview_id})
+        return jsonify({"error": str(e)}), 500
+
+
+@interviews_bp.route('/recording-chunks/<interview_id>', methods=['GET'])
+def recording_chunk_progress(interview_id):
+    """Report which chunks have arrived, so a client can resume after a reload"""
+    if not recording_chunks.valid_interview_id(interview_id):
+        return jsonify({"error": "Invalid interview id"}), 400
+
+    progress = recording_chunks.get_progress(interview_id)
+    if progress is None:
+        return jsonify({"received": 0, "bytes": 0, "pending": []}), 200
+    return jsonify(progress), 200
+
+
+@interviews_bp.route('/recording-chunks/<interview_id>/complete', methods=['POST'])
+def complete_recording(interview_id):
+    """Queue the assembled recording for upload once every chunk is in"""
+    try:
+        if not recording_chunks.valid_interview_id(interview_id):
+            return jsonify({"error": "Invalid interview id"}), 400
+
+        data = request.get_json(silent=True) or {}
+        total_chunks = data.get("total_chunks")
+        if not isinstance(total_chunks, int) or not 0 < total_chunks <= recording_chunks.MAX_CHUNKS:
+            return jsonify({"error": "total_chunks required"}), 400
+
+        candidate_name = data.get('candidate_name') or 'Candidate'
+        filename = f"Interview_{candidate_name}_{interview_id}.webm"
+
+        try:
+            job_id = recording_chunks.complete(
+                interview_id,
+                total_chunks,
+                lambda spool_path: upload_queue.submit(spool_path, filename, interview_id)
+            )
+        except recording_chunks.IncompleteRecording as e:
+            # The client re-sends these and calls complete again
+            return jsonify({"status": "incomplete", "missing": e.missing}), 409
+        except recording_chunks.RecordingCompleted:
+            # A retry whose first attempt already queued the upload
+            return jsonify({"status": "completed", "message": "Video already accepted"}), 200
+        except UploadQueueFull:
+            # The chunks are kept, so complete can simply be called again
             return jsonify({
                 "status": "error",
-                "message": "Failed to upload video to Google Drive"
-            }), 500
-    
+                "message": "Upload queue is full, please retry shortly"
+            }), 503
+
+        if job_id is None:
+            return jsonify({"error": "No chunks received"}), 404
+
+        logger.info("Chunked recording queued for upload: job %s", job_id, extra={"interview_id": interview_id})
+
+        return jsonify({
+            "status": "queued",
+            "message": "Video accepted for upload",
+            "job_id": job_id,
+            "status_url": f"{interviews_bp.url_prefix}/upload-status/{job_id}"
+        }), 202
+
+    except Exception as e:
+        logger.exception("Error completing recording: %s", e, extra={"interview_id": interview_id})
+        return jsonify({"error": str(e)}), 500
+
+
+@interviews_bp.route('/upload-status/<job_id>', methods=['GET'])
+def upload_status(job_id):
+    """Get the status of a background video upload"""
+    job = upload_queue.get_job(job_id)
+
+    if not job:
+        return jsonify({"error": "Upload job not found"}), 404
+
+    job.pop("filename", None)
+    return jsonify(job), 200
+
+
+@interviews_bp.route('/recording/<interview_id>', methods=['GET'])
+def get_recording(interview_id):
+    """Play back an interview recording, serving byte ranges for seeking
+
+    Recordings on local storage are streamed from a memory map, 206 for a
+    Range request; recordings on Drive redirect to Drive.
+    """
+    try:
+        fields = get_recording_fields(interview_id)
+        if not fields:
+            return jsonify({"error": "Interview not found"}), 404
+
+        recording_id = fields.get("recording_id")
+        storage = get_recording_storage(fields.get("recording_backend"))
+        path = storage.local_path(recording_id) if recording_id else None
+
+        if path is None:
+            # Interviews recorded before recording_id was stored only have video_link
+            url = (storage.url(recording_id) if recording_id else None) or fields.get("video_link")
+            if url:
+                return redirect(url)
+            return jsonify({"error": "Recording not found"}), 404
+
+        size = path.stat().st_size
+        try:
+            byte_range = parse_byte_range(request.headers.get('Range'), size)
+        except ValueError:
+            return Response(status=416, headers={"Content-Range": f"bytes */{size}"})
+
+        start, end = byte_range or (0, size - 1)
+        headers = {
+            "Accept-Ranges": "bytes",
+            "Content-Length": str(end - start + 1),
+            # Content-addressed, so the bytes behind this id never change
+            "ETag": f'"{recording_id}"',
+            "Cache-Control": "private, max-age=86400"
+        }
+        if byte_range:
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+        return Response(
+            iter_file_range(path, start, end),
+            status=206 if byte_range else 200,
+            headers=headers,
+            mimetype='video/webm',
+            direct_passthrough=True
+        )
+
     except Exception as e:
-        print(f"Error uploading video: {e}")
+        logger.exception("Error serving recording: %s", e, extra={"interview_id": interview_id})
         return jsonify({"error": str(e)}), 500
 
 
@@ -343,14 +616,14 @@ def upload_video(interview_id):
 def cleanup_session(interview_id):
     """Clean up interview session from memory"""
     try:
-        if interview_id in interview_sessions:
-            del interview_sessions[interview_id]
-            print(f"✅ Cleaned up session for interview {interview_id}")
+        get_session_store().delete(interview_id)
+        discard_pending(interview_id)
+        logger.info("Cleaned up session", extra={"interview_id": interview_id})
         
         return jsonify({"status": "success"}), 200
     
     except Exception as e:
-        print(f"Error cleaning up session: {e}")
+        logger.exception("Error cleaning up session: %s", e, extra={"interview_id": interview_id})
         return jsonify({"error": str(e)}), 500
 
 
@@ -0,0 +1,154 @@
+import asyncio
+import logging
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from routes.interviews import (
+    build_question_messages,
+    build_summary_messages,
+    build_evaluation,
+    parse_questions,
+    score_answer
+)
+from services import status_cache
+from services.session_store import get_session_store
+from services.mongodb_service import get_async_collection, save_interview_result_async
+from services.question_cache import get_question_cache
+from services.answer_scoring import collect_scores_async
+from services.llm_client import llm_client
+
+logger = logging.getLogger(__name__)
+
+# Async versions of the LLM-bound interview endpoints, served by asgi.py.
+# Routes and JSON contracts match routes/interviews.py; only the waiting
+# (OpenAI, MongoDB) is async, so one process can hold many LLM calls in flight.
+
+async def generate_question_list_async(jd_text):
+    """Async generate_question_list()"""
+    response = await llm_client.achat(
+        "questions",
+        build_question_messages(jd_text),
+        temperature=0.4
+    )
+    return parse_questions(response.choices[0].message.content)
+
+
+async def generate_questions(body):
+    """Generate interview questions based on job description"""
+    try:
+        data = body or {}
+        jd_text = (data.get("jd") or "").strip()
+        interview_id = data.get("interview_id")
+
+        if not jd_text:
+            return {"error": "Job description required"}, 400
+
+        if not interview_id:
+            return {"error": "Interview ID required"}, 400
+
+        scheduled_interviews = get_async_collection("scheduled_interviews")
+        if scheduled_interviews is None:
+            return {"error": "Database not connected"}, 500
+
+        # Same atomic scheduled -> started lock as the sync route
+        update_result = await scheduled_interviews.find_one_and_update(
+            {"interview_id": interview_id, "interview_status": "scheduled"},
+            {"$set": {"interview_status": "started", "started_at": datetime.utcnow()}},
+            projection={"questions": 1}
+        )
+
+        # The status cache, question cache and session store use the sync
+        # driver (and their first use pings MongoDB), so they run in threads
+        if update_result:
+            await asyncio.to_thread(status_cache.invalidate, interview_id)
+        else:
+            existing = await scheduled_interviews.find_one(
+                {"interview_id": interview_id},
+                {"interview_status": 1}
+            )
+            current_status = existing.get("interview_status") if existing else None
+
+            if current_status == "started":
+                return {
+                    "status": "already_started",
+                    "message": "Interview already in progress from another session"
+                }, 403
+            if current_status == "completed":
+                return {
+                    "status": "completed",
+                    "message": "Interview link already used or invalid"
+                }, 403
+
+            return {
+                "status": "expired",
+                "message": "Interview link already used or invalid"
+            }, 403
+
+        questions = update_result.get("questions")
+        if not questions:
+            # Pre-generation failed or hasn't finished yet
+            cache = await asyncio.to_thread(get_question_cache)
+            key, questions = await asyncio.to_thread(cache.lookup, jd_text)
+            if questions is None:
+                questions = await generate_question_list_async(jd_text)
+                await asyncio.to_thread(cache.store, key, questions)
+
+        store = await asyncio.to_thread(get_session_store)
+        await asyncio.to_thread(store.create, interview_id, questions)
+
+        return {
+            "status": "success",
+            "total": len(questions),
+            "questions": questions
+        }, 200
+
+    except Exception as e:
+        logger.exception("Error generating questions: %s", e)
+        return {"error": str(e)}, 500
+
+
+async def evaluate_interview(interview_id):
+    """Get AI evaluation of interview"""
+    try:
+        store = await asyncio.to_thread(get_session_store)
+        qna = await collect_scores_async(store, interview_id, score_answer)
+
+        if qna is None:
+            return {"error": "Interview session not found"}, 404
+
+        if not qna:
+            return {"error": "No interview data"}, 400
+
+        response = await llm_client.achat(
+            "summary",
+            build_summary_messages(qna),
+            temperature=0.2
+        )
+
+        result = build_evaluation(qna, response.choices[0].message.content)
+        await save_interview_result_async({
+            "interview_id": interview_id,
+            "timestamp": datetime.utcnow().isoformat(),
+            "qna": qna,
+            "evaluation": result
+        })
+
+        return result, 200
+
+    except Exception as e:
+        logger.exception("Evaluation error: %s", e, extra={"interview_id": interview_id})
+        return {"error": str(e)}, 500
+
+
+# (method, path pattern, route rule, handler, request input)
+ASYNC_ROUTES = [
+    ("POST", re.compile(r"/api/interviews/generate-questions"),
+     "/api/interviews/generate-questions", generate_questions, "json"),
+    ("GET", re.compile(r"/api/interviews/evaluate/(?P<interview_id>[^/]+)"),
+     "/api/interviews/evaluate/<interview_id>", evaluate_interview, None),
+]
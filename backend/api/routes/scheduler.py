@@ -1,7 +1,11 @@
-from flask import Blueprint, request, jsonify
-from flask_mail import Mail, Message
+from flask import Blueprint, Response, request, jsonify, stream_with_context
 from datetime import datetime
+import csv
+import io
+import json
+import logging
 import pytz
+import random
 import uuid
 import os
 import sys
@@ -10,16 +14,45 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from services.mongodb_service import save_scheduled_interview, get_interview_by_id
-from utils.helpers import parse_iso_datetime, validate_schedule_data
+from services.mongodb_service import (
+    save_scheduled_interview,
+    save_scheduled_interviews,
+    get_interview_by_id,
+    get_job_description,
+    list_interviews,
+    iter_interviews,
+    decode_cursor,
+    LISTING_FIELDS
+)
+from services import status_cache
+from services.results_export import export_stream
+from services.email_outbox import enqueue_email, enqueue_emails, render_interview_email
+from services.question_pregen import schedule_pregeneration
+from routes.interviews import generate_question_list
+from utils.helpers import parse_iso_datetime, validate_schedule_data, validate_email
 
 scheduler_bp = Blueprint('scheduler', __name__, url_prefix='/api/scheduler')
 
-mail = Mail()
+logger = logging.getLogger(__name__)
+
+INTERVIEW_EMAIL_SUBJECT = '🎯 Your Interview Schedule - Action Required'
 
 UTC = pytz.utc
 IST = pytz.timezone("Asia/Kolkata")
 
+# Largest hiring-drive batch accepted by /schedule-batch
+BATCH_MAX_ROWS = int(os.getenv('BATCH_MAX_ROWS', 1000))
+
+# /wait sends a waiting client back at most this long later, and spreads the
+# clients of one start time over the jitter after it
+WAIT_MAX_RETRY_SECONDS = int(os.getenv('WAIT_MAX_RETRY_SECONDS', 25))
+WAIT_JITTER_SECONDS = float(os.getenv('WAIT_JITTER_SECONDS', 3))
+
+# Admin listing: page sizes, and documents per cursor batch in NDJSON mode
+LISTING_PAGE_SIZE = 50
+LISTING_MAX_PAGE_SIZE = 500
+LISTING_STREAM_BATCH_SIZE = int(os.getenv('LISTING_STREAM_BATCH_SIZE', 500))
+
 @scheduler_bp.route('/schedule', methods=['POST'])
 def schedule_interview():
     """Schedule a new interview"""
@@ -29,48 +62,10 @@ def schedule_interview():
         if not validate_schedule_data(data):
             return jsonify({"error": "Missing required fields"}), 400
         
-        candidate_email = data.get('candidateEmail')
-        candidate_name = data.get('candidateName')
-        job_description = data.get('jobDescription')
-        start_time_str = data.get('startTime')
-        end_time_str = data.get('endTime')
-        
-        # Parse times (will be in UTC)
-        start_time = parse_iso_datetime(start_time_str)
-        end_time = parse_iso_datetime(end_time_str)
-        
-        if not start_time or not end_time:
-            return jsonify({"error": "Invalid date format"}), 400
-        
-        if start_time >= end_time:
-            return jsonify({"error": "Start time must be before end time"}), 400
-        
-        # Generate interview ID
-        interview_id = str(uuid.uuid4())
-        
-        # Build interview link (will be updated with actual domain on production)
-        base_url = os.getenv('FRONTEND_URL', 'http://localhost:3000')
-        interview_link = f"{base_url}/interviewer/index.html?id={interview_id}"
-        
-        # Convert to IST for email display
-        start_time_ist = start_time.astimezone(IST)
-        end_time_ist = end_time.astimezone(IST)
-        
-        start_time_display = start_time_ist.strftime('%d %b %Y, %I:%M %p IST')
-        end_time_display = end_time_ist.strftime('%d %b %Y, %I:%M %p IST')
-        
-        # Prepare interview data
-        interview_data = {
-            "interview_id": interview_id,
-            "candidate_name": candidate_name,
-            "candidate_email": candidate_email,
-            "job_description": job_description,
-            "start_time": start_time,
-            "end_time": end_time,
-            "interview_link": interview_link,
-            "interview_status": "scheduled",
-            "scheduled_at": datetime.utcnow()
-        }
+        interview_data, email_args, error = prepare_interview(data)
+
+        if error:
+            return jsonify({"error": error}), 400
         
         # Save to MongoDB
         mongodb_id = save_scheduled_interview(interview_data)
@@ -78,26 +73,177 @@ def schedule_interview():
         if not mongodb_id:
             return jsonify({"error": "Failed to save interview"}), 500
         
-        # Send email
+        # Queue email (delivered by the outbox sender)
         try:
-            send_interview_email(candidate_name, candidate_email, interview_link, start_time_display, end_time_display)
+            send_interview_email(*email_args)
         except Exception as e:
-            print(f"Email sending error: {e}")
+            logger.error("Email sending error: %s", e, extra={"interview_id": interview_data["interview_id"]})
             # Don't fail the entire request if email fails
+
+        # Questions are ready before the candidate clicks start
+        schedule_pregeneration(
+            [(interview_data["interview_id"], interview_data["job_description"])],
+            generate_question_list
+        )
         
         return jsonify({
             "status": "success",
             "message": "Interview scheduled successfully",
-            "interviewId": interview_id,
-            "interviewLink": interview_link,
+            "interviewId": interview_data["interview_id"],
+            "interviewLink": interview_data["interview_link"],
             "mongodb_id": mongodb_id
         }), 201
     
     except Exception as e:
-        print(f"Scheduling error: {e}")
+        logger.exception("Scheduling error: %s", e)
         return jsonify({"error": str(e)}), 500
 
 
+@scheduler_bp.route('/schedule-batch', methods=['POST'])
+def schedule_interview_batch():
+    """Schedule many interviews from a JSON array or CSV upload"""
+    try:
+        rows, error = read_batch_rows()
+
+        if error:
+            return jsonify({"error": error}), 400
+
+        if len(rows) > BATCH_MAX_ROWS:
+            return jsonify({"error": f"Batch limited to {BATCH_MAX_ROWS} rows"}), 400
+
+        results = []
+        valid = []  # (result, interview_data, email_args)
+
+        for row_number, row in enumerate(rows, start=1):
+            result = {"row": row_number, "candidateEmail": row.get("candidateEmail") if isinstance(row, dict) else None}
+            results.append(result)
+
+            if not isinstance(row, dict) or not validate_schedule_data(row):
+                result.update(status="error", error="Missing required fields")
+                continue
+
+            if not validate_email(row["candidateEmail"].strip()):
+                result.update(status="error", error="Invalid email address")
+                continue
+
+            interview_data, email_args, error = prepare_interview(row)
+            if error:
+                result.update(status="error", error=error)
+                continue
+
+            valid.append((result, interview_data, email_args))
+
+        # One bulk insert for every valid row
+        mongodb_ids = save_scheduled_interviews([item[1] for item in valid]) if valid else []
+        emails = []
+        pregen = []
+
+        for (result, interview_data, email_args), mongodb_id in zip(valid, mongodb_ids):
+            if not mongodb_id:
+                result.update(status="error", error="Failed to save interview")
+                continue
+
+            result.update(
+                status="scheduled",
+                interviewId=interview_data["interview_id"],
+                interviewLink=interview_data["interview_link"],
+                mongodb_id=mongodb_id
+            )
+            emails.append(build_interview_email(*email_args))
+            pregen.append((interview_data["interview_id"], interview_data["job_description"]))
+
+        # The outbox delivers these in batches over one SMTP connection
+        if emails:
+            enqueue_emails(emails)
+
+        # Rows sharing a job description reuse one generation via the question cache
+        schedule_pregeneration(pregen, generate_question_list)
+
+        scheduled = sum(1 for result in results if result["status"] == "scheduled")
+
+        return jsonify({
+            "status": "success" if scheduled else "error",
+            "total": len(results),
+            "scheduled": scheduled,
+            "failed": len(results) - scheduled,
+            "results": results
+        }), 201 if scheduled else 400
+
+    except Exception as e:
+        logger.exception("Batch scheduling error: %s", e)
+        return jsonify({"error": str(e)}), 500
+
+
+def read_batch_rows():
+    """Read batch rows from a CSV upload, a CSV body or a JSON array"""
+    if 'file' in request.files:
+        upload = request.files['file']
+        text = io.TextIOWrapper(upload.stream, encoding='utf-8-sig')
+        return [dict(row) for row in csv.DictReader(text)], None
+
+    if request.mimetype == 'text/csv':
+        text = io.StringIO(request.get_data(as_text=True))
+        return [dict(row) for row in csv.DictReader(text)], None
+
+    data = request.get_json(silent=True)
+    if isinstance(data, dict):
+        data = data.get("interviews")
+
+    if not isinstance(data, list):
+        return None, "Expected a JSON array or CSV file"
+
+    return data, None
+
+
+def prepare_interview(data):
+    """Build interview data and email arguments from a validated request row"""
+    candidate_email = data.get('candidateEmail').strip()
+    candidate_name = data.get('candidateName').strip()
+    job_description = data.get('jobDescription')
+    start_time_str = data.get('startTime')
+    end_time_str = data.get('endTime')
+    
+    # Parse times (will be in UTC)
+    start_time = parse_iso_datetime(start_time_str)
+    end_time = parse_iso_datetime(end_time_str)
+    
+    if not start_time or not end_time:
+        return None, None, "Invalid date format"
+    
+    if start_time >= end_time:
+        return None, None, "Start time must be before end time"
+    
+    # Generate interview ID
+    interview_id = str(uuid.uuid4())
+    
+    # Build interview link (will be updated with actual domain on production)
+    base_url = os.getenv('FRONTEND_URL', 'http://localhost:3000')
+    interview_link = f"{base_url}/interviewer/index.html?id={interview_id}"
+    
+    # Convert to IST for email display
+    start_time_ist = start_time.astimezone(IST)
+    end_time_ist = end_time.astimezone(IST)
+    
+    start_time_display = start_time_ist.strftime('%d %b %Y, %I:%M %p IST')
+    end_time_display = end_time_ist.strftime('%d %b %Y, %I:%M %p IST')
+    
+    # Prepare interview data
+    interview_data = {
+        "interview_id": interview_id,
+        "candidate_name": candidate_name,
+        "candidate_email": candidate_email,
+        "job_description": job_description,
+        "start_time": start_time,
+        "end_time": end_time,
+        "interview_link": interview_link,
+        "interview_status": "scheduled",
+        "scheduled_at": datetime.utcnow()
+    }
+
+    email_args = (candidate_name, candidate_email, interview_link, start_time_display, end_time_display)
+    return interview_data, email_args, None
+
+
 @scheduler_bp.route('/status', methods=['GET'])
 def interview_status():
     """Check interview status based on current time"""
@@ -107,88 +253,231 @@ def interview_status():
         if not interview_id:
             return jsonify({"status": "invalid", "message": "Interview ID required"}), 400
         
-        interview = get_interview_by_id(interview_id)
+        interview = status_cache.get_status_doc(interview_id)
         
         if not interview:
             return jsonify({"status": "not_found", "message": "Interview not found"}), 404
         
-        # ✅ BLOCK REUSED / COMPLETED / ALREADY STARTED INTERVIEWS
-        status = interview.get("interview_status")
+        payload, code = build_status_payload(interview)
+        return jsonify(payload), code
+    
+    except Exception as e:
+        logger.exception("Status check error: %s", e)
+        return jsonify({"error": str(e)}), 500
 
-        if status == "completed":
-            return jsonify({
-                "status": "completed",
-                "message": "Interview already completed"
-            }), 200
-        
-        if status == "started":
-            return jsonify({
-                "status": "already_started",
-                "message": "Interview already in progress"
-            }), 200
 
+def build_status_payload(interview):
+    """Work out the status response for a cached status document"""
+    # ✅ BLOCK REUSED / COMPLETED / ALREADY STARTED INTERVIEWS
+    status = interview.get("interview_status")
 
-        # Get start and end times
-        start_time = interview.get("start_time")
-        end_time = interview.get("end_time")
-        
-        # Ensure they are datetime objects with UTC timezone
-        if isinstance(start_time, str):
-            start_time = parse_iso_datetime(start_time)
-        elif isinstance(start_time, datetime) and start_time.tzinfo is None:
-            start_time = UTC.localize(start_time)
-        
-        if isinstance(end_time, str):
-            end_time = parse_iso_datetime(end_time)
-        elif isinstance(end_time, datetime) and end_time.tzinfo is None:
-            end_time = UTC.localize(end_time)
-        
-        # Get current time in UTC
-        now_utc = datetime.now(UTC)
-        
-        # Convert to IST for logging
-        now_ist = now_utc.astimezone(IST)
-        start_ist = start_time.astimezone(IST)
-        end_ist = end_time.astimezone(IST)
-        
-        print(f"[Interview Status] Current: {now_ist.strftime('%Y-%m-%d %I:%M:%S %p IST')}")
-        print(f"[Interview Status] Start: {start_ist.strftime('%Y-%m-%d %I:%M:%S %p IST')}")
-        print(f"[Interview Status] End: {end_ist.strftime('%Y-%m-%d %I:%M:%S %p IST')}")
+    if status == "completed":
+        return {
+            "status": "completed",
+            "message": "Interview already completed"
+        }, 200
+    
+    if status == "started":
+        return {
+            "status": "already_started",
+            "message": "Interview already in progress"
+        }, 200
+
+    # Set by the lifecycle sweeper; no need to look at the clock
+    if status in ("expired", "abandoned"):
+        return {
+            "status": "expired",
+            "message": "Interview window has closed"
+        }, 200
+
+    # Start and end times are normalized to UTC by the status cache
+    start_time = interview["start_time"]
+    end_time = interview["end_time"]
+    
+    # Get current time in UTC
+    now_utc = datetime.now(UTC)
+    
+    # Check if interview is in waiting state
+    if now_utc < start_time:
+        time_remaining = int((start_time - now_utc).total_seconds())
+        return {
+            "status": "waiting",
+            "start_time": start_time.isoformat(),
+            "end_time": end_time.isoformat(),
+            "start_time_ist": interview["start_time_ist"],
+            "time_remaining": time_remaining
+        }, 200
+    
+    # Window closed since the last sweep
+    if now_utc > end_time:
+        return {
+            "status": "expired",
+            "message": "Interview window has closed"
+        }, 200
+    
+    # Interview is live, only now is the job description needed
+    return {
+        "status": "live",
+        "jobDescription": get_job_description(interview["interview_id"]),
+        "candidateName": interview["candidate_name"],
+        "candidateEmail": interview["candidate_email"],
+        "interviewId": interview["interview_id"]
+    }, 200
+
+
+@scheduler_bp.route('/wait', methods=['GET'])
+def wait_until_live():
+    """Return the status at once, telling a waiting client when to poll again
+
+    retry_after lands just after the start time (plus jitter, so a batch of
+    candidates doesn't arrive in the same instant), capped so a client still
+    rechecks every WAIT_MAX_RETRY_SECONDS. Nothing is held open, so a sync
+    worker is never tied up by a waiting candidate; under asgi.py the request
+    is held until the start instead (routes/scheduler_async.py).
+    """
+    try:
+        interview_id = request.args.get("id")
         
-        # Check if interview is in waiting state
-        if now_utc < start_time:
-            time_remaining = int((start_time - now_utc).total_seconds())
-            return jsonify({
-                "status": "waiting",
-                "start_time": start_time.isoformat(),
-                "end_time": end_time.isoformat(),
-                "start_time_ist": start_ist.strftime('%d %b %Y, %I:%M %p IST'),
-                "time_remaining": time_remaining
-            }), 200
+        if not interview_id:
+            return jsonify({"status": "invalid", "message": "Interview ID required"}), 400
         
-        # Check if interview window has expired
-        if now_utc > end_time:
-            return jsonify({
-                "status": "expired",
-                "message": "Interview window has closed"
-            }), 200
+        interview = status_cache.get_status_doc(interview_id)
         
-        # Interview is live
+        if not interview:
+            return jsonify({"status": "not_found", "message": "Interview not found"}), 404
+
+        payload, code = build_status_payload(interview)
+
+        if payload.get("status") == "waiting":
+            remaining = payload["time_remaining"]
+            if remaining > WAIT_MAX_RETRY_SECONDS:
+                retry_after = WAIT_MAX_RETRY_SECONDS
+            else:
+                retry_after = remaining + random.uniform(0, WAIT_JITTER_SECONDS)
+            payload["retry_after"] = round(retry_after, 3)
+
+        return jsonify(payload), code
+
+    except Exception as e:
+        logger.exception("Wait error: %s", e)
+        return jsonify({"error": str(e)}), 500
+
+
+@scheduler_bp.route('/interviews', methods=['GET'])
+def list_scheduled_interviews():
+    """Page through scheduled interviews, or stream them all as NDJSON"""
+    try:
+        filters, error = read_listing_filters()
+
+        if error:
+            return jsonify({"error": error}), 400
+
+        if request.args.get("format") == "ndjson":
+            def generate():
+                for document in iter_interviews(batch_size=LISTING_STREAM_BATCH_SIZE, **filters):
+                    yield json.dumps(serialize_listing_document(document)) + "\n"
+
+            return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+        try:
+            limit = min(max(int(request.args.get("limit", LISTING_PAGE_SIZE)), 1), LISTING_MAX_PAGE_SIZE)
+        except ValueError:
+            return jsonify({"error": "Invalid limit"}), 400
+
+        try:
+            after = decode_cursor(request.args["cursor"]) if request.args.get("cursor") else None
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        documents, next_cursor = list_interviews(after=after, limit=limit, **filters)
+
         return jsonify({
-            "status": "live",
-            "jobDescription": interview["job_description"],
-            "candidateName": interview["candidate_name"],
-            "candidateEmail": interview["candidate_email"],
-            "interviewId": interview["interview_id"]
+            "status": "success",
+            "count": len(documents),
+            "interviews": [serialize_listing_document(document) for document in documents],
+            "next_cursor": next_cursor
         }), 200
 
+    except Exception as e:
+        logger.exception("Interview listing error: %s", e)
+        return jsonify({"error": str(e)}), 500
+
+
+@scheduler_bp.route('/export', methods=['GET'])
+def export_results():
+    """Stream interview results joined with schedule data as CSV or NDJSON"""
+    try:
+        fmt = request.args.get("format", "csv")
+        if fmt not in ("csv", "ndjson"):
+            return jsonify({"error": "format must be csv or ndjson"}), 400
+
+        filters, error = read_listing_filters()
+        if error:
+            return jsonify({"error": error}), 400
+        filters.pop("fields")
+
+        use_gzip = request.args.get("gzip", "").lower() in ("1", "true", "yes")
+        include_qna = request.args.get("qna", "").lower() in ("1", "true", "yes")
+
+        chunks = export_stream(fmt, gzip=use_gzip, include_qna=include_qna, **filters)
+
+        filename = f"interview_results_{datetime.utcnow():%Y%m%d_%H%M%S}.{fmt}"
+        if use_gzip:
+            filename += ".gz"
+            mimetype = "application/gzip"
+        else:
+            mimetype = "text/csv" if fmt == "csv" else "application/x-ndjson"
+
+        return Response(stream_with_context(chunks), mimetype=mimetype, headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "X-Accel-Buffering": "no"
+        })
 
-    
     except Exception as e:
-        print(f"Status check error: {e}")
+        logger.exception("Export error: %s", e)
         return jsonify({"error": str(e)}), 500
 
 
+def read_listing_filters():
+    """Parse status, from, to and fields query parameters"""
+    statuses = [s.strip() for s in request.args.get("status", "").split(",") if s.strip()]
+
+    start_from = start_to = None
+    if request.args.get("from"):
+        start_from = parse_iso_datetime(request.args["from"])
+        if not start_from:
+            return None, "Invalid 'from' date"
+    if request.args.get("to"):
+        start_to = parse_iso_datetime(request.args["to"])
+        if not start_to:
+            return None, "Invalid 'to' date"
+
+    fields = [f.strip() for f in request.args.get("fields", "").split(",") if f.strip()]
+    unknown = [f for f in fields if f not in LISTING_FIELDS]
+    if unknown:
+        return None, f"Unknown fields: {', '.join(unknown)}"
+
+    return {
+        "statuses": statuses or None,
+        "start_from": start_from,
+        "start_to": start_to,
+        "fields": fields or None
+    }, None
+
+
+def serialize_listing_document(document):
+    """Make a listed document JSON-safe"""
+    item = {}
+    for key, value in document.items():
+        if key == "_id":
+            item["id"] = str(value)
+        elif isinstance(value, datetime):
+            item[key] = value.isoformat()
+        else:
+            item[key] = value
+    return item
+
+
 @scheduler_bp.route('/get-interview-data', methods=['GET'])
 def get_interview_data():
     """Get interview data"""
@@ -222,77 +511,17 @@ def get_interview_data():
         }), 200
     
     except Exception as e:
-        print(f"Get interview data error: {e}")
+        logger.exception("Get interview data error: %s", e)
         return jsonify({"error": str(e)}), 500
 
 
 def send_interview_email(candidate_name, candidate_email, interview_link, start_time_display, end_time_display):
-    """Send interview scheduling email"""
-    try:
-        msg = Message(
-            subject='🎯 Your Interview Schedule - Action Required',
-            recipients=[candidate_email],
-            html=f"""
-            <html>
-                <body style="font-family: Arial, sans-serif; background-color: #F5F5F5; padding: 20px;">
-                    <div style="max-width: 600px; margin: 0 auto; background-color: #FFFFFF; padding: 30px; border-radius: 16px; box-shadow: 0 4px 20px rgba(0,0,0,0.1);">
-                        <div style="background: linear-gradient(135deg, #F06767 0%, #E85555 100%); padding: 30px; border-radius: 12px; text-align: center; margin-bottom: 30px;">
-                            <h2 style="color: #FFFFFF; margin: 0; font-size: 28px; font-weight: 800;">🎯 Interview Invitation</h2>
-                            <p style="color: #FFFFFF; margin: 10px 0 0 0; opacity: 0.95; font-size: 14px;">AI-Powered Candidate Assessment</p>
-                        </div>
-                        
-                        <h3 style="color: #333333; font-size: 20px; margin-bottom: 15px;">Hello {candidate_name},</h3>
-                        
-                        <p style="color: #777777; font-size: 16px; line-height: 1.6; margin-bottom: 25px;">
-                            Your interview has been scheduled! Click the button below to join at the scheduled time.
-                        </p>
-                        
-                        <p style="text-align: center; margin: 30px 0;">
-                            <a href="{interview_link}" style="background: linear-gradient(135deg, #F06767 0%, #E85555 100%); color: #FFFFFF; padding: 14px 35px; text-decoration: none; border-radius: 12px; display: inline-block; font-weight: 700; font-size: 16px; box-shadow: 0 8px 20px rgba(240, 103, 103, 0.3);">
-                                🚀 Join Interview
-                            </a>
-                        </p>
-                        
-                        <hr style="border: none; border-top: 2px solid #CCCCCC; margin: 30px 0;">
-                        
-                        <div style="background-color: #FFE5E5; border-left: 4px solid #F06767; padding: 20px; border-radius: 8px; margin-bottom: 25px;">
-                            <h3 style="color: #333333; font-size: 18px; margin: 0 0 15px 0; font-weight: 700;">📅 Interview Details:</h3>
-                            <table style="width: 100%; color: #333333; font-size: 15px; line-height: 1.8;">
-                                <tr>
-                                    <td style="padding: 5px 0; color: #777777; font-weight: 600;">Start Time:</td>
-                                    <td style="padding: 5px 0; font-weight: 700; text-align: right;">{start_time_display}</td>
-                                </tr>
-                                <tr>
-                                    <td style="padding: 5px 0; color: #777777; font-weight: 600;">End Time:</td>
-                                    <td style="padding: 5px 0; font-weight: 700; text-align: right;">{end_time_display}</td>
-                                </tr>
-                            </table>
-                        </div>
-                        
-                        <div style="background-color: #FFF9E6; border-left: 4px solid #FFA726; padding: 20px; border-radius: 8px; margin-bottom: 25px;">
-                            <h4 style="color: #333333; margin: 0 0 12px 0; font-weight: 700; font-size: 16px;">⚠️ Important Tips:</h4>
-                            <ul style="color: #333333; margin: 0; padding-left: 20px; line-height: 1.8; font-size: 14px;">
-                                <li>Join 5 minutes early</li>
-                                <li>Ensure good lighting and clear audio</li>
-                                <li>Use a stable internet connection</li>
-                                <li>Please do not refresh the page during the interview</li>
-                            </ul>
-                        </div>
-                        
-                        <p style="color: #777777; font-size: 14px; text-align: center; margin-top: 30px; padding-top: 20px; border-top: 1px solid #CCCCCC;">
-                            See you soon! Good luck with your interview! 🚀
-                        </p>
-                        
-                        <p style="color: #999999; font-size: 12px; text-align: center; margin-top: 20px;">
-                            © 2026 Interview Scheduling Platform. All rights reserved.
-                        </p>
-                    </div>
-                </body>
-            </html>
-            """
-        )
-        mail.send(msg)
-        print(f"✅ Email sent to {candidate_email}")
-    except Exception as e:
-        print(f"❌ Email error: {e}")
-        raise
\ No newline at end of file
+    """Queue the interview scheduling email for background delivery"""
+    enqueue_email(*build_interview_email(candidate_name, candidate_email, interview_link, start_time_display, end_time_display))
+    logger.info("Email queued for %s", candidate_email)
+
+
+def build_interview_email(candidate_name, candidate_email, interview_link, start_time_display, end_time_display):
+    """Build the (recipient, subject, html) tuple for an interview invitation"""
+    html = render_interview_email(candidate_name, interview_link, start_time_display, end_time_display)
+    return candidate_email, INTERVIEW_EMAIL_SUBJECT, html
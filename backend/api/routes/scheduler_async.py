@@ -0,0 +1,74 @@
+import asyncio
+import logging
+import os
+import random
+import re
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from routes.scheduler import UTC, WAIT_JITTER_SECONDS, build_status_payload
+from services import status_cache
+
+logger = logging.getLogger(__name__)
+
+# Long-poll version of /api/scheduler/wait, served by asgi.py. A waiting
+# candidate's request is held on the event loop until the start time instead
+# of being sent back to poll, so it costs a sleeping coroutine, not a worker.
+
+# How long one request is held; stays under the usual 60s proxy read timeout
+WAIT_HOLD_SECONDS = float(os.getenv('WAIT_HOLD_SECONDS', 50))
+# A held request rechecks the status this often (cancelled or rescheduled)
+WAIT_RECHECK_SECONDS = float(os.getenv('WAIT_RECHECK_SECONDS', 10))
+
+
+async def wait_until_live(query):
+    """Hold a waiting client until its interview starts, then return the status
+
+    Every request wakes at its own point in the WAIT_JITTER_SECONDS after the
+    start time, so a batch of candidates doesn't hit generate-questions in the
+    same instant. After WAIT_HOLD_SECONDS the client gets "waiting" with
+    retry_after 0 and reconnects.
+    """
+    try:
+        interview_id = query.get("id")
+
+        if not interview_id:
+            return {"status": "invalid", "message": "Interview ID required"}, 400
+
+        deadline = time.monotonic() + WAIT_HOLD_SECONDS
+        jitter = random.uniform(0, WAIT_JITTER_SECONDS)
+
+        while True:
+            # The status cache uses the sync driver
+            interview = await asyncio.to_thread(status_cache.get_status_doc, interview_id)
+
+            if not interview:
+                return {"status": "not_found", "message": "Interview not found"}, 404
+
+            payload, code = await asyncio.to_thread(build_status_payload, interview)
+
+            if payload.get("status") != "waiting":
+                return payload, code
+
+            hold_left = deadline - time.monotonic()
+            if hold_left <= 0:
+                payload["retry_after"] = 0
+                return payload, code
+
+            until_start = (interview["start_time"] - datetime.now(UTC)).total_seconds() + jitter
+            await asyncio.sleep(max(0.05, min(until_start, hold_left, WAIT_RECHECK_SECONDS)))
+
+    except Exception as e:
+        logger.exception("Wait error: %s", e)
+        return {"error": str(e)}, 500
+
+
+# (method, path pattern, route rule, handler, request input)
+ASYNC_ROUTES = [
+    ("GET", re.compile(r"/api/scheduler/wait"), "/api/scheduler/wait", wait_until_live, "query"),
+]
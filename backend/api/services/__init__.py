@@ -1,6 +1,13 @@
 # backend/api/services/__init__.py
-# Import services for easier access
-from . import mongodb_service
-from . import drive_service
+# Service modules are imported on first access (services.metrics, or
+# `from services import metrics`), so importing one service doesn't pay
+# for all of them.
+import importlib
 
-__all__ = ['mongodb_service', 'drive_service']
\ No newline at end of file
+__all__ = ['mongodb_service', 'drive_service', 'upload_queue', 'session_store', 'question_cache', 'answer_scoring', 'email_outbox', 'status_cache', 'metrics', 'llm_client', 'question_pregen', 'results_export', 'analytics', 'lifecycle_sweeper', 'recording_chunks', 'recording_storage']
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
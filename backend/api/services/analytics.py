@@ -0,0 +1,364 @@
+import logging
+import sys
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pymongo import ASCENDING
+
+from services.question_cache import jd_hash as compute_jd_hash
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_COLLECTION = "score_summaries"
+SCORE_FIELDS = ("technical_score", "communication_score", "overall_score")
+RECOMMENDATIONS = ("Yes", "Maybe", "No")
+# Scores are clamped integers 0-10, so one histogram bucket per score
+SCORE_BUCKETS = range(0, 11)
+ALL_TIME = "all"
+
+_indexes_ready = False
+_indexes_lock = threading.Lock()
+
+
+def _create_summary_index(collection):
+    collection.create_index([("jd_hash", ASCENDING), ("date", ASCENDING)])
+
+
+def get_summary_collection():
+    """Return the summary collection, creating its index on first use"""
+    global _indexes_ready
+    from services.mongodb_service import get_collection
+
+    collection = get_collection(SUMMARY_COLLECTION)
+    if collection is not None and not _indexes_ready:
+        with _indexes_lock:
+            if not _indexes_ready:
+                try:
+                    _create_summary_index(collection)
+                except Exception as e:
+                    logger.error("Error creating score summary index: %s", e)
+                _indexes_ready = True
+    return collection
+
+
+def summary_id(jd_hash, day):
+    return f"{jd_hash}:{day}"
+
+
+def _bucket(score):
+    try:
+        return min(max(int(score), 0), 10)
+    except (TypeError, ValueError):
+        return None
+
+
+def evaluation_increments(evaluation, sign=1):
+    """$inc fields contributed by one evaluation (sign=-1 removes it)"""
+    increments = {"count": sign}
+
+    recommendation = evaluation.get("recommendation")
+    if recommendation in RECOMMENDATIONS:
+        increments[f"recommendations.{recommendation}"] = sign
+
+    for field in SCORE_FIELDS:
+        bucket = _bucket(evaluation.get(field))
+        if bucket is not None:
+            increments[f"sums.{field}"] = sign * bucket
+            increments[f"histograms.{field}.{bucket}"] = sign
+
+    return increments
+
+
+def change_increments(new_evaluation, old_evaluation=None):
+    """Net $inc for replacing old_evaluation (if any) with new_evaluation"""
+    increments = evaluation_increments(new_evaluation)
+    if old_evaluation:
+        for key, value in evaluation_increments(old_evaluation, sign=-1).items():
+            increments[key] = increments.get(key, 0) + value
+    return {key: value for key, value in increments.items() if value}
+
+
+def summary_updates(jd_hash, day, increments, jd_preview=None):
+    """(filter, update) pairs for the per-day and all-time summary documents"""
+    updates = []
+    for date in (day, ALL_TIME):
+        update = {
+            "$inc": increments,
+            "$set": {"updated_at": datetime.utcnow()},
+            "$setOnInsert": {"jd_hash": jd_hash, "date": date}
+        }
+        if jd_preview and date == ALL_TIME:
+            update["$setOnInsert"]["jd_preview"] = jd_preview
+        updates.append(({"_id": summary_id(jd_hash, date)}, update))
+    return updates
+
+
+def _schedule_key(schedule):
+    """jd_hash and a short preview from a scheduled_interviews document"""
+    job_description = (schedule or {}).get("job_description") or ""
+    jd_hash = (schedule or {}).get("jd_hash") or compute_jd_hash(job_description)
+    return jd_hash, " ".join(job_description.split())[:120]
+
+
+def record_evaluation(interview_id, evaluation, previous=None):
+    """Fold a saved evaluation into the summaries
+
+    previous is the result document before the save (None when the result
+    was just inserted); a re-evaluation moves the counters from the old
+    scores to the new ones instead of counting the interview twice.
+    """
+    try:
+        from services.mongodb_service import scheduled_interviews
+
+        summaries = get_summary_collection()
+        if summaries is None or scheduled_interviews is None or not evaluation:
+            return
+
+        increments = change_increments(evaluation, (previous or {}).get("evaluation"))
+        if not increments:
+            return
+
+        schedule = scheduled_interviews.find_one(
+            {"interview_id": interview_id},
+            {"jd_hash": 1, "job_description": 1}
+        )
+        jd_hash, preview = _schedule_key(schedule)
+        day = ((previous or {}).get("created_at") or datetime.utcnow()).strftime("%Y-%m-%d")
+
+        for query, update in summary_updates(jd_hash, day, increments, preview):
+            summaries.update_one(query, update, upsert=True)
+
+    except Exception as e:
+        logger.error("Error updating score analytics: %s", e, extra={"interview_id": interview_id})
+
+
+async def record_evaluation_async(interview_id, evaluation, previous=None):
+    """record_evaluation() through the async driver"""
+    try:
+        from services.mongodb_service import get_async_collection
+
+        summaries = get_async_collection(SUMMARY_COLLECTION)
+        scheduled = get_async_collection("scheduled_interviews")
+        if summaries is None or scheduled is None or not evaluation:
+            return
+
+        increments = change_increments(evaluation, (previous or {}).get("evaluation"))
+        if not increments:
+            return
+
+        schedule = await scheduled.find_one(
+            {"interview_id": interview_id},
+            {"jd_hash": 1, "job_description": 1}
+        )
+        jd_hash, preview = _schedule_key(schedule)
+        day = ((previous or {}).get("created_at") or datetime.utcnow()).strftime("%Y-%m-%d")
+
+        for query, update in summary_updates(jd_hash, day, increments, preview):
+            await summaries.update_one(query, update, upsert=True)
+
+    except Exception as e:
+        logger.error("Error updating score analytics: %s", e, extra={"interview_id": interview_id})
+
+
+def format_summary(jd_hash, documents):
+    """Combine summary documents into the API response shape"""
+    count = 0
+    recommendations = {name: 0 for name in RECOMMENDATIONS}
+    sums = {field: 0 for field in SCORE_FIELDS}
+    histograms = {field: [0] * len(SCORE_BUCKETS) for field in SCORE_FIELDS}
+    jd_preview = None
+
+    for document in documents:
+        count += document.get("count", 0)
+        jd_preview = jd_preview or document.get("jd_preview")
+        for name in RECOMMENDATIONS:
+            recommendations[name] += document.get("recommendations", {}).get(name, 0)
+        for field in SCORE_FIELDS:
+            sums[field] += document.get("sums", {}).get(field, 0)
+            for bucket, value in document.get("histograms", {}).get(field, {}).items():
+                histograms[field][int(bucket)] += value
+
+    return {
+        "jd_hash": jd_hash,
+        "jd_preview": jd_preview,
+        "count": count,
+        "recommendations": recommendations,
+        "scores": {
+            field: {
+                "mean": round(sums[field] / count, 2) if count else None,
+                "histogram": histograms[field]
+            }
+            for field in SCORE_FIELDS
+        }
+    }
+
+
+def get_summary(jd_hash, start_day=None, end_day=None):
+    """All-time summary for a JD (one document read), or summed over a date range"""
+    summaries = get_summary_collection()
+    if summaries is None:
+        return None
+
+    if not start_day and not end_day:
+        document = summaries.find_one({"_id": summary_id(jd_hash, ALL_TIME)})
+        return format_summary(jd_hash, [document] if document else [])
+
+    date_range = {"$ne": ALL_TIME}
+    if start_day:
+        date_range["$gte"] = start_day
+    if end_day:
+        date_range["$lte"] = end_day
+
+    documents = list(summaries.find({"jd_hash": jd_hash, "date": date_range}))
+    summary = format_summary(jd_hash, documents)
+    summary["from"], summary["to"] = start_day, end_day
+    return summary
+
+
+def list_roles(limit=100):
+    """All-time summaries, most interviewed job descriptions first"""
+    summaries = get_summary_collection()
+    if summaries is None:
+        return []
+
+    documents = summaries.find({"date": ALL_TIME}).sort("count", -1).limit(limit)
+    return [format_summary(document["jd_hash"], [document]) for document in documents]
+
+
+def backfill_jd_hashes(batch_size=500):
+    """Store jd_hash on scheduled interviews created before it was recorded"""
+    from pymongo import UpdateOne
+    from services.mongodb_service import scheduled_interviews
+
+    if scheduled_interviews is None:
+        return 0
+
+    updated = 0
+    batch = []
+    cursor = scheduled_interviews.find(
+        {"jd_hash": {"$exists": False}},
+        {"job_description": 1}
+    ).batch_size(batch_size)
+
+    for document in cursor:
+        batch.append(UpdateOne(
+            {"_id": document["_id"]},
+            {"$set": {"jd_hash": compute_jd_hash(document.get("job_description") or "")}}
+        ))
+        if len(batch) >= batch_size:
+            updated += scheduled_interviews.bulk_write(batch, ordered=False).modified_count
+            batch = []
+
+    if batch:
+        updated += scheduled_interviews.bulk_write(batch, ordered=False).modified_count
+    return updated
+
+
+def build_rebuild_pipeline():
+    """Aggregate interview_results into one document per (jd_hash, day)"""
+    group = {
+        "_id": {"jd_hash": "$schedule.jd_hash", "date": "$day"},
+        "count": {"$sum": 1},
+        "jd_preview": {"$first": "$schedule.job_description"}
+    }
+    for name in RECOMMENDATIONS:
+        group[f"rec_{name}"] = {"$sum": {"$cond": [{"$eq": ["$evaluation.recommendation", name]}, 1, 0]}}
+    for field in SCORE_FIELDS:
+        group[f"sum_{field}"] = {"$sum": f"$score.{field}"}
+        for bucket in SCORE_BUCKETS:
+            group[f"hist_{field}_{bucket}"] = {
+                "$sum": {"$cond": [{"$eq": [f"$score.{field}", bucket]}, 1, 0]}
+            }
+
+    return [
+        {"$match": {"evaluation": {"$ne": None}}},
+        {"$lookup": {
+            "from": "scheduled_interviews",
+            "localField": "interview_id",
+            "foreignField": "interview_id",
+            "as": "schedule"
+        }},
+        # Results without a schedule are kept; record_evaluation() counts them under jd_hash("")
+        {"$unwind": {"path": "$schedule", "preserveNullAndEmptyArrays": True}},
+        {"$project": {
+            "schedule.jd_hash": 1,
+            "schedule.job_description": 1,
+            "evaluation.recommendation": 1,
+            "day": {"$dateToString": {"format": "%Y-%m-%d", "date": {"$ifNull": ["$created_at", "$$NOW"]}}},
+            # Same clamping as _bucket()
+            "score": {
+                field: {"$min": [10, {"$max": [0, {"$toInt": {"$ifNull": [f"$evaluation.{field}", 0]}}]}]}
+                for field in SCORE_FIELDS
+            }
+        }},
+        {"$group": group}
+    ]
+
+
+def rebuild_summaries():
+    """Recompute every summary from interview_results; returns the number of documents
+
+    The summaries are written to a scratch collection that then replaces
+    score_summaries in one rename, so readers never see a partial set and a
+    failed rebuild leaves the old summaries in place.
+    """
+    from services.mongodb_service import interview_results
+
+    summaries = get_summary_collection()
+    if summaries is None or interview_results is None:
+        return 0
+
+    documents = {}
+    for row in interview_results.aggregate(build_rebuild_pipeline(), allowDiskUse=True):
+        jd_hash = row["_id"].get("jd_hash") or compute_jd_hash("")
+        day = row["_id"]["date"]
+        preview = " ".join((row.get("jd_preview") or "").split())[:120]
+
+        increments = {"count": row["count"]}
+        for name in RECOMMENDATIONS:
+            increments[f"recommendations.{name}"] = row[f"rec_{name}"]
+        for field in SCORE_FIELDS:
+            increments[f"sums.{field}"] = row[f"sum_{field}"]
+            for bucket in SCORE_BUCKETS:
+                if row[f"hist_{field}_{bucket}"]:
+                    increments[f"histograms.{field}.{bucket}"] = row[f"hist_{field}_{bucket}"]
+
+        for date in (day, ALL_TIME):
+            document = documents.setdefault(summary_id(jd_hash, date), {
+                "_id": summary_id(jd_hash, date),
+                "jd_hash": jd_hash,
+                "date": date,
+                "updated_at": datetime.utcnow()
+            })
+            if date == ALL_TIME and preview:
+                document.setdefault("jd_preview", preview)
+            for path, value in increments.items():
+                _add_path(document, path, value)
+
+    if not documents:
+        summaries.delete_many({})
+        return 0
+
+    scratch = summaries.database[f"{SUMMARY_COLLECTION}_rebuild_{uuid.uuid4().hex[:8]}"]
+    try:
+        scratch.insert_many(list(documents.values()), ordered=False)
+        _create_summary_index(scratch)
+        scratch.rename(SUMMARY_COLLECTION, dropTarget=True)
+    except Exception:
+        scratch.drop()
+        raise
+    return len(documents)
+
+
+def _add_path(document, path, value):
+    """Add value at a dotted path, creating nested dicts as needed"""
+    *parents, leaf = path.split(".")
+    target = document
+    for key in parents:
+        target = target.setdefault(key, {})
+    target[leaf] = target.get(leaf, 0) + value
@@ -0,0 +1,124 @@
+import asyncio
+import logging
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+logger = logging.getLogger(__name__)
+
+SCORING_WORKERS = int(os.getenv('SCORING_WORKERS', 4))
+# How long /evaluate waits for scores still being computed in the background
+SCORING_WAIT_SECONDS = float(os.getenv('SCORING_WAIT_SECONDS', 20))
+
+_executor = None
+_executor_lock = threading.Lock()
+
+# interview_id -> {answer index: Future} for scoring tasks started in this process
+_pending = {}
+_pending_lock = threading.Lock()
+
+
+def _get_executor():
+    """Return the scoring worker pool, creating it on first use"""
+    global _executor
+
+    if _executor is not None:
+        return _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=SCORING_WORKERS,
+                thread_name_prefix="answer-scoring"
+            )
+    return _executor
+
+
+def _score_and_store(store, interview_id, index, qa, score_fn):
+    score = score_fn(qa)
+    store.set_answer_score(interview_id, index, score)
+    return score
+
+
+def submit_answer_scoring(store, interview_id, index, qa, score_fn):
+    """Score one answer in the background and store the result on the session"""
+    future = _get_executor().submit(_score_and_store, store, interview_id, index, qa, score_fn)
+
+    with _pending_lock:
+        _pending.setdefault(interview_id, {})[index] = future
+
+    def _log_failure(done):
+        if done.exception():
+            logger.error("Scoring failed for answer %d: %s", index, done.exception(),
+                         extra={"interview_id": interview_id})
+
+    future.add_done_callback(_log_failure)
+    return future
+
+
+def collect_scores(store, interview_id, score_fn, timeout=SCORING_WAIT_SECONDS):
+    """Return the session's Q&A list with every answer scored, or None if there is no session"""
+    with _pending_lock:
+        futures = _pending.pop(interview_id, {})
+
+    if futures:
+        wait(futures.values(), timeout=timeout)
+
+    session = store.get(interview_id)
+    if session is None:
+        return None
+
+    # Answers submitted to another worker, or whose task failed, are scored now
+    qna = session["qna"]
+    missing = [index for index, qa in enumerate(qna) if not qa.get("score")]
+
+    if missing:
+        retries = {
+            index: _get_executor().submit(
+                _score_and_store, store, interview_id, index, qna[index], score_fn
+            )
+            for index in missing
+        }
+        for index, future in retries.items():
+            qna[index] = dict(qna[index], score=future.result())
+
+    return qna
+
+
+async def collect_scores_async(store, interview_id, score_fn, timeout=SCORING_WAIT_SECONDS):
+    """collect_scores() for the async handlers: waits without holding a thread"""
+    with _pending_lock:
+        futures = _pending.pop(interview_id, {})
+
+    if futures:
+        await asyncio.wait([asyncio.wrap_future(f) for f in futures.values()], timeout=timeout)
+
+    session = await asyncio.to_thread(store.get, interview_id)
+    if session is None:
+        return None
+
+    qna = session["qna"]
+    missing = [index for index, qa in enumerate(qna) if not qa.get("score")]
+
+    if missing:
+        retries = [
+            asyncio.wrap_future(_get_executor().submit(
+                _score_and_store, store, interview_id, index, qna[index], score_fn
+            ))
+            for index in missing
+        ]
+        for index, score in zip(missing, await asyncio.gather(*retries)):
+            qna[index] = dict(qna[index], score=score)
+
+    return qna
+
+
+def discard_pending(interview_id):
+    """Forget background scoring tasks for an interview"""
+    with _pending_lock:
+        _pending.pop(interview_id, None)
@@ -1,119 +1,288 @@
+import logging
 import os
 import io
+import threading
+import time
 from pathlib import Path
+from types import SimpleNamespace
 
-GOOGLE_LIBS_AVAILABLE = True
+from services import metrics
 
-try:
-    from googleapiclient.discovery import build
-    from googleapiclient.http import MediaIoBaseUpload
-    from google.oauth2 import service_account
-except ImportError as e:
-    print(f"Google libraries not available: {e}")
-    print("Video will not be uploaded to Google Drive")
-    GOOGLE_LIBS_AVAILABLE = False
+logger = logging.getLogger(__name__)
+
+# The Google client libraries are slow to import, so they are loaded on the
+# first Drive call instead of on every cold start (False once they failed)
+_google = None
+_google_lock = threading.Lock()
+
+
+def _google_libs():
+    """Import the Google client libraries on first use; None if not installed"""
+    global _google
+
+    if _google is None:
+        with _google_lock:
+            if _google is None:
+                try:
+                    from googleapiclient.discovery import build
+                    from googleapiclient.http import MediaIoBaseUpload, MediaFileUpload
+                    from googleapiclient.errors import HttpError
+                    from google.oauth2 import service_account
+                    from google.auth.exceptions import RefreshError
+                    import google_auth_httplib2
+                    import httplib2
+
+                    _google = SimpleNamespace(
+                        build=build,
+                        MediaIoBaseUpload=MediaIoBaseUpload,
+                        MediaFileUpload=MediaFileUpload,
+                        HttpError=HttpError,
+                        service_account=service_account,
+                        RefreshError=RefreshError,
+                        google_auth_httplib2=google_auth_httplib2,
+                        httplib2=httplib2
+                    )
+                except ImportError as e:
+                    logger.warning("Google libraries not available: %s", e)
+                    logger.warning("Video will not be uploaded to Google Drive")
+                    _google = False
+
+    return _google or None
+
+
+def google_libs_available():
+    return _google_libs() is not None
 
 
 SCOPES = ['https://www.googleapis.com/auth/drive.file']
 
+# Resumable upload chunk size (Drive requires a multiple of 256 KB)
+UPLOAD_CHUNK_SIZE = int(os.getenv('DRIVE_UPLOAD_CHUNK_MB', 8)) * 1024 * 1024
+
+
+# Process-wide Drive client, built lazily and shared by all threads
+_client_lock = threading.Lock()
+_drive_service = None
+_credentials = None
+_client_generation = 0
+
+# httplib2.Http is not thread-safe, so each thread gets its own transport
+_thread_state = threading.local()
+
+
+def _load_credentials():
+    """Load service account credentials from oauth_credentials.json"""
+    BASE_DIR = Path(__file__).resolve().parent.parent
+    creds_file = BASE_DIR / "oauth_credentials.json"
+
+    if not creds_file.exists():
+        logger.error("Service account file not found: %s", creds_file)
+        return None
+
+    return _google_libs().service_account.Credentials.from_service_account_file(
+        str(creds_file),
+        scopes=SCOPES
+    )
+
+
+def build_drive_service():
+    """Build a new Google Drive service using Service Account (uncached)"""
+    credentials = _load_credentials()
+    if credentials is None:
+        return None, None
+
+    service = _google_libs().build('drive', 'v3', credentials=credentials, cache_discovery=False)
+    return service, credentials
+
 
 def get_drive_service():
-    """Initialize Google Drive service using Service Account"""
-    if not GOOGLE_LIBS_AVAILABLE:
-        print("Google libraries not available")
+    """Return the shared Google Drive service, building it on first use"""
+    global _drive_service, _credentials
+
+    if not google_libs_available():
+        logger.warning("Google libraries not available")
         return None
 
+    if _drive_service is not None:
+        return _drive_service
+
     try:
-        BASE_DIR = Path(__file__).resolve().parent.parent
-        creds_file = BASE_DIR / "oauth_credentials.json"
+        with _client_lock:
+            if _drive_service is None:
+                service, credentials = build_drive_service()
+                if service is None:
+                    return None
+                _credentials = credentials
+                _drive_service = service
+                logger.info("Google Drive service initialized (Service Account)")
+        return _drive_service
+
+    except Exception as e:
+        logger.error("Error initializing Google Drive: %s", e)
+        return None
 
-        if not creds_file.exists():
-            print(f"❌ Service account file not found: {creds_file}")
-            return None
 
-        credentials = service_account.Credentials.from_service_account_file(
-            str(creds_file),
-            scopes=SCOPES
+def get_thread_http():
+    """Return this thread's authorized HTTP transport for the shared client"""
+    with _client_lock:
+        credentials, generation = _credentials, _client_generation
+
+    if credentials is None:
+        # Another thread invalidated the client since this one fetched it
+        get_drive_service()
+        with _client_lock:
+            credentials, generation = _credentials, _client_generation
+        if credentials is None:
+            raise RuntimeError("Google Drive credentials not available")
+
+    if getattr(_thread_state, 'generation', None) != generation:
+        google = _google_libs()
+        # AuthorizedHttp refreshes the access token automatically when it expires
+        _thread_state.http = google.google_auth_httplib2.AuthorizedHttp(
+            credentials,
+            http=google.httplib2.Http()
         )
+        _thread_state.generation = generation
+    return _thread_state.http
 
-        service = build('drive', 'v3', credentials=credentials)
-        print("✅ Google Drive service initialized (Service Account)")
-        return service
 
-    except Exception as e:
-        print(f"❌ Error initializing Google Drive: {e}")
-        return None
+def invalidate_drive_service():
+    """Drop the cached client so the next call rebuilds it with fresh credentials"""
+    global _drive_service, _credentials, _client_generation
+
+    with _client_lock:
+        _drive_service = None
+        _credentials = None
+        _client_generation += 1
+    logger.warning("Google Drive service invalidated")
+
+
+def _is_auth_error(error):
+    """Check whether an error means the cached credentials are no longer valid"""
+    google = _google_libs()
+    if isinstance(error, google.RefreshError):
+        return True
+    return isinstance(error, google.HttpError) and error.resp.status in (401, 403)
 
 
 def upload_to_drive(file_content, filename, folder_id=None):
-    """Upload file to Google Drive"""
-    if not GOOGLE_LIBS_AVAILABLE:
-        print("❌ Google libraries not available for upload")
+    """Upload in-memory file content to Google Drive"""
+    google = _google_libs()
+    if google is None:
+        logger.error("Google libraries not available for upload")
         return None
 
-    try:
-        service = get_drive_service()
-        if not service:
-            print("❌ Google Drive service not available")
-            return None
+    media = google.MediaIoBaseUpload(
+        io.BytesIO(file_content),
+        mimetype='video/webm',
+        chunksize=UPLOAD_CHUNK_SIZE,
+        resumable=True
+    )
+    return _upload_media(media, filename, folder_id)
 
-        final_folder_id = folder_id or os.getenv('GOOGLE_DRIVE_FOLDER_ID')
 
-        file_metadata = {'name': filename}
+def upload_file_to_drive(file_path, filename, folder_id=None, mimetype='video/webm'):
+    """Upload a file from disk to Google Drive one chunk at a time"""
+    google = _google_libs()
+    if google is None:
+        logger.error("Google libraries not available for upload")
+        return None
 
-        if final_folder_id:
-            file_metadata['parents'] = [final_folder_id]
+    media = google.MediaFileUpload(
+        str(file_path),
+        mimetype=mimetype,
+        chunksize=UPLOAD_CHUNK_SIZE,
+        resumable=True
+    )
+    return _upload_media(media, filename, folder_id)
 
-        media = MediaIoBaseUpload(
-            io.BytesIO(file_content),
-            mimetype='video/webm',
-            resumable=True
-        )
 
-        file = service.files().create(
-        body=file_metadata,
-        media_body=media,
-        fields='id, webViewLink',
-        supportsAllDrives=True
-    ).execute()
-        print(f"✅ File uploaded to Google Drive: {file.get('id')}")
+def _upload_media(media, filename, folder_id=None):
+    """Run a resumable upload, sending at most UPLOAD_CHUNK_SIZE bytes per request"""
+    final_folder_id = folder_id or os.getenv('GOOGLE_DRIVE_FOLDER_ID')
 
-        return {
-            'id': file.get('id'),
-            'webViewLink': file.get('webViewLink')
-        }
+    file_metadata = {'name': filename}
 
-    except Exception as e:
-        print(f"❌ Error uploading to Google Drive: {e}")
-        return None
+    if final_folder_id:
+        file_metadata['parents'] = [final_folder_id]
+
+    # One retry with a rebuilt client if the cached credentials were rejected
+    for attempt in range(2):
+        try:
+            service = get_drive_service()
+            if not service:
+                logger.error("Google Drive service not available")
+                return None
+
+            upload_request = service.files().create(
+                body=file_metadata,
+                media_body=media,
+                fields='id, webViewLink',
+                supportsAllDrives=True
+            )
+
+            # next_chunk() reads one chunk from the media source per call,
+            # so memory use stays flat regardless of the file size
+            http = get_thread_http()
+            started = time.perf_counter()
+            file = None
+            while file is None:
+                _, file = upload_request.next_chunk(http=http)
+
+            elapsed = time.perf_counter() - started
+            size = media.size() or 0
+            metrics.observe("drive_upload_duration_seconds", elapsed)
+            metrics.inc("drive_upload_bytes_total", size)
+            metrics.inc("drive_uploads_total", outcome="succeeded")
+            if elapsed > 0:
+                metrics.set_gauge("drive_upload_throughput_bytes_per_second", round(size / elapsed, 1))
+
+            logger.info("File uploaded to Google Drive: %s", file.get('id'), extra={"drive_filename": filename})
+
+            return {
+                'id': file.get('id'),
+                'webViewLink': file.get('webViewLink')
+            }
+
+        except Exception as e:
+            if attempt == 0 and _is_auth_error(e):
+                invalidate_drive_service()
+                continue
+            metrics.inc("drive_uploads_total", outcome="failed")
+            logger.error("Error uploading to Google Drive: %s", e, extra={"drive_filename": filename})
+            return None
 
 
 def create_drive_folder(folder_name, parent_folder_id=None):
     """Create a folder in Google Drive"""
-    if not GOOGLE_LIBS_AVAILABLE:
+    if not google_libs_available():
         return None
 
-    try:
-        service = get_drive_service()
-        if not service:
-            return None
+    file_metadata = {
+        'name': folder_name,
+        'mimeType': 'application/vnd.google-apps.folder'
+    }
 
-        file_metadata = {
-            'name': folder_name,
-            'mimeType': 'application/vnd.google-apps.folder'
-        }
+    if parent_folder_id:
+        file_metadata['parents'] = [parent_folder_id]
 
-        if parent_folder_id:
-            file_metadata['parents'] = [parent_folder_id]
+    for attempt in range(2):
+        try:
+            service = get_drive_service()
+            if not service:
+                return None
 
-        folder = service.files().create(
-            body=file_metadata,
-            fields='id'
-        ).execute()
+            folder = service.files().create(
+                body=file_metadata,
+                fields='id'
+            ).execute(http=get_thread_http())
 
-        print(f"✅ Folder created: {folder.get('id')}")
-        return folder.get('id')
+            logger.info("Folder created: %s", folder.get('id'))
+            return folder.get('id')
 
-    except Exception as e:
-        print(f"❌ Error creating folder: {e}")
-        return None
\ No newline at end of file
+        except Exception as e:
+            if attempt == 0 and _is_auth_error(e):
+                invalidate_drive_service()
+                continue
+            logger.error("Error creating folder: %s", e)
+            return None
@@ -0,0 +1,281 @@
+import logging
+import os
+import sys
+import random
+import threading
+import uuid
+from collections import deque
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pymongo import ASCENDING
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_SENDER_ENABLED = os.getenv('EMAIL_OUTBOX_SENDER', 'true').lower() != 'false'
+OUTBOX_BATCH_SIZE = int(os.getenv('EMAIL_OUTBOX_BATCH_SIZE', 50))
+OUTBOX_POLL_SECONDS = float(os.getenv('EMAIL_OUTBOX_POLL_SECONDS', 10))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv('EMAIL_OUTBOX_MAX_ATTEMPTS', 5))
+OUTBOX_RETRY_BASE_SECONDS = float(os.getenv('EMAIL_OUTBOX_RETRY_BASE_SECONDS', 30))
+# Messages stuck in "sending" this long (e.g. a worker died) are picked up again
+OUTBOX_CLAIM_TIMEOUT_SECONDS = int(os.getenv('EMAIL_OUTBOX_CLAIM_TIMEOUT_SECONDS', 600))
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+_templates = {}
+_templates_lock = threading.Lock()
+
+_app = None
+_mail_lock = threading.Lock()
+_wakeup = threading.Event()
+_sender_thread = None
+_sender_lock = threading.Lock()
+
+# Used when MongoDB is not connected (not durable across restarts)
+_memory_outbox = deque()
+
+
+def get_template(name):
+    """Return a compiled Jinja template, compiling it on first use"""
+    template = _templates.get(name)
+    if template is not None:
+        return template
+
+    with _templates_lock:
+        if name not in _templates:
+            from jinja2 import Environment, FileSystemLoader, select_autoescape
+            env = Environment(
+                loader=FileSystemLoader(str(TEMPLATES_DIR)),
+                autoescape=select_autoescape(['html'])
+            )
+            _templates[name] = env.get_template(name)
+    return _templates[name]
+
+
+def render_interview_email(candidate_name, interview_link, start_time_display, end_time_display):
+    """Render the interview invitation email body"""
+    return get_template("interview_email.html").render(
+        candidate_name=candidate_name,
+        interview_link=interview_link,
+        start_time_display=start_time_display,
+        end_time_display=end_time_display
+    )
+
+
+def _get_outbox():
+    from services.mongodb_service import get_collection
+    return get_collection("email_outbox")
+
+
+def _build_entry(recipient, subject, html):
+    now = datetime.utcnow()
+    return {
+        "to": recipient,
+        "subject": subject,
+        "html": html,
+        "status": "pending",  # pending | sending | sent | failed
+        "attempts": 0,
+        "next_attempt_at": now,
+        "claimed_at": None,
+        "last_error": None,
+        "created_at": now,
+        "sent_at": None
+    }
+
+
+def enqueue_emails(emails):
+    """Queue (recipient, subject, html) tuples for background delivery"""
+    entries = [_build_entry(*email) for email in emails]
+    if not entries:
+        return 0
+
+    outbox = _get_outbox()
+    if outbox is None:
+        logger.warning("MongoDB not connected, emails queued in memory only")
+        _memory_outbox.extend(entries)
+    else:
+        outbox.insert_many(entries, ordered=False)
+
+    _wakeup.set()
+    return len(entries)
+
+
+def enqueue_email(recipient, subject, html):
+    """Queue one email for background delivery"""
+    return enqueue_emails([(recipient, subject, html)])
+
+
+def _claim_batch(outbox, limit):
+    """Mark up to `limit` due messages as sending and return them
+
+    Three round trips whatever the batch size: pick candidate ids, claim
+    them with one update_many under a fresh claim token, then read back
+    what this token won. The update re-checks the due filter, so a message
+    another sender claimed in between is left to that sender.
+    """
+    now = datetime.utcnow()
+    stale = now - timedelta(seconds=OUTBOX_CLAIM_TIMEOUT_SECONDS)
+    due = {
+        "$or": [
+            {"status": "pending", "next_attempt_at": {"$lte": now}},
+            {"status": "sending", "claimed_at": {"$lt": stale}}
+        ]
+    }
+
+    candidates = [
+        entry["_id"] for entry in
+        outbox.find(due, {"_id": 1}).sort("next_attempt_at", ASCENDING).limit(limit)
+    ]
+    if not candidates:
+        return []
+
+    token = uuid.uuid4().hex
+    outbox.update_many(
+        {"$and": [{"_id": {"$in": candidates}}, due]},
+        {"$set": {"status": "sending", "claimed_at": now, "claim_token": token}}
+    )
+    return list(outbox.find({"claim_token": token}).sort("next_attempt_at", ASCENDING))
+
+
+def _retry_update(entry, error):
+    """Build the update for a failed delivery attempt"""
+    attempts = entry.get("attempts", 0) + 1
+    if attempts >= OUTBOX_MAX_ATTEMPTS:
+        return {"status": "failed", "attempts": attempts, "last_error": error}
+
+    delay = OUTBOX_RETRY_BASE_SECONDS * (2 ** (attempts - 1))
+    delay += random.uniform(0, delay / 2)
+    return {
+        "status": "pending",
+        "attempts": attempts,
+        "last_error": error,
+        "next_attempt_at": datetime.utcnow() + timedelta(seconds=delay)
+    }
+
+
+def get_mail(app):
+    """Return the Flask-Mail state, registering the extension on first use"""
+    if 'mail' not in app.extensions:
+        with _mail_lock:
+            if 'mail' not in app.extensions:
+                from flask_mail import Mail
+                Mail(app)
+    return app.extensions['mail']
+
+
+def _deliver(app, entries):
+    """Send entries over one SMTP connection; returns {index: error or None}"""
+    from flask_mail import Message
+
+    outcomes = {}
+    with app.app_context():
+        mail_state = get_mail(app)
+        try:
+            with mail_state.connect() as connection:
+                for index, entry in enumerate(entries):
+                    try:
+                        connection.send(Message(
+                            subject=entry["subject"],
+                            recipients=[entry["to"]],
+                            html=entry["html"]
+                        ))
+                        outcomes[index] = None
+                    except Exception as e:
+                        outcomes[index] = str(e)
+        except Exception as e:
+            logger.error("SMTP connection error: %s", e)
+            for index in range(len(entries)):
+                outcomes.setdefault(index, str(e))
+
+    return outcomes
+
+
+def process_outbox_once(app, limit=OUTBOX_BATCH_SIZE):
+    """Deliver one batch of due messages; returns the number sent"""
+    outbox = _get_outbox()
+
+    if outbox is None:
+        # Same rule as the $lte filter in _claim_batch: entries backing off
+        # after a failure go back to the queue until they are due
+        now = datetime.utcnow()
+        entries = []
+        waiting = []
+        while _memory_outbox and len(entries) < limit:
+            entry = _memory_outbox.popleft()
+            if entry["next_attempt_at"] <= now:
+                entries.append(entry)
+            else:
+                waiting.append(entry)
+        _memory_outbox.extendleft(reversed(waiting))
+    else:
+        entries = _claim_batch(outbox, limit)
+
+    if not entries:
+        return 0
+
+    outcomes = _deliver(app, entries)
+    sent = 0
+
+    for index, entry in enumerate(entries):
+        error = outcomes.get(index)
+
+        if error is None:
+            sent += 1
+            update = {"status": "sent", "sent_at": datetime.utcnow()}
+        else:
+            logger.error("Email error for %s: %s", entry['to'], error)
+            update = _retry_update(entry, error)
+
+        if outbox is None:
+            if update["status"] == "pending":
+                entry.update(update)
+                _memory_outbox.append(entry)
+        else:
+            outbox.update_one({"_id": entry["_id"]}, {"$set": update})
+
+    logger.info("Email outbox: %d of %d sent", sent, len(entries))
+    return sent
+
+
+def _ensure_outbox_index():
+    outbox = _get_outbox()
+    if outbox is not None:
+        try:
+            outbox.create_index([("status", ASCENDING), ("next_attempt_at", ASCENDING)])
+            outbox.create_index("claim_token", sparse=True)
+        except Exception as e:
+            logger.error("Error creating email outbox index: %s", e)
+
+
+def _run_sender():
+    # Created here rather than in init_app so importing the app stays off the network
+    _ensure_outbox_index()
+
+    while True:
+        try:
+            # Keep draining while full batches come back
+            while process_outbox_once(_app) >= OUTBOX_BATCH_SIZE:
+                pass
+        except Exception as e:
+            logger.exception("Email outbox error: %s", e)
+
+        _wakeup.wait(OUTBOX_POLL_SECONDS)
+        _wakeup.clear()
+
+
+def init_app(app):
+    """Bind the outbox to the Flask app and start the background sender"""
+    global _app, _sender_thread
+
+    _app = app
+
+    if not OUTBOX_SENDER_ENABLED:
+        return
+
+    with _sender_lock:
+        if _sender_thread is None:
+            _sender_thread = threading.Thread(target=_run_sender, name="email-outbox", daemon=True)
+            _sender_thread.start()
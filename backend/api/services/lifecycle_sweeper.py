@@ -0,0 +1,129 @@
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services import status_cache
+from services.metrics import observe, inc
+
+logger = logging.getLogger(__name__)
+
+SWEEPER_ENABLED = os.getenv('LIFECYCLE_SWEEPER', 'true').lower() != 'false'
+SWEEP_INTERVAL_SECONDS = float(os.getenv('SWEEP_INTERVAL_SECONDS', 60))
+SWEEP_BATCH_SIZE = int(os.getenv('SWEEP_BATCH_SIZE', 500))
+# A started interview is abandoned once its window closed this long ago;
+# the grace leaves time for a late evaluation or video upload to finish
+ABANDONED_GRACE_SECONDS = int(os.getenv('ABANDONED_GRACE_SECONDS', 30 * 60))
+
+_sweeper_thread = None
+_sweeper_lock = threading.Lock()
+
+
+def _transition(collection, from_status, to_status, cutoff, timestamp_field, on_batch=None):
+    """Move interviews in from_status whose end_time is before cutoff, in batches
+
+    Each batch is selected through the (interview_status, end_time) index and
+    updated with one update_many; the status is re-checked in the update so a
+    concurrent transition is never overwritten.
+    """
+    moved = 0
+    while True:
+        batch = list(
+            collection.find(
+                {"interview_status": from_status, "end_time": {"$lt": cutoff}},
+                {"_id": 1, "interview_id": 1}
+            ).sort("end_time", 1).limit(SWEEP_BATCH_SIZE)
+        )
+        if not batch:
+            break
+
+        result = collection.update_many(
+            {"_id": {"$in": [doc["_id"] for doc in batch]}, "interview_status": from_status},
+            {"$set": {"interview_status": to_status, timestamp_field: datetime.utcnow()}}
+        )
+        moved += result.modified_count
+
+        interview_ids = [doc["interview_id"] for doc in batch]
+        status_cache.invalidate_many(interview_ids)
+        if on_batch:
+            on_batch(interview_ids)
+
+        if len(batch) < SWEEP_BATCH_SIZE:
+            break
+
+    return moved
+
+
+def _purge_sessions(interview_ids):
+    """Drop session state, pending scoring and recording chunks of abandoned interviews"""
+    from services.session_store import get_session_store
+    from services.answer_scoring import discard_pending
+    from services import recording_chunks
+
+    get_session_store().delete_many(interview_ids)
+    for interview_id in interview_ids:
+        discard_pending(interview_id)
+        recording_chunks.discard(interview_id)
+
+
+def sweep_once(now=None):
+    """Run one pass; returns counts and the pass duration"""
+    from services.mongodb_service import scheduled_interviews
+
+    if scheduled_interviews is None:
+        return None
+
+    now = now or datetime.utcnow()
+    started = time.perf_counter()
+
+    expired = _transition(
+        scheduled_interviews, "scheduled", "expired", now, "expired_at"
+    )
+    abandoned = _transition(
+        scheduled_interviews, "started", "abandoned",
+        now - timedelta(seconds=ABANDONED_GRACE_SECONDS), "abandoned_at",
+        on_batch=_purge_sessions
+    )
+
+    duration = time.perf_counter() - started
+    observe("lifecycle_sweep_duration_seconds", duration)
+    inc("lifecycle_transitions_total", expired, to_status="expired")
+    inc("lifecycle_transitions_total", abandoned, to_status="abandoned")
+
+    report = {"expired": expired, "abandoned": abandoned, "duration_ms": round(duration * 1000, 2)}
+    logger.info("Lifecycle sweep finished", extra=report)
+    return report
+
+
+def _run():
+    from services import recording_chunks
+
+    while True:
+        # Spread the passes of several workers apart
+        time.sleep(SWEEP_INTERVAL_SECONDS * random.uniform(0.8, 1.2))
+        try:
+            sweep_once()
+            # Spools on this host that were never completed
+            recording_chunks.purge_stale()
+        except Exception as e:
+            logger.exception("Lifecycle sweep error: %s", e)
+
+
+def start():
+    """Start the background sweeper thread (once per process)"""
+    global _sweeper_thread
+
+    if not SWEEPER_ENABLED:
+        return
+
+    with _sweeper_lock:
+        if _sweeper_thread is None:
+            _sweeper_thread = threading.Thread(target=_run, name="lifecycle-sweeper", daemon=True)
+            _sweeper_thread.start()
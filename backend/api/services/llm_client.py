@@ -0,0 +1,408 @@
+import asyncio
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.metrics import inc, record_openai_call, usage_tokens
+
+logger = logging.getLogger(__name__)
+
+LLM_MODEL = os.getenv('LLM_MODEL', 'gpt-4o-mini')
+
+# Connection pool shared by every OpenAI request in the process (httpx's own default size)
+LLM_POOL_SIZE = int(os.getenv('LLM_POOL_SIZE', 100))
+LLM_CONNECT_TIMEOUT = float(os.getenv('LLM_CONNECT_TIMEOUT', 5))
+
+# Read timeout per call type, e.g. LLM_TIMEOUT_SCORING=10
+DEFAULT_TIMEOUTS = {
+    "questions": 30,
+    "scoring": 15,
+    "summary": 30,
+    "summary_stream": 60
+}
+LLM_DEFAULT_TIMEOUT = float(os.getenv('LLM_DEFAULT_TIMEOUT', 30))
+
+LLM_MAX_RETRIES = int(os.getenv('LLM_MAX_RETRIES', 4))
+LLM_RETRY_BASE_SECONDS = float(os.getenv('LLM_RETRY_BASE_SECONDS', 0.5))
+LLM_RETRY_MAX_SECONDS = float(os.getenv('LLM_RETRY_MAX_SECONDS', 20))
+
+# Budget for this process; leave RPM/TPM at 0 to disable the token bucket.
+# Concurrency stays well below the pool size so calls queue on the semaphore
+# (and count toward the limits) before they ever wait for a connection.
+LLM_MAX_CONCURRENCY = min(int(os.getenv('LLM_MAX_CONCURRENCY', 16)), LLM_POOL_SIZE)
+LLM_RPM = int(os.getenv('LLM_RPM', 0))
+LLM_TPM = int(os.getenv('LLM_TPM', 0))
+# Completion tokens assumed when a call sets no max_tokens
+LLM_COMPLETION_ESTIMATE = int(os.getenv('LLM_COMPLETION_ESTIMATE', 400))
+
+# Budget shared by every process through per-minute counters in MongoDB
+LLM_GLOBAL_RPM = int(os.getenv('LLM_GLOBAL_RPM', 0))
+LLM_GLOBAL_TPM = int(os.getenv('LLM_GLOBAL_TPM', 0))
+
+
+def call_timeout(call_type):
+    """Read timeout in seconds for a call type"""
+    override = os.getenv(f"LLM_TIMEOUT_{call_type.upper()}")
+    if override:
+        return float(override)
+    return float(DEFAULT_TIMEOUTS.get(call_type, LLM_DEFAULT_TIMEOUT))
+
+
+def estimate_tokens(messages, max_tokens=None):
+    """Rough token count of a request (about 4 characters per token)"""
+    prompt = sum(len(m.get("content") or "") for m in messages) // 4
+    return prompt + (max_tokens or LLM_COMPLETION_ESTIMATE)
+
+
+class TokenBucket:
+    """Per-minute budget that refills continuously
+
+    reserve() takes the amount immediately and returns how long the caller
+    must wait before using it, so sync and async callers share one bucket.
+    """
+
+    def __init__(self, per_minute):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.available = float(per_minute)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount):
+        with self._lock:
+            now = time.monotonic()
+            self.available = min(self.capacity, self.available + (now - self.updated) * self.rate)
+            self.updated = now
+            # A single request larger than the whole bucket still goes through eventually
+            self.available -= min(amount, self.capacity)
+            if self.available >= 0:
+                return 0.0
+            return -self.available / self.rate
+
+    def refund(self, amount):
+        """Give back an over-estimate (or take more for an under-estimate)"""
+        with self._lock:
+            self.available = min(self.capacity, self.available + amount)
+
+
+class MongoRateLimiter:
+    """Cross-process RPM/TPM limit using one counter document per minute"""
+
+    def __init__(self, collection, rpm, tpm):
+        self.collection = collection
+        self.rpm = rpm
+        self.tpm = tpm
+
+        try:
+            self.collection.create_index("expires_at", expireAfterSeconds=0)
+        except Exception as e:
+            logger.error("Error creating LLM rate limit TTL index: %s", e)
+
+    def try_acquire(self, tokens):
+        """Count a request in the current minute
+
+        Returns (seconds to wait, None) if over budget, else (0, window id)
+        so a failed attempt can be released from the window it was charged to.
+        """
+        from pymongo import ReturnDocument
+
+        now = datetime.utcnow()
+        window = now.replace(second=0, microsecond=0)
+        counts = self.collection.find_one_and_update(
+            {"_id": window.isoformat()},
+            {
+                "$inc": {"requests": 1, "tokens": tokens},
+                "$setOnInsert": {"expires_at": window + timedelta(minutes=2)}
+            },
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+
+        over_rpm = self.rpm and counts["requests"] > self.rpm
+        over_tpm = self.tpm and counts["tokens"] > self.tpm
+        if not (over_rpm or over_tpm):
+            return 0.0, window.isoformat()
+
+        # Hand the slot back and try again in the next window
+        self.release(window.isoformat(), tokens)
+        return (window + timedelta(minutes=1) - now).total_seconds() + random.uniform(0, 1), None
+
+    def release(self, window_id, tokens):
+        """Give back a request counted in a window (an attempt that never got through)"""
+        self.collection.update_one(
+            {"_id": window_id},
+            {"$inc": {"requests": -1, "tokens": -tokens}}
+        )
+
+
+class LLMClient:
+    """OpenAI chat completions behind one pool, timeouts, retries and rate limits"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._client = None
+        self._async_client = None
+        self._semaphore = threading.BoundedSemaphore(LLM_MAX_CONCURRENCY)
+        # asyncio.Semaphore is bound to a loop, so there is one per loop
+        self._async_semaphores = {}
+        self._rpm = TokenBucket(LLM_RPM) if LLM_RPM else None
+        self._tpm = TokenBucket(LLM_TPM) if LLM_TPM else None
+        self._global = None
+        self._global_checked = False
+
+    def _api_key(self):
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY not set in environment variables")
+        return api_key
+
+    def _timeout(self):
+        import httpx
+        return httpx.Timeout(LLM_DEFAULT_TIMEOUT, connect=LLM_CONNECT_TIMEOUT)
+
+    def _limits(self):
+        import httpx
+        return httpx.Limits(max_connections=LLM_POOL_SIZE, max_keepalive_connections=LLM_POOL_SIZE)
+
+    def get_client(self):
+        """Shared sync OpenAI client (retries are handled here, not by the SDK)"""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    import httpx
+                    from openai import OpenAI
+                    self._client = OpenAI(
+                        api_key=self._api_key(),
+                        max_retries=0,
+                        http_client=httpx.Client(limits=self._limits(), timeout=self._timeout())
+                    )
+                    logger.info("OpenAI client initialized")
+        return self._client
+
+    def get_async_client(self):
+        """Shared AsyncOpenAI client for the ASGI mode"""
+        if self._async_client is None:
+            with self._lock:
+                if self._async_client is None:
+                    import httpx
+                    from openai import AsyncOpenAI
+                    self._async_client = AsyncOpenAI(
+                        api_key=self._api_key(),
+                        max_retries=0,
+                        http_client=httpx.AsyncClient(limits=self._limits(), timeout=self._timeout())
+                    )
+                    logger.info("Async OpenAI client initialized")
+        return self._async_client
+
+    def _global_limiter(self):
+        if not self._global_checked:
+            with self._lock:
+                if not self._global_checked:
+                    if LLM_GLOBAL_RPM or LLM_GLOBAL_TPM:
+                        from services.mongodb_service import get_collection
+                        collection = get_collection("llm_rate_limits")
+                        if collection is not None:
+                            self._global = MongoRateLimiter(collection, LLM_GLOBAL_RPM, LLM_GLOBAL_TPM)
+                        else:
+                            logger.warning("MongoDB not connected, global LLM limit disabled")
+                    self._global_checked = True
+        return self._global
+
+    def _local_delay(self, tokens):
+        delay = 0.0
+        if self._rpm:
+            delay = max(delay, self._rpm.reserve(1))
+        if self._tpm:
+            delay = max(delay, self._tpm.reserve(tokens))
+        return delay
+
+    def _refund(self, tokens, window):
+        """Give back a failed attempt's reservation; a retry reserves again"""
+        if self._rpm:
+            self._rpm.refund(1)
+        if self._tpm:
+            self._tpm.refund(tokens)
+        if window is not None:
+            try:
+                self._global.release(window, tokens)
+            except Exception as e:
+                logger.error("Error releasing global LLM budget: %s", e)
+
+    def _settle(self, estimated, response):
+        """Correct the TPM bucket once the real usage is known"""
+        usage = getattr(response, "usage", None)
+        if self._tpm and usage is not None:
+            self._tpm.refund(estimated - usage_tokens(usage, "total_tokens"))
+
+    def _retry_delay(self, error, attempt):
+        """Seconds to wait before retrying, or None if the error is not retryable"""
+        import openai
+
+        if isinstance(error, (openai.RateLimitError, openai.APITimeoutError, openai.APIConnectionError)):
+            pass
+        elif isinstance(error, openai.APIStatusError) and error.status_code >= 500:
+            pass
+        else:
+            return None
+
+        if attempt >= LLM_MAX_RETRIES:
+            return None
+
+        # Full jitter keeps retries from many workers from lining up
+        delay = random.uniform(0, min(LLM_RETRY_MAX_SECONDS, LLM_RETRY_BASE_SECONDS * (2 ** attempt)))
+
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        if retry_after:
+            try:
+                delay = max(delay, min(float(retry_after), LLM_RETRY_MAX_SECONDS))
+            except ValueError:
+                pass
+        return delay
+
+    def _request(self, call_type, messages, model, kwargs):
+        return dict(
+            kwargs,
+            model=model or LLM_MODEL,
+            messages=messages,
+            timeout=call_timeout(call_type)
+        )
+
+    def chat(self, call_type, messages, model=None, **kwargs):
+        """Blocking chat completion with limits and retries applied"""
+        request = self._request(call_type, messages, model, kwargs)
+        tokens = estimate_tokens(messages, kwargs.get("max_tokens"))
+
+        with self._semaphore:
+            for attempt in range(LLM_MAX_RETRIES + 1):
+                window = self._wait_for_budget(tokens)
+                started = time.perf_counter()
+                try:
+                    response = self.get_client().chat.completions.create(**request)
+                except Exception as e:
+                    self._refund(tokens, window)
+                    delay = self._retry_delay(e, attempt)
+                    if delay is None:
+                        raise
+                    inc("openai_retries_total", call_type=call_type, error=type(e).__name__)
+                    logger.warning("OpenAI %s call failed (%s), retrying in %.1fs",
+                                   call_type, type(e).__name__, delay)
+                    time.sleep(delay)
+                    continue
+
+                record_openai_call(call_type, time.perf_counter() - started, response)
+                self._settle(tokens, response)
+                return response
+
+    def chat_stream(self, call_type, messages, model=None, **kwargs):
+        """Streaming chat completion; yields chunks and holds a concurrency slot until done
+
+        Retries only cover opening the stream: once tokens have been sent to
+        the caller the request cannot be replayed.
+        """
+        request = self._request(call_type, messages, model, kwargs)
+        request["stream"] = True
+        # Passed through extra_body: the pinned SDK predates stream_options
+        request["extra_body"] = {"stream_options": {"include_usage": True}}
+        tokens = estimate_tokens(messages, kwargs.get("max_tokens"))
+
+        with self._semaphore:
+            for attempt in range(LLM_MAX_RETRIES + 1):
+                window = self._wait_for_budget(tokens)
+                started = time.perf_counter()
+                try:
+                    stream = self.get_client().chat.completions.create(**request)
+                    break
+                except Exception as e:
+                    self._refund(tokens, window)
+                    delay = self._retry_delay(e, attempt)
+                    if delay is None:
+                        raise
+                    inc("openai_retries_total", call_type=call_type, error=type(e).__name__)
+                    time.sleep(delay)
+
+            usage_chunk = None
+            for chunk in stream:
+                # With include_usage the final chunk carries usage and no choices
+                if getattr(chunk, "usage", None) is not None:
+                    usage_chunk = chunk
+                yield chunk
+
+            record_openai_call(call_type, time.perf_counter() - started, usage_chunk)
+            self._settle(tokens, usage_chunk)
+
+    async def achat(self, call_type, messages, model=None, **kwargs):
+        """chat() for the async handlers"""
+        request = self._request(call_type, messages, model, kwargs)
+        tokens = estimate_tokens(messages, kwargs.get("max_tokens"))
+
+        async with self._async_semaphore():
+            for attempt in range(LLM_MAX_RETRIES + 1):
+                window = await self._await_budget(tokens)
+                started = time.perf_counter()
+                try:
+                    response = await self.get_async_client().chat.completions.create(**request)
+                except Exception as e:
+                    # release() is a MongoDB write, so keep it off the event loop
+                    await asyncio.to_thread(self._refund, tokens, window)
+                    delay = self._retry_delay(e, attempt)
+                    if delay is None:
+                        raise
+                    inc("openai_retries_total", call_type=call_type, error=type(e).__name__)
+                    logger.warning("OpenAI %s call failed (%s), retrying in %.1fs",
+                                   call_type, type(e).__name__, delay)
+                    await asyncio.sleep(delay)
+                    continue
+
+                record_openai_call(call_type, time.perf_counter() - started, response)
+                self._settle(tokens, response)
+                return response
+
+    def _async_semaphore(self):
+        loop = asyncio.get_running_loop()
+        semaphore = self._async_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._async_semaphores[loop] = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+        return semaphore
+
+    def _wait_for_budget(self, tokens):
+        """Wait until the attempt fits the limits; returns the global window it was charged to"""
+        delay = self._local_delay(tokens)
+        if delay:
+            inc("openai_throttled_total", scope="local")
+            time.sleep(delay)
+
+        limiter = self._global_limiter()
+        while limiter is not None:
+            delay, window = limiter.try_acquire(tokens)
+            if not delay:
+                return window
+            inc("openai_throttled_total", scope="global")
+            time.sleep(delay)
+        return None
+
+    async def _await_budget(self, tokens):
+        delay = self._local_delay(tokens)
+        if delay:
+            inc("openai_throttled_total", scope="local")
+            await asyncio.sleep(delay)
+
+        limiter = self._global_limiter()
+        while limiter is not None:
+            delay, window = await asyncio.to_thread(limiter.try_acquire, tokens)
+            if not delay:
+                return window
+            inc("openai_throttled_total", scope="global")
+            await asyncio.sleep(delay)
+        return None
+
+
+llm_client = LLMClient()
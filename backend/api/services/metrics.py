@@ -0,0 +1,383 @@
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+from pymongo import monitoring
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+# Every thread records into its own shard, so the request path never
+# contends on a shared lock; shards are only merged when /api/metrics is scraped
+_shards = []
+_shards_lock = threading.Lock()
+_local = threading.local()
+
+# Shards of finished threads are folded in here at scrape time
+_retired = {"counters": {}, "histograms": {}}
+
+# Gauges are set rarely (not per request), so a plain lock is fine
+_gauges = {}
+_gauges_lock = threading.Lock()
+
+_help = {}
+
+# Multiprocess mode (gunicorn with several workers): each worker writes a
+# snapshot of its metrics to this directory every METRICS_FLUSH_SECONDS and
+# /api/metrics on any worker sums all snapshots, so one scrape covers every
+# worker. Same variable as prometheus_client; empty the directory when the
+# server (re)starts. Unset, each process only reports its own metrics.
+MULTIPROC_DIR = os.getenv('PROMETHEUS_MULTIPROC_DIR')
+# Keep this below the scrape interval so scrapes see recent values
+METRICS_FLUSH_SECONDS = float(os.getenv('METRICS_FLUSH_SECONDS', 5))
+
+_flusher_pid = None
+_flusher_lock = threading.Lock()
+
+
+def _shard():
+    shard = getattr(_local, 'shard', None)
+    if shard is None:
+        shard = {"counters": {}, "histograms": {}, "thread": threading.current_thread()}
+        _local.shard = shard
+        with _shards_lock:
+            _shards.append(shard)
+        if MULTIPROC_DIR:
+            _ensure_flusher()
+    return shard
+
+
+def describe(name, kind, text):
+    """Register HELP/TYPE text for a metric"""
+    _help[name] = (kind, text)
+
+
+def _key(name, labels):
+    return name, tuple(sorted(labels.items())) if labels else ()
+
+
+def inc(name, value=1, **labels):
+    """Increment a counter"""
+    counters = _shard()["counters"]
+    key = _key(name, labels)
+    counters[key] = counters.get(key, 0) + value
+
+
+def observe(name, value, **labels):
+    """Record a value in a histogram"""
+    histograms = _shard()["histograms"]
+    key = _key(name, labels)
+    histogram = histograms.get(key)
+    if histogram is None:
+        histogram = histograms[key] = [[0] * len(LATENCY_BUCKETS), 0.0, 0]
+
+    for index, bound in enumerate(LATENCY_BUCKETS):
+        if value <= bound:
+            histogram[0][index] += 1
+            break
+    histogram[1] += value
+    histogram[2] += 1
+
+
+def set_gauge(name, value, **labels):
+    """Set a gauge to its latest value"""
+    with _gauges_lock:
+        _gauges[_key(name, labels)] = value
+
+
+@contextmanager
+def timed(name, **labels):
+    """Observe the duration of a block in seconds"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - start, **labels)
+
+
+def usage_tokens(usage, field):
+    """Read a token count from response.usage (a dict on stream chunks)"""
+    if isinstance(usage, dict):
+        return usage.get(field) or 0
+    return getattr(usage, field, None) or 0
+
+
+def record_openai_call(call_type, duration, response=None):
+    """Record latency and token usage of an OpenAI call"""
+    observe("openai_request_duration_seconds", duration, call_type=call_type)
+    inc("openai_requests_total", call_type=call_type)
+
+    usage = getattr(response, "usage", None)
+    if usage is not None:
+        inc("openai_tokens_total", usage_tokens(usage, "prompt_tokens"), call_type=call_type, kind="prompt")
+        inc("openai_tokens_total", usage_tokens(usage, "completion_tokens"), call_type=call_type, kind="completion")
+
+
+def _merge_into(target, shard):
+    # Copy first: the owning thread may add keys while we iterate
+    counters, histograms = target
+    for key, value in list(shard["counters"].items()):
+        counters[key] = counters.get(key, 0) + value
+    for key, (buckets, total, count) in list(shard["histograms"].items()):
+        merged = histograms.setdefault(key, [[0] * len(LATENCY_BUCKETS), 0.0, 0])
+        for index, bucket in enumerate(list(buckets)):
+            merged[0][index] += bucket
+        merged[1] += total
+        merged[2] += count
+
+
+def _merge():
+    with _shards_lock:
+        # Threads that have exited can no longer write, so fold them away
+        finished = [shard for shard in _shards if not shard["thread"].is_alive()]
+        for shard in finished:
+            _merge_into((_retired["counters"], _retired["histograms"]), shard)
+            _shards.remove(shard)
+        shards = list(_shards)
+
+        counters = dict(_retired["counters"])
+        histograms = {
+            key: [list(buckets), total, count]
+            for key, (buckets, total, count) in _retired["histograms"].items()
+        }
+
+    for shard in shards:
+        _merge_into((counters, histograms), shard)
+
+    return counters, histograms
+
+
+def _snapshot_path(pid=None):
+    return Path(MULTIPROC_DIR) / f"metrics_{pid or os.getpid()}.json"
+
+
+def _flush():
+    """Write this process's metrics to its snapshot file"""
+    counters, histograms = _merge()
+    with _gauges_lock:
+        gauges = dict(_gauges)
+
+    snapshot = {
+        "counters": [[name, labels, value] for (name, labels), value in counters.items()],
+        "gauges": [[name, labels, value] for (name, labels), value in gauges.items()],
+        "histograms": [
+            [name, labels, buckets, total, count]
+            for (name, labels), (buckets, total, count) in histograms.items()
+        ]
+    }
+
+    path = _snapshot_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write then rename, so a scrape never reads half a snapshot
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}")
+    with open(tmp_path, "w") as f:
+        json.dump(snapshot, f)
+    os.replace(tmp_path, path)
+
+
+def _run_flusher():
+    while True:
+        time.sleep(METRICS_FLUSH_SECONDS)
+        try:
+            _flush()
+        except Exception as e:
+            logger.error("Error writing metrics snapshot: %s", e)
+
+
+def _ensure_flusher():
+    """Start the snapshot writer in this process (again after a fork)"""
+    global _flusher_pid
+
+    if _flusher_pid == os.getpid():
+        return
+    with _flusher_lock:
+        if _flusher_pid != os.getpid():
+            threading.Thread(target=_run_flusher, name="metrics-flusher", daemon=True).start()
+            _flusher_pid = os.getpid()
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        pass
+    return True
+
+
+def _collect_multiprocess():
+    """Sum the snapshots of every worker, this one freshly written"""
+    _flush()
+
+    counters, gauges, histograms = {}, {}, {}
+    for path in Path(MULTIPROC_DIR).glob("metrics_*.json"):
+        try:
+            pid = int(path.stem.split("_", 1)[1])
+            with open(path) as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            continue
+
+        # Labels come back from JSON as lists; keys need tuples
+        for name, labels, value in snapshot["counters"]:
+            key = (name, tuple(map(tuple, labels)))
+            counters[key] = counters.get(key, 0) + value
+
+        # Counters of exited workers still count towards the totals, their
+        # gauges don't; live workers' gauges are told apart by pid
+        if _pid_alive(pid):
+            for name, labels, value in snapshot["gauges"]:
+                gauges[(name, tuple(map(tuple, labels)) + (("pid", pid),))] = value
+
+        for name, labels, buckets, total, count in snapshot["histograms"]:
+            merged = histograms.setdefault(
+                (name, tuple(map(tuple, labels))), [[0] * len(LATENCY_BUCKETS), 0.0, 0]
+            )
+            for index, bucket in enumerate(buckets):
+                merged[0][index] += bucket
+            merged[1] += total
+            merged[2] += count
+
+    return counters, gauges, histograms
+
+
+def _format_labels(labels, extra=None):
+    items = list(labels) + (list(extra) if extra else [])
+    if not items:
+        return ""
+    rendered = ",".join(
+        '{}="{}"'.format(k, str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for k, v in items
+    )
+    return "{" + rendered + "}"
+
+
+def _header(lines, seen, name, default_kind):
+    if name in seen:
+        return
+    seen.add(name)
+    kind, text = _help.get(name, (default_kind, name))
+    lines.append(f"# HELP {name} {text}")
+    lines.append(f"# TYPE {name} {kind}")
+
+
+def render_prometheus():
+    """Render all metrics in the Prometheus text exposition format"""
+    if MULTIPROC_DIR:
+        counters, gauges, histograms = _collect_multiprocess()
+    else:
+        counters, histograms = _merge()
+        with _gauges_lock:
+            gauges = dict(_gauges)
+
+    lines = []
+    seen = set()
+
+    for (name, labels), value in sorted(counters.items()):
+        _header(lines, seen, name, "counter")
+        lines.append(f"{name}{_format_labels(labels)} {value}")
+
+    for (name, labels), value in sorted(gauges.items()):
+        _header(lines, seen, name, "gauge")
+        lines.append(f"{name}{_format_labels(labels)} {value}")
+
+    for (name, labels), (buckets, total, count) in sorted(histograms.items()):
+        _header(lines, seen, name, "histogram")
+        cumulative = 0
+        for bound, bucket in zip(LATENCY_BUCKETS, buckets):
+            cumulative += bucket
+            lines.append(f"{name}_bucket{_format_labels(labels, [('le', bound)])} {cumulative}")
+        lines.append(f"{name}_bucket{_format_labels(labels, [('le', '+Inf')])} {count}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {total}")
+        lines.append(f"{name}_count{_format_labels(labels)} {count}")
+
+    return "\n".join(lines) + "\n"
+
+
+def reset():
+    """Clear every recorded metric"""
+    with _shards_lock:
+        for shard in _shards + [_retired]:
+            shard["counters"].clear()
+            shard["histograms"].clear()
+    with _gauges_lock:
+        _gauges.clear()
+    if MULTIPROC_DIR:
+        _snapshot_path().unlink(missing_ok=True)
+
+
+class MongoCommandListener(monitoring.CommandListener):
+    """pymongo command listener that times every command per collection"""
+
+    def __init__(self):
+        self._started = {}
+
+    def started(self, event):
+        collection = event.command.get(event.command_name)
+        self._started[(event.connection_id, event.request_id)] = (
+            collection if isinstance(collection, str) else ""
+        )
+
+    def _finish(self, event, outcome):
+        collection = self._started.pop((event.connection_id, event.request_id), "")
+        observe(
+            "mongo_command_duration_seconds",
+            event.duration_micros / 1_000_000,
+            command=event.command_name,
+            collection=collection
+        )
+        if outcome != "ok":
+            inc("mongo_command_failures_total", command=event.command_name, collection=collection)
+
+    def succeeded(self, event):
+        self._finish(event, "ok")
+
+    def failed(self, event):
+        self._finish(event, "failed")
+
+
+def register_blueprint_timing(blueprint):
+    """Record a latency histogram for every route in a blueprint"""
+    from flask import g, request
+
+    @blueprint.before_request
+    def _start_timer():
+        g.metrics_started = time.perf_counter()
+
+    @blueprint.after_request
+    def _record(response):
+        started = getattr(g, 'metrics_started', None)
+        if started is not None:
+            route = request.url_rule.rule if request.url_rule else "unmatched"
+            observe("http_request_duration_seconds", time.perf_counter() - started,
+                    route=route, method=request.method)
+            inc("http_requests_total", route=route, method=request.method,
+                status=response.status_code)
+        return response
+
+
+describe("http_request_duration_seconds", "histogram", "Request latency per blueprint route")
+describe("http_requests_total", "counter", "Requests per route, method and status")
+describe("mongo_command_duration_seconds", "histogram", "MongoDB command latency per collection")
+describe("mongo_command_failures_total", "counter", "Failed MongoDB commands")
+describe("openai_request_duration_seconds", "histogram", "OpenAI request latency per call type")
+describe("openai_requests_total", "counter", "OpenAI requests per call type")
+describe("openai_tokens_total", "counter", "OpenAI tokens used, from response.usage")
+describe("openai_retries_total", "counter", "OpenAI calls retried after a transient error")
+describe("openai_throttled_total", "counter", "OpenAI calls delayed by the RPM/TPM limiter")
+describe("drive_upload_bytes_total", "counter", "Bytes uploaded to Google Drive")
+describe("drive_upload_duration_seconds", "histogram", "Google Drive upload duration")
+describe("drive_uploads_total", "counter", "Google Drive uploads by outcome")
+describe("drive_upload_throughput_bytes_per_second", "gauge", "Throughput of the most recent Drive upload")
+describe("lifecycle_sweep_duration_seconds", "histogram", "Duration of a lifecycle sweeper pass")
+describe("lifecycle_transitions_total", "counter", "Interviews moved to expired or abandoned by the sweeper")
+describe("recording_chunks_total", "counter", "Recording chunks received, stored or duplicate")
+describe("recording_saves_total", "counter", "Recordings saved per storage backend, stored or deduplicated")
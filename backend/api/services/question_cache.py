@@ -0,0 +1,208 @@
+import hashlib
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+logger = logging.getLogger(__name__)
+
+QUESTION_CACHE_SIZE = int(os.getenv('QUESTION_CACHE_SIZE', 256))
+QUESTION_CACHE_TTL_SECONDS = int(os.getenv('QUESTION_CACHE_TTL_SECONDS', 7 * 24 * 60 * 60))
+# Number of distinct question sets rotated per job description
+QUESTION_CACHE_VARIANTS = int(os.getenv('QUESTION_CACHE_VARIANTS', 3))
+
+
+def normalize_jd(jd_text):
+    """Normalize job description text so trivial edits share a cache entry"""
+    return re.sub(r'\s+', ' ', jd_text or '').strip().lower()
+
+
+def jd_hash(jd_text):
+    """SHA-256 of the normalized job description"""
+    return hashlib.sha256(normalize_jd(jd_text).encode('utf-8')).hexdigest()
+
+
+class QuestionCache:
+    """Two-tier (memory LRU + Mongo) cache of generated question sets"""
+
+    def __init__(self, collection=None, max_entries=QUESTION_CACHE_SIZE,
+                 ttl_seconds=QUESTION_CACHE_TTL_SECONDS, variants=QUESTION_CACHE_VARIANTS):
+        self.collection = collection
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.variants = max(1, variants)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self._stats = {"memory_hits": 0, "mongo_hits": 0, "misses": 0, "errors": 0}
+
+        if self.collection is not None:
+            try:
+                self.collection.create_index("created_at", expireAfterSeconds=self.ttl_seconds)
+            except Exception as e:
+                logger.error("Error creating question cache TTL index: %s", e)
+
+    def get_or_generate(self, jd_text, generate_fn):
+        """Return cached questions for a JD, calling generate_fn(jd_text) on a miss"""
+        key = self._pick_key(jd_text)
+
+        questions = self._get_memory(key)
+        if questions is not None:
+            self._count("memory_hits")
+            return questions
+
+        # Only one thread generates a given variant; the rest wait for its result
+        with self._key_lock(key):
+            questions = self._get_memory(key)
+            if questions is not None:
+                self._count("memory_hits")
+                return questions
+
+            questions = self._get_mongo(key)
+            if questions is not None:
+                self._count("mongo_hits")
+                self._put_memory(key, questions)
+                return questions
+
+            self._count("misses")
+            questions = generate_fn(jd_text)
+            if questions:
+                self._put_memory(key, questions)
+                self._put_mongo(key, questions)
+            return questions
+
+    def lookup(self, jd_text):
+        """Pick a variant for a JD and return (key, cached questions or None)
+
+        For callers that generate on their own (e.g. the async handlers);
+        pass the key back to store() after a miss.
+        """
+        key = self._pick_key(jd_text)
+
+        questions = self._get_memory(key)
+        if questions is not None:
+            self._count("memory_hits")
+            return key, questions
+
+        questions = self._get_mongo(key)
+        if questions is not None:
+            self._count("mongo_hits")
+            self._put_memory(key, questions)
+            return key, questions
+
+        self._count("misses")
+        return key, None
+
+    def store(self, key, questions):
+        """Cache questions generated after a lookup() miss"""
+        if questions:
+            self._put_memory(key, questions)
+            self._put_mongo(key, questions)
+
+    def stats(self):
+        """Return hit/miss counters and the current memory tier size"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._entries)
+        lookups = stats["memory_hits"] + stats["mongo_hits"] + stats["misses"]
+        stats["hit_ratio"] = round((lookups - stats["misses"]) / lookups, 4) if lookups else 0.0
+        stats["variants"] = self.variants
+        return stats
+
+    def clear(self):
+        """Empty the memory tier"""
+        with self._lock:
+            self._entries.clear()
+
+    def _pick_key(self, jd_text):
+        return f"{jd_hash(jd_text)}:{random.randrange(self.variants)}"
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+    def _key_lock(self, key):
+        with self._lock:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                # Stale locks for evicted keys are cheap; bound them with the cache size
+                if len(self._key_locks) > self.max_entries * self.variants:
+                    self._key_locks.clear()
+                lock = self._key_locks[key] = threading.Lock()
+            return lock
+
+    def _get_memory(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, questions = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return list(questions)
+
+    def _put_memory(self, key, questions):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, list(questions))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _get_mongo(self, key):
+        if self.collection is None:
+            return None
+        try:
+            doc = self.collection.find_one({"_id": key}, {"questions": 1})
+            return doc["questions"] if doc else None
+        except Exception as e:
+            self._count("errors")
+            logger.error("Error reading question cache: %s", e)
+            return None
+
+    def _put_mongo(self, key, questions):
+        if self.collection is None:
+            return
+        jd_key, variant = key.rsplit(":", 1)
+        try:
+            self.collection.replace_one(
+                {"_id": key},
+                {
+                    "jd_hash": jd_key,
+                    "variant": int(variant),
+                    "questions": list(questions),
+                    "created_at": datetime.utcnow()
+                },
+                upsert=True
+            )
+        except Exception as e:
+            self._count("errors")
+            logger.error("Error writing question cache: %s", e)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_question_cache():
+    """Return the process-wide question cache, creating it on first use"""
+    global _cache
+
+    if _cache is not None:
+        return _cache
+
+    with _cache_lock:
+        if _cache is None:
+            from services.mongodb_service import get_collection
+            _cache = QuestionCache(collection=get_collection("question_cache"))
+    return _cache
@@ -0,0 +1,77 @@
+import logging
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.question_cache import get_question_cache
+
+logger = logging.getLogger(__name__)
+
+QUESTION_PREGEN_ENABLED = os.getenv('QUESTION_PREGEN', 'true').lower() != 'false'
+QUESTION_PREGEN_WORKERS = int(os.getenv('QUESTION_PREGEN_WORKERS', 2))
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    """Return the pre-generation worker pool, creating it on first use"""
+    global _executor
+
+    if _executor is not None:
+        return _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=QUESTION_PREGEN_WORKERS,
+                thread_name_prefix="question-pregen"
+            )
+    return _executor
+
+
+def _set_questions(interview_id, update):
+    from services.mongodb_service import scheduled_interviews
+
+    if scheduled_interviews is None:
+        return
+    # Only while the interview has not started; a live start owns the questions then
+    scheduled_interviews.update_one(
+        {"interview_id": interview_id, "interview_status": "scheduled"},
+        {"$set": update}
+    )
+
+
+def _pregenerate(interview_id, jd_text, generate_fn):
+    try:
+        questions = get_question_cache().get_or_generate(jd_text, generate_fn)
+        if not questions:
+            raise ValueError("No questions generated")
+        _set_questions(interview_id, {"questions": questions, "questions_status": "ready"})
+        logger.info("Questions pre-generated", extra={"interview_id": interview_id})
+    except Exception as e:
+        logger.error("Question pre-generation failed: %s", e, extra={"interview_id": interview_id})
+        try:
+            _set_questions(interview_id, {"questions_status": "failed"})
+        except Exception as e:
+            logger.error("Error recording pre-generation failure: %s", e, extra={"interview_id": interview_id})
+
+
+def schedule_pregeneration(interviews, generate_fn):
+    """Generate and store questions for (interview_id, job_description) pairs in the background
+
+    generate_questions falls back to live generation for any interview whose
+    questions are not ready, so this is only ever a head start.
+    """
+    if not QUESTION_PREGEN_ENABLED:
+        return
+
+    executor = _get_executor()
+    for interview_id, jd_text in interviews:
+        if jd_text and jd_text.strip():
+            executor.submit(_pregenerate, interview_id, jd_text.strip(), generate_fn)
@@ -0,0 +1,255 @@
+import json
+import logging
+import os
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: only the threads of one process are serialized
+    fcntl = None
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.metrics import inc
+
+logger = logging.getLogger(__name__)
+
+CHUNK_DIR = Path(
+    os.getenv('RECORDING_CHUNK_DIR')
+    or os.path.join(os.getenv('UPLOAD_SPOOL_DIR') or tempfile.gettempdir(), 'recording_chunks')
+)
+CHUNK_MAX_BYTES = int(os.getenv('RECORDING_CHUNK_MAX_MB', 32)) * 1024 * 1024
+# One chunk every few seconds; this caps a recording at several hours
+MAX_CHUNKS = int(os.getenv('RECORDING_MAX_CHUNKS', 20000))
+# Spools untouched this long (abandoned or never completed) are removed by the sweeper
+CHUNK_TTL_SECONDS = int(os.getenv('RECORDING_CHUNK_TTL_SECONDS', 6 * 60 * 60))
+
+COPY_BUFFER_SIZE = 1024 * 1024
+SPOOL_NAME = "recording.webm"
+STATE_NAME = "state.json"
+
+_INTERVIEW_ID = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+_fallback_lock = threading.Lock()
+
+
+class RecordingCompleted(Exception):
+    """Raised for a recording that complete() has already handed over"""
+
+
+class IncompleteRecording(Exception):
+    """Raised by complete() while chunks below total_chunks are still missing"""
+
+    def __init__(self, missing):
+        super().__init__(f"{len(missing)} chunks missing")
+        self.missing = missing
+
+
+def valid_interview_id(interview_id):
+    return bool(_INTERVIEW_ID.match(interview_id or ""))
+
+
+def _spool_dir(interview_id):
+    return CHUNK_DIR / interview_id
+
+
+def _part_path(directory, index):
+    return directory / f"{index:08d}.part"
+
+
+@contextmanager
+def _spool_lock(directory):
+    """Serialize assembly of one recording across threads and worker processes"""
+    with open(directory / "lock", "a") as lock_file:
+        if fcntl is None:
+            with _fallback_lock:
+                yield
+            return
+        # flock conflicts between separate open() calls, so threads are covered too
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _read_state(directory):
+    try:
+        with open(directory / STATE_NAME) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"next_index": 0, "size": 0}
+
+
+def _write_state(directory, state):
+    tmp_path = directory / f"{STATE_NAME}.{uuid.uuid4().hex}"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, directory / STATE_NAME)
+
+
+def _append_ready(directory):
+    """Append every contiguous part after the spool's end; call under _spool_lock
+
+    The state file records how many parts (and bytes) the spool holds. The
+    spool is truncated to that size first, so a part whose append was cut
+    short by a crash is simply appended again.
+    """
+    state = _read_state(directory)
+    if state.get("completed"):
+        # The spool has been handed over; don't recreate it
+        raise RecordingCompleted()
+
+    with open(directory / SPOOL_NAME, "ab") as spool:
+        spool.truncate(state["size"])
+        while True:
+            part_path = _part_path(directory, state["next_index"])
+            if not part_path.exists():
+                break
+            with open(part_path, "rb") as part:
+                shutil.copyfileobj(part, spool, COPY_BUFFER_SIZE)
+            spool.flush()
+            state = {"next_index": state["next_index"] + 1, "size": spool.tell()}
+            _write_state(directory, state)
+            os.remove(part_path)
+
+    return state
+
+
+def store_chunk(interview_id, index, stream):
+    """Store chunk `index` of a recording and append whatever is now contiguous
+
+    Chunks may arrive out of order and may be sent more than once; a chunk
+    that is already stored or appended is ignored. Returns (stored, state)
+    where state["next_index"] is the number of chunks in the spool; raises
+    RecordingCompleted once complete() has taken the recording.
+    """
+    directory = _spool_dir(interview_id)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    part_path = _part_path(directory, index)
+    stored = False
+    state = _read_state(directory)
+
+    if state.get("completed"):
+        raise RecordingCompleted()
+
+    if index >= state["next_index"] and not part_path.exists():
+        # Write under a unique name, then rename, so a half-written part is never appended
+        tmp_path = directory / f"{index:08d}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_path, "wb") as out:
+                shutil.copyfileobj(stream, out, COPY_BUFFER_SIZE)
+            os.replace(tmp_path, part_path)
+            stored = True
+        finally:
+            if tmp_path.exists():
+                os.remove(tmp_path)
+
+    with _spool_lock(directory):
+        try:
+            state = _append_ready(directory)
+        except RecordingCompleted:
+            # complete() ran between the check above and taking the lock
+            if stored:
+                os.remove(part_path)
+            raise
+
+    inc("recording_chunks_total", outcome="stored" if stored else "duplicate")
+    return stored, state
+
+
+def get_progress(interview_id):
+    """Chunks appended so far and chunks waiting for a gap to be filled, or None"""
+    directory = _spool_dir(interview_id)
+    if not directory.is_dir():
+        return None
+
+    state = _read_state(directory)
+    pending = sorted(
+        int(path.stem) for path in directory.glob("*.part")
+        if int(path.stem) >= state["next_index"]
+    )
+    return {
+        "received": state["next_index"],
+        "bytes": state["size"],
+        "pending": pending,
+        "completed": bool(state.get("completed"))
+    }
+
+
+def complete(interview_id, total_chunks, submit):
+    """Hand the assembled recording to submit(path) once chunks 0..total_chunks-1 are in
+
+    submit takes ownership of the file (the upload queue deletes it after
+    the upload) and its return value is returned. If submit raises, the
+    spool is put back so the call can be retried. Returns None if nothing
+    was received; raises IncompleteRecording with the missing indexes, and
+    RecordingCompleted if the recording was already handed over.
+
+    On success the directory is left holding only a completed state file, so
+    a late or retried chunk is rejected instead of starting a new spool; the
+    sweeper's purge_stale() removes it with the other old spools.
+    """
+    directory = _spool_dir(interview_id)
+    if not directory.is_dir():
+        return None
+
+    with _spool_lock(directory):
+        state = _append_ready(directory)
+        if state["next_index"] < total_chunks:
+            present = {int(path.stem) for path in directory.glob("*.part")}
+            raise IncompleteRecording([
+                index for index in range(state["next_index"], total_chunks)
+                if index not in present
+            ])
+
+        # Same filesystem, so handing the file over is a rename, not a copy
+        fd, path = tempfile.mkstemp(suffix='.webm', prefix='upload_', dir=CHUNK_DIR)
+        os.close(fd)
+        os.replace(directory / SPOOL_NAME, path)
+        try:
+            result = submit(path)
+        except Exception:
+            os.replace(path, directory / SPOOL_NAME)
+            raise
+
+        # Still under the lock, so no store_chunk can slip in before the tombstone
+        _write_state(directory, dict(state, completed=True))
+
+    logger.info("Recording assembled from %d chunks (%d bytes)", state["next_index"], state["size"],
+                extra={"interview_id": interview_id})
+    return result
+
+
+def discard(interview_id):
+    """Drop a recording's chunks and spool"""
+    shutil.rmtree(_spool_dir(interview_id), ignore_errors=True)
+
+
+def purge_stale(max_age_seconds=CHUNK_TTL_SECONDS):
+    """Remove spools that have not received a chunk for max_age_seconds"""
+    if not CHUNK_DIR.is_dir():
+        return 0
+
+    cutoff = time.time() - max_age_seconds
+    removed = 0
+    for directory in CHUNK_DIR.iterdir():
+        try:
+            if directory.is_dir() and directory.stat().st_mtime < cutoff:
+                shutil.rmtree(directory, ignore_errors=True)
+                removed += 1
+        except OSError:
+            continue
+
+    if removed:
+        logger.info("Removed %d stale recording spools", removed)
+    return removed
@@ -0,0 +1,166 @@
+import hashlib
+import logging
+import mmap
+import os
+import re
+import sys
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.metrics import inc
+
+logger = logging.getLogger(__name__)
+
+RECORDING_BACKEND = os.getenv('RECORDING_BACKEND', 'drive')  # drive | local
+RECORDING_LOCAL_DIR = Path(
+    os.getenv('RECORDING_LOCAL_DIR') or Path(__file__).resolve().parent.parent / "recordings"
+)
+
+HASH_BLOCK_SIZE = 1024 * 1024
+# Bytes copied out of the memory map per yielded response chunk
+RANGE_BLOCK_SIZE = 256 * 1024
+
+
+class RecordingStorage(ABC):
+    """Interface for where interview recordings are kept"""
+
+    name = None
+
+    @abstractmethod
+    def save_file(self, file_path, filename):
+        """Store a spooled recording; returns {"id", "webViewLink"} or None
+
+        The caller still owns (and removes) file_path afterwards.
+        """
+
+    def local_path(self, recording_id):
+        """Path of a stored recording that can be read directly, or None"""
+        return None
+
+    def url(self, recording_id):
+        """URL to send a client to for this recording, or None"""
+        return None
+
+
+class DriveRecordingStorage(RecordingStorage):
+    """Recordings uploaded to Google Drive; playback redirects to Drive"""
+
+    name = "drive"
+
+    def save_file(self, file_path, filename):
+        from services.drive_service import upload_file_to_drive
+        return upload_file_to_drive(file_path, filename)
+
+    def url(self, recording_id):
+        return f"https://drive.google.com/file/d/{recording_id}/view"
+
+
+class LocalRecordingStorage(RecordingStorage):
+    """Content-addressed files on local disk, named by their SHA-256
+
+    Saving a recording whose bytes are already stored only costs the hash;
+    the existing file is reused.
+    """
+
+    name = "local"
+    _ID = re.compile(r"^[0-9a-f]{64}$")
+
+    def __init__(self, root=RECORDING_LOCAL_DIR):
+        self.root = Path(root)
+
+    def _path(self, digest):
+        # Two-character fan-out keeps directories small
+        return self.root / digest[:2] / f"{digest}.webm"
+
+    def save_file(self, file_path, filename):
+        sha256 = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+                sha256.update(block)
+        digest = sha256.hexdigest()
+
+        path = self._path(digest)
+        if path.exists():
+            inc("recording_saves_total", backend=self.name, outcome="deduplicated")
+            logger.info("Recording already stored: %s", digest, extra={"recording_filename": filename})
+            return {"id": digest, "webViewLink": None}
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Copy under a temporary name so a reader never sees a partial file
+        tmp_path = path.parent / f".{digest}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(file_path, "rb") as src, open(tmp_path, "wb") as dst:
+                for block in iter(lambda: src.read(HASH_BLOCK_SIZE), b""):
+                    dst.write(block)
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                os.remove(tmp_path)
+
+        inc("recording_saves_total", backend=self.name, outcome="stored")
+        logger.info("Recording stored: %s", digest, extra={"recording_filename": filename})
+        return {"id": digest, "webViewLink": None}
+
+    def local_path(self, recording_id):
+        if not self._ID.match(recording_id or ""):
+            return None
+        path = self._path(recording_id)
+        return path if path.is_file() else None
+
+
+BACKENDS = {
+    "drive": DriveRecordingStorage,
+    "local": LocalRecordingStorage
+}
+
+_storages = {}
+_storages_lock = threading.Lock()
+
+
+def get_recording_storage(name=None):
+    """Return the storage backend by name (default: RECORDING_BACKEND), created on first use"""
+    name = name or RECORDING_BACKEND
+    if name not in BACKENDS:
+        logger.warning("Unknown recording backend %s, using drive", name)
+        name = "drive"
+
+    storage = _storages.get(name)
+    if storage is not None:
+        return storage
+
+    with _storages_lock:
+        if name not in _storages:
+            _storages[name] = BACKENDS[name]()
+    return _storages[name]
+
+
+def save_recording(file_path, filename):
+    """Store a recording with the configured backend; the result names the backend"""
+    storage = get_recording_storage()
+    result = storage.save_file(file_path, filename)
+    if result:
+        result = dict(result, backend=storage.name)
+    return result
+
+
+def iter_file_range(path, start, end):
+    """Yield bytes start..end (inclusive) of a file through a memory map
+
+    Only the pages that are sent are read, so seeking far into a long
+    recording neither reads nor buffers what comes before it.
+    """
+    # mmap cannot map an empty file, and there is nothing to send anyway
+    if end < start or os.path.getsize(path) == 0:
+        return
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        position = start
+        while position <= end:
+            stop = min(position + RANGE_BLOCK_SIZE, end + 1)
+            yield mapped[position:stop]
+            position = stop
@@ -0,0 +1,222 @@
+import csv
+import io
+import json
+import logging
+import os
+import sys
+import zlib
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+logger = logging.getLogger(__name__)
+
+# Documents per aggregation cursor batch
+EXPORT_BATCH_SIZE = int(os.getenv('EXPORT_BATCH_SIZE', 200))
+# Bytes of CSV/NDJSON collected before each gzip compress() call
+EXPORT_GZIP_FLUSH_BYTES = 64 * 1024
+
+CSV_COLUMNS = (
+    "interview_id", "candidate_name", "candidate_email", "interview_status",
+    "start_time", "end_time", "evaluated_at", "answers",
+    "technical_score", "communication_score", "overall_score",
+    "recommendation", "feedback", "video_link"
+)
+
+
+def build_export_pipeline(statuses=None, start_from=None, start_to=None, include_qna=False):
+    """Join scheduled interviews with their results, in start_time order
+
+    Starting from scheduled_interviews lets the date/status filter and sort
+    use the listing indexes; the $lookup hits the unique interview_id index
+    on interview_results.
+    """
+    match = {}
+    if statuses:
+        match["interview_status"] = {"$in": list(statuses)}
+    if start_from or start_to:
+        match["start_time"] = {}
+        if start_from:
+            match["start_time"]["$gte"] = start_from
+        if start_to:
+            match["start_time"]["$lt"] = start_to
+
+    # Built from expressions, so only these fields are kept; an exclusion
+    # such as "_id": 0 is not allowed inside an inclusion projection
+    result_fields = {
+        "evaluation": "$result.evaluation",
+        "video_link": "$result.video_link",
+        "timestamp": "$result.timestamp",
+        "answers": {"$size": {"$ifNull": ["$result.qna", []]}}
+    }
+    if include_qna:
+        result_fields["qna"] = "$result.qna"
+
+    return [
+        {"$match": match},
+        {"$sort": {"start_time": 1, "_id": 1}},
+        {"$project": {
+            "_id": 0,
+            "interview_id": 1,
+            "candidate_name": 1,
+            "candidate_email": 1,
+            "interview_status": 1,
+            "start_time": 1,
+            "end_time": 1,
+            "video_link": 1
+        }},
+        {"$lookup": {
+            "from": "interview_results",
+            "localField": "interview_id",
+            "foreignField": "interview_id",
+            "as": "result"
+        }},
+        # Interviews without a result are not exported
+        {"$unwind": "$result"},
+        {"$project": {
+            "interview_id": 1,
+            "candidate_name": 1,
+            "candidate_email": 1,
+            "interview_status": 1,
+            "start_time": 1,
+            "end_time": 1,
+            "scheduled_video_link": "$video_link",
+            "result": result_fields
+        }}
+    ]
+
+
+def iter_export_documents(statuses=None, start_from=None, start_to=None, include_qna=False):
+    """Open the aggregation cursor now and return a generator of export rows
+
+    The aggregate command runs before any response is sent, so a rejected
+    pipeline or an unavailable database becomes an error response rather
+    than a truncated 200.
+    """
+    from services.mongodb_service import get_collection
+
+    scheduled = get_collection("scheduled_interviews")
+    if scheduled is None:
+        raise RuntimeError("MongoDB not connected")
+
+    cursor = scheduled.aggregate(
+        build_export_pipeline(statuses, start_from, start_to, include_qna),
+        allowDiskUse=True,
+        batchSize=EXPORT_BATCH_SIZE
+    )
+    return _iter_rows(cursor, include_qna)
+
+
+def _iter_rows(cursor, include_qna):
+    try:
+        for document in cursor:
+            yield flatten_document(document, include_qna)
+    finally:
+        cursor.close()
+
+
+def flatten_document(document, include_qna=False):
+    """One export row per interview; qna is kept nested for NDJSON"""
+    result = document.get("result") or {}
+    evaluation = result.get("evaluation") or {}
+
+    row = {
+        "interview_id": document.get("interview_id"),
+        "candidate_name": document.get("candidate_name"),
+        "candidate_email": document.get("candidate_email"),
+        "interview_status": document.get("interview_status"),
+        "start_time": document.get("start_time"),
+        "end_time": document.get("end_time"),
+        "evaluated_at": result.get("timestamp"),
+        "answers": result.get("answers", 0),
+        "technical_score": evaluation.get("technical_score"),
+        "communication_score": evaluation.get("communication_score"),
+        "overall_score": evaluation.get("overall_score"),
+        "recommendation": evaluation.get("recommendation"),
+        "feedback": evaluation.get("feedback"),
+        # The upload job writes the link to the schedule; older results carry it themselves
+        "video_link": result.get("video_link") or document.get("scheduled_video_link")
+    }
+    if include_qna:
+        row["qna"] = result.get("qna") or []
+    return row
+
+
+def _text(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return "" if value is None else value
+
+
+def iter_csv(rows):
+    """Encode rows as CSV, one line per yield"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(CSV_COLUMNS)
+    yield buffer.getvalue()
+
+    for row in rows:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerow([_text(row.get(column)) for column in CSV_COLUMNS])
+        yield buffer.getvalue()
+
+
+def iter_ndjson(rows):
+    """Encode rows as newline-delimited JSON"""
+    for row in rows:
+        yield json.dumps(row, default=_text) + "\n"
+
+
+def iter_gzip(chunks):
+    """Gzip a stream of text chunks without holding the whole output"""
+    # wbits=31 writes a gzip header and trailer rather than raw zlib
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    pending = []
+    size = 0
+
+    for chunk in chunks:
+        data = chunk.encode("utf-8")
+        pending.append(data)
+        size += len(data)
+        if size >= EXPORT_GZIP_FLUSH_BYTES:
+            compressed = compressor.compress(b"".join(pending))
+            pending, size = [], 0
+            if compressed:
+                yield compressed
+
+    compressed = compressor.compress(b"".join(pending))
+    if compressed:
+        yield compressed
+    yield compressor.flush()
+
+
+def _mark_failures(chunks, fmt):
+    """Pass chunks through; on an error, end the output with a marker line
+
+    By then the 200 and the headers have been sent, so the marker is what
+    tells a reader (or a script) that the export is incomplete.
+    """
+    try:
+        yield from chunks
+    except Exception as e:
+        logger.exception("Export failed mid-stream: %s", e)
+        if fmt == "ndjson":
+            yield json.dumps({"error": f"export incomplete: {e}"}) + "\n"
+        else:
+            yield f"# export incomplete: {e}\r\n"
+
+
+def export_stream(fmt="csv", gzip=False, include_qna=False, statuses=None, start_from=None, start_to=None):
+    """Chunks of the export in the requested format (bytes when gzip, else text)
+
+    qna only fits the nested NDJSON format, so it is ignored for CSV.
+    Raises if the export cannot start; later errors end the stream with
+    a marker line.
+    """
+    rows = iter_export_documents(statuses, start_from, start_to, include_qna and fmt == "ndjson")
+    chunks = _mark_failures(iter_csv(rows) if fmt == "csv" else iter_ndjson(rows), fmt)
+    return iter_gzip(chunks) if gzip else chunks
@@ -0,0 +1,287 @@
+import logging
+import os
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pymongo import ReturnDocument
+
+logger = logging.getLogger(__name__)
+
+SESSION_BACKEND = os.getenv('SESSION_BACKEND', 'auto')  # auto | memory | mongo
+SESSION_TTL_SECONDS = int(os.getenv('SESSION_TTL_SECONDS', 4 * 60 * 60))
+SESSION_MAX_ENTRIES = int(os.getenv('SESSION_MAX_ENTRIES', 1000))
+
+
+class SessionStore(ABC):
+    """Interface for interview session storage"""
+
+    @abstractmethod
+    def create(self, interview_id, questions):
+        """Start a new session with the given questions"""
+
+    @abstractmethod
+    def get(self, interview_id):
+        """Return {"questions", "current_index", "qna"} or None"""
+
+    @abstractmethod
+    def next_question(self, interview_id):
+        """Atomically hand out the next question, or None if there is no session"""
+
+    @abstractmethod
+    def append_answer(self, interview_id, qa):
+        """Atomically append a Q&A pair and return its index, or None if there is no session"""
+
+    @abstractmethod
+    def set_answer_score(self, interview_id, index, score):
+        """Attach a score to the answer at the given index"""
+
+    @abstractmethod
+    def delete(self, interview_id):
+        """Remove a session"""
+
+    def delete_many(self, interview_ids):
+        """Remove several sessions"""
+        for interview_id in interview_ids:
+            self.delete(interview_id)
+
+
+def _question_payload(questions, index):
+    """Build the next-question result for a given index"""
+    if index >= len(questions):
+        return {"done": True, "question": ""}
+
+    return {
+        "done": False,
+        "question": questions[index],
+        "questionNumber": index + 1,
+        "totalQuestions": len(questions)
+    }
+
+
+class MemorySessionStore(SessionStore):
+    """In-process LRU store with a sliding TTL"""
+
+    def __init__(self, max_entries=SESSION_MAX_ENTRIES, ttl_seconds=SESSION_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _touch(self, interview_id):
+        """Return a live session and mark it recently used (lock must be held)"""
+        entry = self._sessions.get(interview_id)
+        if entry is None:
+            return None
+
+        expires_at, session = entry
+        now = time.monotonic()
+        if expires_at < now:
+            del self._sessions[interview_id]
+            return None
+
+        self._sessions[interview_id] = (now + self.ttl_seconds, session)
+        self._sessions.move_to_end(interview_id)
+        return session
+
+    def _evict(self):
+        """Drop expired sessions, then the least recently used ones (lock must be held)"""
+        now = time.monotonic()
+        while self._sessions:
+            oldest_id, (expires_at, _) = next(iter(self._sessions.items()))
+            if expires_at >= now and len(self._sessions) <= self.max_entries:
+                break
+            del self._sessions[oldest_id]
+
+    def create(self, interview_id, questions):
+        with self._lock:
+            self._sessions[interview_id] = (
+                time.monotonic() + self.ttl_seconds,
+                {"questions": list(questions), "current_index": 0, "qna": []}
+            )
+            self._sessions.move_to_end(interview_id)
+            self._evict()
+
+    def get(self, interview_id):
+        with self._lock:
+            session = self._touch(interview_id)
+            if session is None:
+                return None
+            return {
+                "questions": list(session["questions"]),
+                "current_index": session["current_index"],
+                "qna": [dict(qa) for qa in session["qna"]]
+            }
+
+    def next_question(self, interview_id):
+        with self._lock:
+            session = self._touch(interview_id)
+            if session is None:
+                return None
+
+            index = session["current_index"]
+            if index < len(session["questions"]):
+                session["current_index"] += 1
+            return _question_payload(session["questions"], index)
+
+    def append_answer(self, interview_id, qa):
+        with self._lock:
+            session = self._touch(interview_id)
+            if session is None:
+                return None
+            session["qna"].append(dict(qa))
+            return len(session["qna"]) - 1
+
+    def set_answer_score(self, interview_id, index, score):
+        with self._lock:
+            session = self._touch(interview_id)
+            if session is None or index >= len(session["qna"]):
+                return
+            session["qna"][index] = dict(session["qna"][index], score=score)
+
+    def delete(self, interview_id):
+        with self._lock:
+            self._sessions.pop(interview_id, None)
+
+
+class MongoSessionStore(SessionStore):
+    """Shared store backed by a Mongo collection with a TTL index"""
+
+    def __init__(self, collection, ttl_seconds=SESSION_TTL_SECONDS):
+        self.collection = collection
+        self.ttl_seconds = ttl_seconds
+        # Index builds are idempotent; don't hold up the first request on them
+        threading.Thread(target=self._ensure_indexes, name="session-indexes", daemon=True).start()
+
+    def _ensure_indexes(self):
+        try:
+            self.collection.create_index("interview_id", unique=True)
+            self.collection.create_index("expires_at", expireAfterSeconds=0)
+        except Exception as e:
+            logger.error("Error creating session store indexes: %s", e)
+
+    def _expires_at(self):
+        return datetime.utcnow() + timedelta(seconds=self.ttl_seconds)
+
+    def create(self, interview_id, questions):
+        self.collection.replace_one(
+            {"interview_id": interview_id},
+            {
+                "interview_id": interview_id,
+                "questions": list(questions),
+                "question_count": len(questions),
+                "current_index": 0,
+                "qna": [],
+                "answer_count": 0,
+                "expires_at": self._expires_at()
+            },
+            upsert=True
+        )
+
+    def get(self, interview_id):
+        session = self.collection.find_one(
+            {"interview_id": interview_id},
+            {"_id": 0, "questions": 1, "current_index": 1, "qna": 1}
+        )
+        if session is None:
+            return None
+        return {
+            "questions": session.get("questions", []),
+            "current_index": session.get("current_index", 0),
+            "qna": session.get("qna", [])
+        }
+
+    def next_question(self, interview_id):
+        # Increment only while questions remain, and read the pre-increment index
+        session = self.collection.find_one_and_update(
+            {
+                "interview_id": interview_id,
+                "$expr": {"$lt": ["$current_index", "$question_count"]}
+            },
+            {
+                "$inc": {"current_index": 1},
+                "$set": {"expires_at": self._expires_at()}
+            },
+            projection={"_id": 0, "questions": 1, "current_index": 1},
+            return_document=ReturnDocument.BEFORE
+        )
+
+        if session is not None:
+            return _question_payload(session["questions"], session["current_index"])
+
+        exists = self.collection.find_one({"interview_id": interview_id}, {"_id": 1})
+        if exists is None:
+            return None
+        return {"done": True, "question": ""}
+
+    def append_answer(self, interview_id, qa):
+        # answer_count moves with the $push, so it gives the new answer's index
+        session = self.collection.find_one_and_update(
+            {"interview_id": interview_id},
+            {
+                "$push": {"qna": qa},
+                "$inc": {"answer_count": 1},
+                "$set": {"expires_at": self._expires_at()}
+            },
+            projection={"_id": 0, "answer_count": 1},
+            return_document=ReturnDocument.AFTER
+        )
+        if session is None:
+            return None
+        return session["answer_count"] - 1
+
+    def set_answer_score(self, interview_id, index, score):
+        self.collection.update_one(
+            {"interview_id": interview_id},
+            {"$set": {f"qna.{int(index)}.score": score}}
+        )
+
+    def delete(self, interview_id):
+        self.collection.delete_one({"interview_id": interview_id})
+
+    def delete_many(self, interview_ids):
+        self.collection.delete_many({"interview_id": {"$in": list(interview_ids)}})
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_session_store():
+    """Return the configured session store, creating it on first use"""
+    global _store
+
+    if _store is not None:
+        return _store
+
+    with _store_lock:
+        if _store is None:
+            _store = _create_store()
+    return _store
+
+
+def _create_store():
+    from services.mongodb_service import get_collection
+
+    if SESSION_BACKEND in ('auto', 'mongo'):
+        collection = get_collection("interview_sessions")
+        if collection is not None:
+            try:
+                store = MongoSessionStore(collection)
+                logger.info("Using MongoDB session store")
+                return store
+            except Exception as e:
+                logger.error("Error initializing MongoDB session store: %s", e)
+
+        if SESSION_BACKEND == 'mongo':
+            logger.warning("MongoDB session store unavailable, falling back to memory")
+
+    logger.info("Using in-memory session store")
+    return MemorySessionStore()
@@ -0,0 +1,95 @@
+import logging
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytz
+
+from utils.helpers import parse_iso_datetime
+
+logger = logging.getLogger(__name__)
+
+STATUS_CACHE_TTL_SECONDS = float(os.getenv('STATUS_CACHE_TTL_SECONDS', 5))
+STATUS_CACHE_SIZE = int(os.getenv('STATUS_CACHE_SIZE', 5000))
+
+UTC = pytz.utc
+IST = pytz.timezone("Asia/Kolkata")
+
+# Each worker keeps its own cache. invalidate() only reaches this process;
+# the other workers pick up a change when their entry's short TTL runs out.
+# That is safe because starting an interview is guarded by the atomic
+# scheduled -> started update in generate-questions, not by this cache.
+_entries = OrderedDict()
+_lock = threading.Lock()
+
+
+def _to_utc(value):
+    """Normalize a stored start/end time to an aware UTC datetime"""
+    if isinstance(value, str):
+        return parse_iso_datetime(value)
+    if isinstance(value, datetime) and value.tzinfo is None:
+        return UTC.localize(value)
+    return value
+
+
+def _prepare(interview):
+    """Precompute the time fields the status endpoint needs"""
+    start_time = _to_utc(interview.get("start_time"))
+    end_time = _to_utc(interview.get("end_time"))
+
+    return dict(
+        interview,
+        start_time=start_time,
+        end_time=end_time,
+        start_time_ist=start_time.astimezone(IST).strftime('%d %b %Y, %I:%M %p IST') if start_time else None
+    )
+
+
+def _drop(interview_ids):
+    with _lock:
+        for interview_id in interview_ids:
+            _entries.pop(interview_id, None)
+
+
+def get_status_doc(interview_id):
+    """Read-through cache of the projected status fields for an interview"""
+    now = time.monotonic()
+
+    with _lock:
+        entry = _entries.get(interview_id)
+        if entry is not None and entry[0] > now:
+            _entries.move_to_end(interview_id)
+            return entry[1]
+
+    from services.mongodb_service import get_interview_status_fields
+
+    interview = get_interview_status_fields(interview_id)
+    if interview is None:
+        return None
+
+    interview = _prepare(interview)
+
+    with _lock:
+        _entries[interview_id] = (now + STATUS_CACHE_TTL_SECONDS, interview)
+        _entries.move_to_end(interview_id)
+        while len(_entries) > STATUS_CACHE_SIZE:
+            _entries.popitem(last=False)
+
+    return interview
+
+
+def invalidate(interview_id):
+    """Drop the cached status for an interview after its status changes"""
+    invalidate_many([interview_id])
+
+
+def invalidate_many(interview_ids):
+    """Drop cached statuses for several interviews"""
+    _drop(interview_ids)
@@ -0,0 +1,324 @@
+import logging
+import os
+import sys
+import queue
+import random
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pymongo import ReturnDocument
+
+from services.recording_storage import save_recording
+from services import status_cache
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_WORKERS = int(os.getenv('UPLOAD_WORKERS', 2))
+UPLOAD_QUEUE_SIZE = int(os.getenv('UPLOAD_QUEUE_SIZE', 50))
+UPLOAD_MAX_ATTEMPTS = int(os.getenv('UPLOAD_MAX_ATTEMPTS', 4))
+UPLOAD_RETRY_BASE_SECONDS = float(os.getenv('UPLOAD_RETRY_BASE_SECONDS', 2))
+
+UPLOAD_JOB_BACKEND = os.getenv('UPLOAD_JOB_BACKEND', 'auto')  # auto | memory | mongo
+# Jobs stay visible to /upload-status this long (Mongo TTL index)
+UPLOAD_JOB_TTL_SECONDS = int(os.getenv('UPLOAD_JOB_TTL_SECONDS', 24 * 60 * 60))
+
+# Finished jobs kept around for /upload-status lookups (memory store)
+MAX_TRACKED_JOBS = 1000
+
+
+class UploadQueueFull(Exception):
+    """Raised when no more uploads can be accepted"""
+
+
+class MemoryJobStore:
+    """Job state in this process only; used when MongoDB is not connected"""
+
+    def __init__(self, max_jobs=MAX_TRACKED_JOBS):
+        self.max_jobs = max_jobs
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def insert(self, job):
+        with self._lock:
+            self._jobs[job["job_id"]] = dict(job)
+            self._prune()
+
+    def get(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def update(self, job_id, fields):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            job.update(fields)
+            return dict(job)
+
+    def delete(self, job_id):
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+    def _prune(self):
+        """Drop the oldest finished jobs once too many are tracked"""
+        excess = len(self._jobs) - self.max_jobs
+        if excess <= 0:
+            return
+        finished = [
+            job_id for job_id, job in self._jobs.items()
+            if job["status"] in ("succeeded", "failed")
+        ]
+        for job_id in finished[:excess]:
+            del self._jobs[job_id]
+
+
+class MongoJobStore:
+    """Job state shared by every worker, expired by a TTL index
+
+    The upload itself runs on the worker that spooled the file, but the
+    /upload-status poll can land on any worker.
+    """
+
+    PROJECTION = {"_id": 0, "expires_at": 0}
+
+    def __init__(self, collection, ttl_seconds=UPLOAD_JOB_TTL_SECONDS):
+        self.collection = collection
+        self.ttl_seconds = ttl_seconds
+        # Index builds are idempotent; don't hold up the first upload on them
+        threading.Thread(target=self._ensure_indexes, name="upload-job-indexes", daemon=True).start()
+
+    def _ensure_indexes(self):
+        try:
+            self.collection.create_index("expires_at", expireAfterSeconds=0)
+        except Exception as e:
+            logger.error("Error creating upload job index: %s", e)
+
+    def insert(self, job):
+        document = dict(job, _id=job["job_id"])
+        document["expires_at"] = datetime.utcnow() + timedelta(seconds=self.ttl_seconds)
+        self.collection.insert_one(document)
+
+    def get(self, job_id):
+        return self.collection.find_one({"_id": job_id}, self.PROJECTION)
+
+    def update(self, job_id, fields):
+        return self.collection.find_one_and_update(
+            {"_id": job_id},
+            {"$set": fields},
+            projection=self.PROJECTION,
+            return_document=ReturnDocument.AFTER
+        )
+
+    def delete(self, job_id):
+        self.collection.delete_one({"_id": job_id})
+
+
+def create_job_store():
+    """Mongo-backed job store when configured and connected, memory otherwise"""
+    from services.mongodb_service import get_collection
+
+    if UPLOAD_JOB_BACKEND in ('auto', 'mongo'):
+        collection = get_collection("upload_jobs")
+        if collection is not None:
+            try:
+                store = MongoJobStore(collection)
+                logger.info("Using MongoDB upload job store")
+                return store
+            except Exception as e:
+                logger.error("Error initializing MongoDB upload job store: %s", e)
+
+        if UPLOAD_JOB_BACKEND == 'mongo':
+            logger.warning("MongoDB upload job store unavailable, falling back to memory")
+
+    logger.info("Using in-memory upload job store")
+    return MemoryJobStore()
+
+
+class UploadQueue:
+    """Bounded worker pool that stores spooled recordings in the background"""
+
+    def __init__(self, upload_fn=save_recording, on_finished=None,
+                 workers=UPLOAD_WORKERS, maxsize=UPLOAD_QUEUE_SIZE,
+                 max_attempts=UPLOAD_MAX_ATTEMPTS, retry_base=UPLOAD_RETRY_BASE_SECONDS,
+                 job_store=None):
+        self.upload_fn = upload_fn
+        self.on_finished = on_finished
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self._queue = queue.Queue(maxsize=maxsize)
+        # Created on first use (see jobs) so importing stays off the network
+        self._job_store = job_store
+        self._lock = threading.Lock()
+        self._threads = []
+
+    @property
+    def jobs(self):
+        if self._job_store is None:
+            with self._lock:
+                if self._job_store is None:
+                    self._job_store = create_job_store()
+        return self._job_store
+
+    def submit(self, file_path, filename, interview_id):
+        """Queue a spooled file for upload and return its job id"""
+        self._ensure_workers()
+
+        job_id = str(uuid.uuid4())
+        job = {
+            "job_id": job_id,
+            "interview_id": interview_id,
+            "filename": filename,
+            "status": "queued",  # queued | running | retrying | succeeded | failed
+            "attempts": 0,
+            "file_id": None,
+            "file_link": None,
+            "backend": None,
+            "error": None,
+            "created_at": datetime.utcnow().isoformat(),
+            "finished_at": None
+        }
+
+        self.jobs.insert(job)
+
+        try:
+            self._queue.put_nowait((job_id, file_path))
+        except queue.Full:
+            self.jobs.delete(job_id)
+            raise UploadQueueFull("Upload queue is full")
+
+        return job_id
+
+    def get_job(self, job_id):
+        """Return a snapshot of a job, or None if unknown"""
+        return self.jobs.get(job_id)
+
+    def _ensure_workers(self):
+        """Start worker threads on first use"""
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                thread = threading.Thread(
+                    target=self._run,
+                    name=f"upload-worker-{i}",
+                    daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def _update(self, job_id, **fields):
+        return self.jobs.update(job_id, fields)
+
+    def _run(self):
+        while True:
+            job_id, file_path = self._queue.get()
+            try:
+                self._process(job_id, file_path)
+            except Exception as e:
+                logger.exception("Upload job %s crashed: %s", job_id, e)
+                self._update(job_id, status="failed", error=str(e),
+                             finished_at=datetime.utcnow().isoformat())
+            finally:
+                self._queue.task_done()
+
+    def _process(self, job_id, file_path):
+        job = self.get_job(job_id)
+        if not job:
+            return
+
+        result = None
+        try:
+            for attempt in range(1, self.max_attempts + 1):
+                self._update(job_id, status="running", attempts=attempt)
+
+                try:
+                    result = self.upload_fn(file_path, job["filename"])
+                except Exception as e:
+                    logger.error("Upload attempt %d failed for job %s: %s", attempt, job_id, e,
+                                 extra={"interview_id": job["interview_id"]})
+                    result = None
+
+                if result and result.get('id'):
+                    break
+
+                if attempt < self.max_attempts:
+                    delay = self.retry_base * (2 ** (attempt - 1))
+                    delay += random.uniform(0, delay / 2)
+                    self._update(job_id, status="retrying")
+                    logger.warning("Retrying upload job %s in %.1fs", job_id, delay,
+                                   extra={"interview_id": job["interview_id"]})
+                    time.sleep(delay)
+        finally:
+            try:
+                os.remove(file_path)
+            except OSError:
+                pass
+
+        if result and result.get('id'):
+            fields = {
+                "status": "succeeded",
+                "file_id": result.get('id'),
+                "file_link": result.get('webViewLink'),
+                "backend": result.get('backend'),
+                "finished_at": datetime.utcnow().isoformat()
+            }
+            logger.info("Upload job %s finished: %s", job_id, result.get('id'),
+                        extra={"interview_id": job["interview_id"]})
+        else:
+            fields = {
+                "status": "failed",
+                "error": "Failed to store video",
+                "finished_at": datetime.utcnow().isoformat()
+            }
+            logger.error("Upload job %s failed after %d attempts", job_id, self.max_attempts,
+                         extra={"interview_id": job["interview_id"]})
+
+        finished = self._update(job_id, **fields)
+        if finished is None:
+            # The job record expired or was removed during the upload; the
+            # interview still has to be finished from what submit() stored
+            logger.warning("Upload job %s no longer tracked", job_id,
+                           extra={"interview_id": job["interview_id"]})
+            finished = dict(job, **fields)
+
+        if self.on_finished:
+            self.on_finished(finished)
+
+
+def mark_interview_completed(job):
+    """Move the interview to completed once its recording has been handled"""
+    from services.mongodb_service import scheduled_interviews
+
+    if scheduled_interviews is None:
+        return
+
+    update = {
+        "interview_status": "completed",
+        "completed_at": datetime.utcnow()
+    }
+    if job.get("file_id"):
+        update["recording_id"] = job["file_id"]
+        update["recording_backend"] = job.get("backend")
+    if job.get("file_link"):
+        update["video_link"] = job["file_link"]
+
+    try:
+        scheduled_interviews.update_one(
+            {"interview_id": job["interview_id"]},
+            {"$set": update}
+        )
+        status_cache.invalidate(job["interview_id"])
+    except Exception as e:
+        logger.error("Error marking interview completed: %s", e, extra={"interview_id": job["interview_id"]})
+
+
+upload_queue = UploadQueue(on_finished=mark_interview_completed)
@@ -1,8 +1,16 @@
 from datetime import datetime
+import logging
+import os
+import tempfile
 import pytz
 
+logger = logging.getLogger(__name__)
+
 UTC = pytz.utc
 
+# Size of each read when spooling request bodies to disk
+SPOOL_CHUNK_SIZE = 1024 * 1024
+
 def parse_iso_datetime(date_string):
     """Parse ISO format datetime string to UTC"""
     try:
@@ -25,7 +33,7 @@ def parse_iso_datetime(date_string):
         return dt.astimezone(UTC)
 
     except Exception as e:
-        print(f"❌ Datetime parse error: {e}")
+        logger.warning("Datetime parse error: %s", e)
         return None
 
 
@@ -41,15 +49,15 @@ def validate_schedule_data(data):
     
     for field, field_type in required_fields.items():
         if field not in data:
-            print(f"Missing field: {field}")
+            logger.info("Missing field: %s", field)
             return False
         
         if not isinstance(data[field], field_type):
-            print(f"Invalid type for {field}")
+            logger.info("Invalid type for %s", field)
             return False
         
         if isinstance(data[field], str) and not data[field].strip():
-            print(f"Empty field: {field}")
+            logger.info("Empty field: %s", field)
             return False
     
     return True
@@ -62,6 +70,31 @@ def validate_email(email):
     return re.match(pattern, email) is not None
 
 
+def parse_byte_range(header, size):
+    """Parse a single-range Range header into inclusive (start, end) offsets
+
+    Returns None when there is no usable single byte range (the whole body
+    is sent) and raises ValueError when the range cannot be satisfied.
+    """
+    if not header or not header.startswith('bytes=') or ',' in header:
+        return None
+
+    start_text, _, end_text = header[len('bytes='):].strip().partition('-')
+    try:
+        if start_text:
+            start = int(start_text)
+            end = min(int(end_text), size - 1) if end_text else size - 1
+        else:
+            # Suffix range: the last N bytes
+            start, end = max(size - int(end_text), 0), size - 1
+    except ValueError:
+        return None
+
+    if start > end or start >= size:
+        raise ValueError("Range not satisfiable")
+    return start, end
+
+
 def get_time_remaining(start_time, current_time=None):
     """Get remaining time in seconds until interview start"""
     if current_time is None:
@@ -74,4 +107,23 @@ def get_time_remaining(start_time, current_time=None):
         start_time = UTC.localize(start_time)
     
     difference = start_time - current_time
-    return max(0, int(difference.total_seconds()))
\ No newline at end of file
+    return max(0, int(difference.total_seconds()))
+
+
+def spool_to_tempfile(stream, suffix='', chunk_size=SPOOL_CHUNK_SIZE):
+    """Copy a stream to a temp file in fixed-size chunks and return its path"""
+    spool_dir = os.getenv('UPLOAD_SPOOL_DIR') or None
+    fd, path = tempfile.mkstemp(suffix=suffix, prefix='upload_', dir=spool_dir)
+
+    try:
+        with os.fdopen(fd, 'wb') as out:
+            while True:
+                chunk = stream.read(chunk_size)
+                if not chunk:
+                    break
+                out.write(chunk)
+    except Exception:
+        os.remove(path)
+        raise
+
+    return path
@@ -0,0 +1,74 @@
+"""
+The backend Flask app wired to local stand-ins, for benchmarks.
+
+Serve it with gunicorn (from backend/):
+    BENCH_MONGO=mock gunicorn --chdir scripts -w 1 --threads 8 bench_app:app
+
+Environment:
+    BENCH_MONGO              "mock" for an in-process mongomock database, or
+                             "uri" to use MONGODB_URI (e.g. a local mongod)
+    BENCH_DRIVE_LATENCY_MS   simulated Google Drive upload time (default 300)
+    BENCH_MONGO_LATENCY_MS   simulated network round trip added to every
+                             mongomock find/find_one (default 0)
+    OPENAI_BASE_URL          the fake OpenAI server from fake_openai.py
+
+mongomock lives inside one process, so multi-worker gunicorn runs need
+BENCH_MONGO=uri; otherwise workers cannot see each other's interviews.
+The mock mode needs `pip install mongomock` (not a runtime dependency).
+"""
+import os
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "api"))
+
+BENCH_MONGO = os.getenv("BENCH_MONGO", "mock")
+BENCH_DRIVE_LATENCY_MS = float(os.getenv("BENCH_DRIVE_LATENCY_MS", 300))
+BENCH_MONGO_LATENCY_MS = float(os.getenv("BENCH_MONGO_LATENCY_MS", 0))
+
+os.environ.setdefault("OPENAI_API_KEY", "bench")
+os.environ.setdefault("DB_NAME", "ai_interviewer_bench")
+os.environ.setdefault("EMAIL_OUTBOX_SENDER", "false")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+if BENCH_MONGO == "mock":
+    import mongomock
+    import pymongo
+
+    # mongodb_service does `from pymongo import MongoClient` at import time
+    pymongo.MongoClient = mongomock.MongoClient
+    os.environ["MONGODB_URI"] = "mongodb://bench.invalid"
+    # The Mongo session store relies on $expr updates mongomock does not cover
+    os.environ.setdefault("SESSION_BACKEND", "memory")
+
+    if BENCH_MONGO_LATENCY_MS:
+        # mongomock answers in-process; a real server costs a round trip per read
+        _find = mongomock.collection.Collection.find
+
+        def _slow_find(self, *args, **kwargs):
+            time.sleep(BENCH_MONGO_LATENCY_MS / 1000)
+            return _find(self, *args, **kwargs)
+
+        mongomock.collection.Collection.find = _slow_find
+elif not os.getenv("MONGODB_URI"):
+    sys.exit("BENCH_MONGO=uri requires MONGODB_URI")
+
+
+def fake_drive_upload(file_path, filename, folder_id=None, mimetype='video/webm'):
+    """Read the spooled file and pretend to upload it"""
+    with open(file_path, 'rb') as f:
+        while f.read(1024 * 1024):
+            pass
+    time.sleep(BENCH_DRIVE_LATENCY_MS / 1000)
+    file_id = uuid.uuid4().hex
+    return {'id': file_id, 'webViewLink': f"https://drive.invalid/{file_id}"}
+
+
+from index import app  # noqa: E402
+from services.upload_queue import upload_queue  # noqa: E402
+
+upload_queue.upload_fn = fake_drive_upload
+
+__all__ = ["app"]
@@ -0,0 +1,91 @@
+"""
+Compare Google Drive client setup cost: rebuilt per call vs cached.
+
+Usage (from backend/):
+    python scripts/bench_drive_client.py --iterations 20
+    python scripts/bench_drive_client.py --iterations 20 --fake-credentials
+
+Needs the Google client libraries, and api/oauth_credentials.json unless
+--fake-credentials is given; that signs with a throwaway service-account
+key instead. Only client construction is timed: no token is fetched and no
+files are uploaded, so neither mode touches the network.
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "api"))
+
+from services import drive_service
+
+
+def time_calls(fn, iterations):
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def use_fake_credentials():
+    """Load credentials from a freshly generated service-account key"""
+    import rsa
+    from google.oauth2 import service_account
+
+    _, private_key = rsa.newkeys(2048)
+    info = {
+        "type": "service_account",
+        "project_id": "bench",
+        "private_key_id": "bench",
+        "private_key": private_key.save_pkcs1().decode(),
+        "client_email": "bench@bench.iam.gserviceaccount.com",
+        "client_id": "0",
+        "token_uri": "https://oauth2.googleapis.com/token"
+    }
+    drive_service._load_credentials = lambda: service_account.Credentials.from_service_account_info(
+        info, scopes=drive_service.SCOPES
+    )
+
+
+def report(label, timings):
+    print(f"{label:<10} mean {statistics.mean(timings):8.2f} ms   "
+          f"median {statistics.median(timings):8.2f} ms   "
+          f"max {max(timings):8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--fake-credentials", action="store_true",
+                        help="use a generated service-account key instead of oauth_credentials.json")
+    args = parser.parse_args()
+
+    if not drive_service.google_libs_available():
+        sys.exit("Google client libraries are not installed")
+
+    if args.fake_credentials:
+        use_fake_credentials()
+
+    def per_call():
+        service, credentials = drive_service.build_drive_service()
+        if service is None:
+            sys.exit("Drive credentials not available")
+
+    def cached():
+        drive_service.get_drive_service()
+        drive_service.get_thread_http()
+
+    per_call_timings = time_calls(per_call, args.iterations)
+
+    drive_service.invalidate_drive_service()
+    cached_timings = time_calls(cached, args.iterations)
+
+    report("per-call", per_call_timings)
+    report("cached", cached_timings)
+
+
+if __name__ == "__main__":
+    main()
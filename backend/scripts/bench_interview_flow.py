@@ -0,0 +1,345 @@
+"""
+End-to-end benchmark of the interview flow against local stand-ins.
+
+Every virtual candidate runs the full lifecycle: schedule, status,
+generate-questions, next-question and submit-answer for each question,
+upload-video, then evaluate. MongoDB is mongomock (or a local mongod via
+--mongo uri and MONGODB_URI), OpenAI is scripts/fake_openai.py and Drive
+is a sleep (see scripts/bench_app.py).
+
+Usage (from backend/):
+    python scripts/bench_interview_flow.py --users 50 --concurrency 1,5,10
+    python scripts/bench_interview_flow.py --server gunicorn --workers 1,2 --threads 4,8 \\
+        --mongo uri --save-baseline bench_baseline.json
+    python scripts/bench_interview_flow.py --baseline bench_baseline.json --tolerance 0.2
+
+Reports p50/p95/p99 latency and throughput per endpoint for every
+configuration. With --baseline, exits non-zero if any endpoint's p95
+got slower than the baseline by more than the tolerance.
+"""
+import argparse
+import itertools
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+
+class Recorder:
+    """Collects per-endpoint latencies from many threads"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = {}
+        self.errors = {}
+
+    def add(self, endpoint, ms, ok):
+        with self._lock:
+            self.samples.setdefault(endpoint, []).append(ms)
+            if not ok:
+                self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def call(recorder, endpoint, method, url, body=None, headers=None):
+    """Send one request, record its latency and return (status, parsed JSON)"""
+    data = None
+    headers = dict(headers or {})
+    if isinstance(body, (dict, list)):
+        data = json.dumps(body).encode()
+        headers["Content-Type"] = "application/json"
+    elif body is not None:
+        data = body
+
+    request = urllib.request.Request(url, data=data, headers=headers, method=method)
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=120) as response:
+            status, raw = response.status, response.read()
+    except urllib.error.HTTPError as e:
+        status, raw = e.code, e.read()
+    except OSError:
+        status, raw = 0, b""
+    recorder.add(endpoint, (time.perf_counter() - start) * 1000, 200 <= status < 300)
+
+    try:
+        return status, json.loads(raw or b"null")
+    except ValueError:
+        return status, None
+
+
+def multipart(fields, file_field, filename, content):
+    """Encode a multipart/form-data body"""
+    boundary = uuid.uuid4().hex
+    parts = []
+    for name, value in fields.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode()
+        )
+    parts.append(
+        f'--{boundary}\r\nContent-Disposition: form-data; name="{file_field}"; '
+        f'filename="{filename}"\r\nContent-Type: video/webm\r\n\r\n'.encode()
+    )
+    parts.append(content)
+    parts.append(f"\r\n--{boundary}--\r\n".encode())
+    return b"".join(parts), {"Content-Type": f"multipart/form-data; boundary={boundary}"}
+
+
+def run_flow(base_url, recorder, answers, video):
+    """Drive one candidate through the whole interview"""
+    now = datetime.now(timezone.utc)
+    status, body = call(recorder, "POST /schedule", "POST", f"{base_url}/api/scheduler/schedule", {
+        "candidateName": "Bench Candidate",
+        "candidateEmail": f"bench-{uuid.uuid4().hex[:8]}@example.com",
+        "jobDescription": "Backend engineer: Python, Flask, MongoDB, REST APIs, caching.",
+        "startTime": (now - timedelta(minutes=1)).isoformat(),
+        "endTime": (now + timedelta(hours=1)).isoformat()
+    })
+    if status != 201:
+        return False
+    interview_id = body["interviewId"]
+
+    call(recorder, "GET /status", "GET", f"{base_url}/api/scheduler/status?id={interview_id}")
+
+    status, body = call(recorder, "POST /generate-questions", "POST",
+                        f"{base_url}/api/interviews/generate-questions",
+                        {"jd": "Backend engineer: Python, Flask, MongoDB, REST APIs, caching.",
+                         "interview_id": interview_id})
+    if status != 200:
+        return False
+
+    for _ in range(answers):
+        status, body = call(recorder, "GET /next-question", "GET",
+                            f"{base_url}/api/interviews/next-question/{interview_id}")
+        if status != 200 or body.get("done"):
+            break
+        call(recorder, "POST /submit-answer", "POST",
+             f"{base_url}/api/interviews/submit-answer/{interview_id}",
+             {"question": body["question"], "answer": "A reasonably detailed benchmark answer."})
+
+    payload, headers = multipart(
+        {"candidate_name": "Bench Candidate", "candidate_email": "bench@example.com"},
+        "video", "interview.webm", video
+    )
+    call(recorder, "POST /upload-video", "POST",
+         f"{base_url}/api/interviews/upload-video/{interview_id}", payload, headers)
+
+    status, _ = call(recorder, "GET /evaluate", "GET", f"{base_url}/api/interviews/evaluate/{interview_id}")
+    return status == 200
+
+
+def run_load(base_url, users, concurrency, answers, video):
+    recorder = Recorder()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        outcomes = list(pool.map(lambda _: run_flow(base_url, recorder, answers, video), range(users)))
+    elapsed = time.perf_counter() - start
+
+    endpoints = {}
+    for endpoint, samples in recorder.samples.items():
+        samples.sort()
+        endpoints[endpoint] = {
+            "count": len(samples),
+            "errors": recorder.errors.get(endpoint, 0),
+            "p50_ms": round(percentile(samples, 50), 2),
+            "p95_ms": round(percentile(samples, 95), 2),
+            "p99_ms": round(percentile(samples, 99), 2),
+            "req_per_s": round(len(samples) / elapsed, 2)
+        }
+
+    return {
+        "flows": users,
+        "flows_failed": outcomes.count(False),
+        "flows_per_s": round(users / elapsed, 2),
+        "elapsed_s": round(elapsed, 2),
+        "endpoints": endpoints
+    }
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_until_up(base_url, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"{base_url}/api/health", timeout=2):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server at {base_url} did not come up")
+
+
+def start_inprocess():
+    """Serve bench_app on a threaded werkzeug server in this process"""
+    from werkzeug.serving import make_server
+
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    from bench_app import app
+
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, name="bench-server", daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    wait_until_up(base_url)
+    return base_url, server.shutdown
+
+
+def start_gunicorn(workers, threads, env):
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "--chdir", str(SCRIPTS_DIR),
+         "-w", str(workers), "--threads", str(threads),
+         "-b", f"127.0.0.1:{port}", "--log-level", "warning", "bench_app:app"],
+        env=env
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        wait_until_up(base_url)
+    except RuntimeError:
+        process.kill()
+        raise
+
+    def stop():
+        process.terminate()
+        process.wait(timeout=10)
+
+    return base_url, stop
+
+
+def print_report(label, result):
+    print(f"\n== {label}: {result['flows']} flows in {result['elapsed_s']}s "
+          f"({result['flows_per_s']} flows/s, {result['flows_failed']} failed)")
+    print(f"{'endpoint':<26}{'count':>7}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'req/s':>9}")
+    for endpoint, stats in sorted(result["endpoints"].items()):
+        print(f"{endpoint:<26}{stats['count']:>7}{stats['errors']:>8}{stats['p50_ms']:>10.1f}"
+              f"{stats['p95_ms']:>10.1f}{stats['p99_ms']:>10.1f}{stats['req_per_s']:>9.1f}")
+
+
+def compare(results, baseline, tolerance):
+    """Return a list of regressions against a baseline run"""
+    regressions = []
+    for label, result in results.items():
+        previous = baseline.get("results", {}).get(label)
+        if not previous:
+            continue
+        for endpoint, stats in result["endpoints"].items():
+            old = previous["endpoints"].get(endpoint)
+            if old and old["p95_ms"] > 0 and stats["p95_ms"] > old["p95_ms"] * (1 + tolerance):
+                regressions.append(
+                    f"{label} {endpoint}: p95 {old['p95_ms']:.1f} -> {stats['p95_ms']:.1f} ms"
+                )
+    return regressions
+
+
+def int_list(value):
+    return [int(v) for v in value.split(",") if v.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--server", choices=["inprocess", "gunicorn", "external"], default="inprocess")
+    parser.add_argument("--base-url", help="backend URL for --server external")
+    parser.add_argument("--mongo", choices=["mock", "uri"], default="mock",
+                        help="mongomock, or MONGODB_URI (e.g. a local mongod)")
+    parser.add_argument("--users", type=int, default=20, help="interview flows per configuration")
+    parser.add_argument("--concurrency", type=int_list, default=[5], help="e.g. 1,5,10")
+    parser.add_argument("--workers", type=int_list, default=[1], help="gunicorn workers, e.g. 1,2")
+    parser.add_argument("--threads", type=int_list, default=[8], help="gunicorn threads, e.g. 4,8")
+    parser.add_argument("--answers", type=int, default=5)
+    parser.add_argument("--video-kb", type=int, default=512)
+    parser.add_argument("--openai-latency-ms", type=float, default=300)
+    parser.add_argument("--openai-jitter-ms", type=float, default=50)
+    parser.add_argument("--drive-latency-ms", type=float, default=300)
+    parser.add_argument("--save-baseline", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed p95 slowdown (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    if args.server == "external" and not args.base_url:
+        parser.error("--server external requires --base-url")
+    if args.server == "gunicorn" and args.mongo == "mock" and max(args.workers) > 1:
+        parser.error("mongomock is per process; use --mongo uri with more than one worker")
+
+    env = dict(os.environ)
+    if args.server != "external":
+        sys.path.insert(0, str(SCRIPTS_DIR))
+        from fake_openai import start_server
+
+        fake = start_server(latency_ms=args.openai_latency_ms, jitter_ms=args.openai_jitter_ms)
+        env.update({
+            "OPENAI_BASE_URL": f"http://127.0.0.1:{fake.server_address[1]}/v1",
+            "BENCH_MONGO": args.mongo,
+            "BENCH_DRIVE_LATENCY_MS": str(args.drive_latency_ms)
+        })
+        # In-process mode imports bench_app here, so it reads our environment
+        os.environ.update(env)
+
+    video = os.urandom(args.video_kb * 1024)
+    results = {}
+
+    if args.server == "gunicorn":
+        servers = [(f"gunicorn w{w}t{t}", w, t) for w, t in itertools.product(args.workers, args.threads)]
+    else:
+        servers = [(args.server, None, None)]
+
+    for name, workers, threads in servers:
+        if args.server == "gunicorn":
+            base_url, stop = start_gunicorn(workers, threads, env)
+        elif args.server == "inprocess":
+            base_url, stop = start_inprocess()
+        else:
+            base_url, stop = args.base_url.rstrip("/"), lambda: None
+
+        try:
+            for concurrency in args.concurrency:
+                label = f"{name} c{concurrency}"
+                results[label] = run_load(base_url, args.users, concurrency, args.answers, video)
+                print_report(label, results[label])
+        finally:
+            stop()
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "settings": {k: v for k, v in vars(args).items() if k not in ("baseline", "save_baseline")},
+        "results": results
+    }
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved results to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\nNo regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
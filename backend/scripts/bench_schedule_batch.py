@@ -0,0 +1,70 @@
+"""
+Compare scheduling throughput: one request per candidate vs /schedule-batch.
+
+Usage (from backend/, with the API running):
+    python scripts/bench_schedule_batch.py --base-url http://localhost:5000 --count 200
+    python scripts/bench_schedule_batch.py --mode single   # builds without /schedule-batch
+
+Creates real interviews and sends real emails, so point it at a test
+database and a local SMTP sink (e.g. `python -m aiosmtpd -n -l localhost:1025`).
+"""
+import argparse
+import json
+import time
+import urllib.request
+from datetime import datetime, timedelta, timezone
+
+
+def make_rows(count, prefix):
+    start = datetime.now(timezone.utc) + timedelta(days=1)
+    return [
+        {
+            "candidateName": f"{prefix} Candidate {i}",
+            "candidateEmail": f"{prefix.lower()}{i}@example.com",
+            "jobDescription": "Backend engineer: Python, Flask, MongoDB.",
+            "startTime": start.isoformat(),
+            "endTime": (start + timedelta(hours=1)).isoformat()
+        }
+        for i in range(count)
+    ]
+
+
+def post_json(url, payload):
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST"
+    )
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:5000")
+    parser.add_argument("--count", type=int, default=100)
+    parser.add_argument("--mode", choices=["both", "single", "batch"], default="both")
+    args = parser.parse_args()
+
+    single_url = f"{args.base_url}/api/scheduler/schedule"
+    batch_url = f"{args.base_url}/api/scheduler/schedule-batch"
+
+    if args.mode in ("both", "single"):
+        rows = make_rows(args.count, "Single")
+        start = time.perf_counter()
+        for row in rows:
+            post_json(single_url, row)
+        single_elapsed = time.perf_counter() - start
+        print(f"single  {args.count} rows in {single_elapsed:7.2f}s  ({args.count / single_elapsed:8.1f} rows/s)")
+
+    if args.mode in ("both", "batch"):
+        rows = make_rows(args.count, "Batch")
+        start = time.perf_counter()
+        result = post_json(batch_url, rows)
+        batch_elapsed = time.perf_counter() - start
+        print(f"batch   {result['scheduled']} rows in {batch_elapsed:7.2f}s  ({args.count / batch_elapsed:8.1f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
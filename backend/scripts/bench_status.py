@@ -0,0 +1,87 @@
+"""
+Measure /api/scheduler/status throughput against a running server.
+
+Usage (from backend/):
+    python scripts/bench_status.py --id <interview_id> --requests 2000 --concurrency 20
+    BENCH_MONGO=mock QUESTION_PREGEN=false python scripts/bench_status.py --in-process --requests 5000
+
+Run once on the old and once on the new build to compare requests/sec.
+--in-process drives bench_app.py through Flask's test client on one thread,
+so the number is the server's own cost per request, not the HTTP client's;
+it schedules its own interview. Compare the status cache on and off with
+STATUS_CACHE_TTL_SECONDS=0, and add BENCH_MONGO_LATENCY_MS for a network
+round trip.
+"""
+import argparse
+import statistics
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+
+def fetch(url):
+    start = time.perf_counter()
+    with urllib.request.urlopen(url) as response:
+        response.read()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:5000")
+    parser.add_argument("--id", help="interview id to poll")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--in-process", action="store_true",
+                        help="call bench_app.py through Flask's test client instead of over HTTP")
+    args = parser.parse_args()
+
+    if args.in_process:
+        latencies, elapsed = run_in_process(args.requests)
+    else:
+        if not args.id:
+            parser.error("--id is required unless --in-process is given")
+        url = f"{args.base_url}/api/scheduler/status?id={args.id}"
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            latencies = sorted(pool.map(fetch, [url] * args.requests))
+        elapsed = time.perf_counter() - start
+
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"{args.requests / elapsed:8.1f} req/s   "
+          f"median {statistics.median(latencies):6.2f} ms   p95 {p95:6.2f} ms")
+
+
+def run_in_process(requests):
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from bench_app import app
+
+    client = app.test_client()
+    now = datetime.now(timezone.utc)
+    response = client.post("/api/scheduler/schedule", json={
+        "candidateName": "Bench",
+        "candidateEmail": "bench@example.com",
+        "jobDescription": "Backend engineer " * 200,
+        "startTime": (now + timedelta(hours=1)).isoformat(),
+        "endTime": (now + timedelta(hours=2)).isoformat()
+    })
+    url = f"/api/scheduler/status?id={response.get_json()['interviewId']}"
+
+    for _ in range(min(requests, 200)):
+        client.get(url)
+
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(requests):
+        started = time.perf_counter()
+        client.get(url)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return sorted(latencies), time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    main()
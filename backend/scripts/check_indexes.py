@@ -0,0 +1,48 @@
+"""
+Create the MongoDB indexes and check the hot queries for collection scans.
+
+Usage (from backend/):
+    python scripts/check_indexes.py            # ensure indexes, then explain
+    python scripts/check_indexes.py --no-create
+
+Exits with status 1 if any hot query still plans a COLLSCAN.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "api"))
+
+from services import mongodb_service
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--no-create", action="store_true", help="only run the explain() checks")
+    args = parser.parse_args()
+
+    if mongodb_service.db is None:
+        sys.exit("MongoDB not connected")
+
+    if not args.no_create:
+        mongodb_service.ensure_indexes()
+
+    report = mongodb_service.explain_hot_queries()
+    failed = False
+
+    for entry in report:
+        if entry.get("error"):
+            marker = "ERROR"
+            failed = True
+        elif entry["collscan"]:
+            marker = "COLLSCAN"
+            failed = True
+        else:
+            marker = "ok"
+        print(f"{marker:<9} {entry['collection']:<22} {entry['query']:<28} {' > '.join(entry['stages'])}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
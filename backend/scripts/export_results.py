@@ -0,0 +1,59 @@
+"""
+Export interview results joined with schedule data as CSV or NDJSON.
+
+Usage (from backend/):
+    python scripts/export_results.py --format csv --output results.csv
+    python scripts/export_results.py --format ndjson --qna --gzip --output results.ndjson.gz
+    python scripts/export_results.py --from 2026-01-01 --to 2026-02-01 --status completed
+
+Rows are streamed from the aggregation cursor, so memory use does not grow
+with the number of results. Without --output the export goes to stdout.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "api"))
+
+from services import mongodb_service
+from services.results_export import export_stream
+from utils.helpers import parse_iso_datetime
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--format", choices=["csv", "ndjson"], default="csv")
+    parser.add_argument("--output", help="file to write (default: stdout)")
+    parser.add_argument("--gzip", action="store_true", help="gzip the output")
+    parser.add_argument("--qna", action="store_true", help="include questions and answers (NDJSON only)")
+    parser.add_argument("--status", help="comma-separated interview statuses")
+    parser.add_argument("--from", dest="start_from", help="start_time on or after (ISO date)")
+    parser.add_argument("--to", dest="start_to", help="start_time before (ISO date)")
+    args = parser.parse_args()
+
+    if mongodb_service.db is None:
+        sys.exit("MongoDB not connected")
+
+    filters = {
+        "statuses": [s.strip() for s in args.status.split(",")] if args.status else None,
+        "start_from": parse_iso_datetime(args.start_from) if args.start_from else None,
+        "start_to": parse_iso_datetime(args.start_to) if args.start_to else None
+    }
+    chunks = export_stream(args.format, gzip=args.gzip, include_qna=args.qna, **filters)
+
+    if args.output:
+        # csv already writes \r\n line endings, so no newline translation
+        f = open(args.output, "wb") if args.gzip else open(args.output, "w", newline="")
+        with f:
+            for chunk in chunks:
+                f.write(chunk)
+        print(f"Wrote {args.output}", file=sys.stderr)
+    else:
+        out = sys.stdout.buffer if args.gzip else sys.stdout
+        for chunk in chunks:
+            out.write(chunk)
+        out.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Minimal stand-in for the OpenAI chat completions API, for benchmarks.
+
+Usage (from backend/):
+    python scripts/fake_openai.py --port 8099 --latency-ms 400
+
+Then point the backend at it with OPENAI_BASE_URL=http://127.0.0.1:8099/v1.
+Replies are shaped after the prompt: numbered questions, a per-answer
+score, or an interview summary. Streaming requests get SSE chunks.
+"""
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+QUESTIONS = "\n".join(
+    f"{i}. Sample technical question number {i} about the role?" for i in range(1, 6)
+)
+
+
+def build_reply(messages):
+    """Pick a canned reply that the backend's parsers accept"""
+    prompt = messages[-1].get("content", "") if messages else ""
+
+    if "generate exactly 5 interview questions" in prompt:
+        return QUESTIONS
+    if "Summarize the interview" in prompt:
+        return json.dumps({"recommendation": "Maybe", "feedback": "Benchmark summary"})
+    if "technical_score" in prompt:
+        return json.dumps({
+            "technical_score": random.randint(4, 9),
+            "communication_score": random.randint(4, 9),
+            "note": "Benchmark score"
+        })
+    return "OK"
+
+
+def usage_for(messages, reply):
+    prompt_tokens = sum(len(m.get("content", "")) for m in messages) // 4
+    completion_tokens = len(reply) // 4
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens
+    }
+
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    latency = 0.0
+    jitter = 0.0
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+
+        if not self.path.endswith("/chat/completions"):
+            self.send_error(404)
+            return
+
+        time.sleep(max(0.0, self.latency + random.uniform(-self.jitter, self.jitter)))
+
+        messages = body.get("messages", [])
+        reply = build_reply(messages)
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        created = int(time.time())
+
+        if body.get("stream"):
+            self._stream(body, messages, reply, completion_id, created)
+            return
+
+        payload = json.dumps({
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": created,
+            "model": body.get("model", "gpt-4o-mini"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": reply},
+                "finish_reason": "stop"
+            }],
+            "usage": usage_for(messages, reply)
+        }).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _stream(self, body, messages, reply, completion_id, created):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+        def send(chunk):
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            self.wfile.flush()
+
+        base = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": body.get("model", "gpt-4o-mini")
+        }
+        for start in range(0, len(reply), 16):
+            send({**base, "choices": [{
+                "index": 0,
+                "delta": {"content": reply[start:start + 16]},
+                "finish_reason": None
+            }]})
+        send({**base, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]})
+
+        if (body.get("stream_options") or {}).get("include_usage"):
+            send({**base, "choices": [], "usage": usage_for(messages, reply)})
+
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.close_connection = True
+
+
+def start_server(port=0, latency_ms=0, jitter_ms=0):
+    """Start the fake API on a background thread and return the server"""
+    handler = type("Handler", (FakeOpenAIHandler,), {
+        "latency": latency_ms / 1000,
+        "jitter": jitter_ms / 1000
+    })
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="fake-openai", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--latency-ms", type=float, default=400)
+    parser.add_argument("--jitter-ms", type=float, default=100)
+    args = parser.parse_args()
+
+    server = start_server(args.port, args.latency_ms, args.jitter_ms)
+    print(f"Fake OpenAI listening on http://127.0.0.1:{server.server_address[1]}/v1")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
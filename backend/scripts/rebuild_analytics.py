@@ -0,0 +1,44 @@
+"""
+Recompute the score analytics summaries from interview_results.
+
+Usage (from backend/):
+    python scripts/rebuild_analytics.py
+    python scripts/rebuild_analytics.py --skip-backfill
+
+First stores jd_hash on scheduled interviews that predate it, then replaces
+the score_summaries collection with the output of one aggregation pipeline
+(built in a scratch collection and swapped in with a rename). Evaluations
+saved while the rebuild runs may be missed; run it when traffic is low, or
+run it again.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "api"))
+
+from services import mongodb_service
+from services.analytics import backfill_jd_hashes, rebuild_summaries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--skip-backfill", action="store_true", help="don't backfill jd_hash first")
+    args = parser.parse_args()
+
+    if mongodb_service.db is None:
+        sys.exit("MongoDB not connected")
+
+    if not args.skip_backfill:
+        start = time.perf_counter()
+        updated = backfill_jd_hashes()
+        print(f"Backfilled jd_hash on {updated} interviews in {time.perf_counter() - start:.1f}s")
+
+    start = time.perf_counter()
+    written = rebuild_summaries()
+    print(f"Wrote {written} summary documents in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Run the interview lifecycle sweeper outside the web process.
+
+Usage (from backend/):
+    python scripts/sweep_interviews.py               # one pass
+    python scripts/sweep_interviews.py --loop 60     # a pass every 60 seconds
+
+Moves scheduled interviews past end_time to "expired" and started ones
+abandoned beyond the grace period to "abandoned", purging their sessions.
+Set LIFECYCLE_SWEEPER=false on the web workers when running this instead.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "api"))
+
+from services import mongodb_service
+from services.lifecycle_sweeper import sweep_once
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--loop", type=float, metavar="SECONDS", help="repeat with this interval")
+    args = parser.parse_args()
+
+    if mongodb_service.db is None:
+        sys.exit("MongoDB not connected")
+
+    while True:
+        report = sweep_once()
+        print(f"expired {report['expired']:5d}   abandoned {report['abandoned']:5d}   "
+              f"{report['duration_ms']:8.1f} ms")
+        if not args.loop:
+            break
+        time.sleep(args.loop)
+
+
+if __name__ == "__main__":
+    main()
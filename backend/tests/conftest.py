@@ -0,0 +1,89 @@
+"""
+Shared fixtures for the backend tests.
+
+Run from backend/:
+    pip install -r api/requirements.txt -r requirements-dev.txt
+    python -m pytest -q
+
+MongoDB is mongomock, Drive and SMTP are local stand-ins; nothing here
+needs network access or credentials.
+"""
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "api"))
+
+# Keep the app's background threads and real services out of the tests
+os.environ.setdefault("EMAIL_OUTBOX_SENDER", "false")
+os.environ.setdefault("LIFECYCLE_SWEEPER", "false")
+os.environ.setdefault("QUESTION_PREGEN", "false")
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ.setdefault("DB_NAME", "ai_interviewer_test")
+
+
+@pytest.fixture
+def mongo_db(monkeypatch):
+    """A fresh mongomock database behind mongodb_service.get_db()"""
+    import mongomock
+    from services import mongodb_service
+
+    client = mongomock.MongoClient()
+    db = client[os.environ["DB_NAME"]]
+    monkeypatch.setattr(mongodb_service, "_mongo_client", client)
+    monkeypatch.setattr(mongodb_service, "_db", db)
+    return db
+
+
+class AtomicCollection:
+    """A mongomock collection whose operations each run under one lock
+
+    MongoDB applies every single-document write atomically; mongomock does
+    not once several threads share a collection. Concurrency tests use this
+    so they exercise the code's atomicity, not mongomock's lack of it.
+    """
+
+    def __init__(self, collection, lock=None):
+        self._collection = collection
+        self._lock = lock or threading.RLock()
+
+    def __getattr__(self, name):
+        attribute = getattr(self._collection, name)
+        if not callable(attribute):
+            return attribute
+
+        def locked(*args, **kwargs):
+            with self._lock:
+                result = attribute(*args, **kwargs)
+                if name == "find":
+                    return AtomicCursor(result, self._lock)
+                return result
+        return locked
+
+
+class AtomicCursor:
+    def __init__(self, cursor, lock):
+        self._cursor = cursor
+        self._lock = lock
+
+    def sort(self, *args, **kwargs):
+        self._cursor = self._cursor.sort(*args, **kwargs)
+        return self
+
+    def limit(self, *args):
+        self._cursor = self._cursor.limit(*args)
+        return self
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._cursor))
+
+
+@pytest.fixture
+def client(mongo_db):
+    """Flask test client for the app, on the mongomock database"""
+    from index import app
+    return app.test_client()
@@ -0,0 +1,137 @@
+from datetime import datetime
+
+import pytest
+
+from services import analytics
+from services.mongodb_service import save_interview_result
+from services.question_cache import jd_hash
+
+BACKEND_JD = "Backend engineer, Python and MongoDB"
+FRONTEND_JD = "Frontend engineer, TypeScript"
+
+
+@pytest.fixture(autouse=True)
+def summaries(mongo_db, monkeypatch):
+    monkeypatch.setattr(analytics, "_indexes_ready", False)
+    return mongo_db[analytics.SUMMARY_COLLECTION]
+
+
+def schedule(mongo_db, interview_id, job_description, with_hash=True):
+    document = {"interview_id": interview_id, "job_description": job_description}
+    if with_hash:
+        document["jd_hash"] = jd_hash(job_description)
+    mongo_db.scheduled_interviews.insert_one(document)
+
+
+def evaluate(interview_id, technical, communication, recommendation):
+    save_interview_result({
+        "interview_id": interview_id,
+        "qna": [],
+        "evaluation": {
+            "technical_score": technical,
+            "communication_score": communication,
+            "overall_score": (technical + communication) // 2,
+            "recommendation": recommendation
+        }
+    })
+
+
+def all_summaries(summaries):
+    """Every summary document as the API reports it, keyed by _id"""
+    return {
+        document["_id"]: analytics.format_summary(document["jd_hash"], [document])
+        for document in summaries.find()
+    }
+
+
+def test_evaluations_are_counted_per_role(mongo_db):
+    schedule(mongo_db, "i-1", BACKEND_JD)
+    schedule(mongo_db, "i-2", BACKEND_JD)
+    schedule(mongo_db, "i-3", FRONTEND_JD)
+
+    evaluate("i-1", 8, 6, "Yes")
+    evaluate("i-2", 4, 6, "No")
+    evaluate("i-3", 7, 7, "Maybe")
+
+    summary = analytics.get_summary(jd_hash(BACKEND_JD))
+    assert summary["count"] == 2
+    assert summary["jd_preview"] == BACKEND_JD
+    assert summary["recommendations"] == {"Yes": 1, "Maybe": 0, "No": 1}
+    assert summary["scores"]["technical_score"]["mean"] == 6
+    assert summary["scores"]["technical_score"]["histogram"][8] == 1
+    assert summary["scores"]["technical_score"]["histogram"][4] == 1
+
+    assert [role["count"] for role in analytics.list_roles()] == [2, 1]
+
+
+def test_reevaluation_replaces_the_previous_scores(mongo_db):
+    schedule(mongo_db, "i-1", BACKEND_JD)
+
+    evaluate("i-1", 3, 3, "No")
+    evaluate("i-1", 9, 7, "Yes")
+
+    summary = analytics.get_summary(jd_hash(BACKEND_JD))
+    assert summary["count"] == 1
+    assert summary["recommendations"] == {"Yes": 1, "Maybe": 0, "No": 0}
+    assert summary["scores"]["technical_score"]["histogram"][3] == 0
+    assert summary["scores"]["technical_score"]["mean"] == 9
+
+
+def test_result_without_a_schedule_is_counted_under_the_empty_jd(mongo_db):
+    evaluate("orphan", 5, 5, "Maybe")
+
+    assert analytics.get_summary(jd_hash(""))["count"] == 1
+
+
+def test_rebuild_matches_the_incremental_summaries(mongo_db, summaries):
+    schedule(mongo_db, "i-1", BACKEND_JD)
+    schedule(mongo_db, "i-2", BACKEND_JD)
+    schedule(mongo_db, "i-3", FRONTEND_JD)
+    evaluate("i-1", 8, 6, "Yes")
+    evaluate("i-2", 3, 3, "No")
+    evaluate("i-2", 4, 6, "No")
+    evaluate("i-3", 7, 7, "Maybe")
+    evaluate("orphan", 5, 5, "Maybe")
+    incremental = all_summaries(summaries)
+
+    # Per-day and all-time documents for two roles plus the unscheduled result
+    assert analytics.rebuild_summaries() == 6
+    assert all_summaries(summaries) == incremental
+    assert any(index["key"] == [("jd_hash", 1), ("date", 1)]
+               for index in summaries.index_information().values())
+    assert mongo_db.list_collection_names().count(analytics.SUMMARY_COLLECTION) == 1
+    assert not [name for name in mongo_db.list_collection_names() if "_rebuild_" in name]
+
+
+def test_failed_rebuild_keeps_the_old_summaries(mongo_db, summaries, monkeypatch):
+    schedule(mongo_db, "i-1", BACKEND_JD)
+    evaluate("i-1", 8, 6, "Yes")
+    before = all_summaries(summaries)
+
+    def failing_insert(self, *args, **kwargs):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(type(summaries), "insert_many", failing_insert)
+
+    with pytest.raises(RuntimeError):
+        analytics.rebuild_summaries()
+
+    assert all_summaries(summaries) == before
+    assert not [name for name in mongo_db.list_collection_names() if "_rebuild_" in name]
+
+
+def test_backfill_then_rebuild_covers_old_schedules(mongo_db, summaries):
+    schedule(mongo_db, "i-1", BACKEND_JD, with_hash=False)
+    mongo_db.interview_results.insert_one({
+        "interview_id": "i-1",
+        "created_at": datetime(2024, 5, 1),
+        "evaluation": {"technical_score": 6, "communication_score": 8,
+                       "overall_score": 7, "recommendation": "Yes"}
+    })
+
+    assert analytics.backfill_jd_hashes() == 1
+    assert analytics.rebuild_summaries() == 2
+
+    assert analytics.get_summary(jd_hash(BACKEND_JD))["count"] == 1
+    day = analytics.get_summary(jd_hash(BACKEND_JD), "2024-05-01", "2024-05-01")
+    assert day["scores"]["communication_score"]["mean"] == 8
@@ -0,0 +1,164 @@
+import logging
+import time
+import tracemalloc
+import uuid
+
+import pytest
+
+from services import drive_service
+from services.upload_queue import MemoryJobStore, UploadQueue
+
+
+class FakeUploadRequest:
+    """files().create() result: next_chunk() consumes one media chunk per call"""
+
+    def __init__(self, drive, media, fail=False):
+        self.drive = drive
+        self.media = media
+        self.fail = fail
+        self.offset = 0
+
+    def next_chunk(self, http=None):
+        if self.fail:
+            raise RuntimeError("simulated Drive outage")
+
+        chunk = self.media.getbytes(self.offset, self.media.chunksize())
+        self.offset += len(chunk)
+        self.drive.chunks.append(len(chunk))
+        if self.offset < self.media.size():
+            return None, None
+
+        file_id = uuid.uuid4().hex
+        self.drive.files_created.append(file_id)
+        return None, {"id": file_id, "webViewLink": f"https://drive.invalid/{file_id}"}
+
+
+class FakeDrive:
+    """Stand-in for the googleapiclient Drive v3 service"""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.chunks = []
+        self.files_created = []
+
+    def files(self):
+        return self
+
+    def create(self, body=None, media_body=None, fields=None, supportsAllDrives=None):
+        return FakeUploadRequest(self, media_body, self.fail)
+
+
+@pytest.fixture
+def fake_drive(monkeypatch):
+    drive = FakeDrive()
+    monkeypatch.setattr(drive_service, "get_drive_service", lambda: drive)
+    monkeypatch.setattr(drive_service, "get_thread_http", lambda: None)
+    monkeypatch.setattr(drive_service, "UPLOAD_CHUNK_SIZE", 256 * 1024)
+    return drive
+
+
+def write_file(tmp_path, size):
+    path = tmp_path / "recording.webm"
+    path.write_bytes(b"\x1a" * size)
+    return path
+
+
+def test_upload_file_sends_every_chunk(fake_drive, tmp_path, caplog):
+    caplog.set_level(logging.INFO)
+    path = write_file(tmp_path, 1024 * 1024 + 10)
+
+    result = drive_service.upload_file_to_drive(path, "Interview_Test.webm")
+
+    assert result["id"] == fake_drive.files_created[0]
+    assert result["webViewLink"].endswith(result["id"])
+    assert sum(fake_drive.chunks) == 1024 * 1024 + 10
+    assert max(fake_drive.chunks) == 256 * 1024
+    record = next(r for r in caplog.records if r.getMessage().startswith("File uploaded"))
+    assert record.drive_filename == "Interview_Test.webm"
+
+
+def test_upload_failure_returns_none(fake_drive, tmp_path):
+    fake_drive.fail = True
+
+    assert drive_service.upload_file_to_drive(write_file(tmp_path, 1000), "x.webm") is None
+
+
+def test_upload_queue_uploads_once_through_real_path(fake_drive, tmp_path, caplog):
+    # INFO is the production default, and the success log is on this path
+    caplog.set_level(logging.INFO)
+    finished = []
+    uploads = UploadQueue(upload_fn=drive_service.upload_file_to_drive,
+                          on_finished=finished.append, workers=1, retry_base=0,
+                          job_store=MemoryJobStore())
+
+    job_id = uploads.submit(str(write_file(tmp_path, 600 * 1024)), "Interview_Test.webm", "interview-1")
+
+    deadline = time.monotonic() + 10
+    while not finished and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    job = uploads.get_job(job_id)
+    assert job["status"] == "succeeded"
+    assert job["attempts"] == 1
+    assert job["file_link"] == f"https://drive.invalid/{job['file_id']}"
+    # One Drive file, not one per retry
+    assert fake_drive.files_created == [job["file_id"]]
+    assert not (tmp_path / "recording.webm").exists()
+
+
+def test_file_upload_memory_stays_flat(fake_drive, tmp_path):
+    size = 32 * 1024 * 1024
+    path = tmp_path / "large.webm"
+    with open(path, "wb") as f:
+        block = b"\x1a" * (1024 * 1024)
+        for _ in range(size // len(block)):
+            f.write(block)
+
+    tracemalloc.start()
+    try:
+        result = drive_service.upload_file_to_drive(path, "Interview_Large.webm")
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert result is not None
+    assert sum(fake_drive.chunks) == size
+    # Roughly one chunk in memory at a time, never the whole recording
+    assert peak < 8 * drive_service.UPLOAD_CHUNK_SIZE
+    assert peak < size / 10
+
+
+def test_thread_http_rebuilds_after_concurrent_invalidate(monkeypatch):
+    from google.auth.credentials import AnonymousCredentials
+
+    builds = []
+
+    def build():
+        builds.append(AnonymousCredentials())
+        return object(), builds[-1]
+
+    monkeypatch.setattr(drive_service, "build_drive_service", build)
+    monkeypatch.setattr(drive_service, "_drive_service", None)
+    monkeypatch.setattr(drive_service, "_credentials", None)
+    monkeypatch.setattr(drive_service, "_thread_state", drive_service.threading.local())
+
+    drive_service.get_drive_service()
+    first = drive_service.get_thread_http()
+    assert first.credentials is builds[0]
+
+    # Another thread drops the client between this thread's service and transport calls
+    drive_service.invalidate_drive_service()
+    second = drive_service.get_thread_http()
+
+    assert len(builds) == 2
+    assert second.credentials is builds[1]
+    assert drive_service.get_thread_http() is second
+
+
+def test_thread_http_fails_without_credentials(monkeypatch):
+    monkeypatch.setattr(drive_service, "build_drive_service", lambda: (None, None))
+    monkeypatch.setattr(drive_service, "_drive_service", None)
+    monkeypatch.setattr(drive_service, "_credentials", None)
+
+    with pytest.raises(RuntimeError):
+        drive_service.get_thread_http()
@@ -0,0 +1,206 @@
+import socket
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from aiosmtpd.controller import Controller
+from flask import Flask
+
+from conftest import AtomicCollection
+from services import email_outbox
+
+
+class RecordingHandler:
+    """aiosmtpd handler that records messages with the SMTP session they came on"""
+
+    def __init__(self):
+        self.messages = []
+        self.sessions = []
+        self.refuse = set()
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address in self.refuse:
+            return "550 mailbox unavailable"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append(envelope.rcpt_tos[0])
+        if session not in self.sessions:
+            self.sessions.append(session)
+        return "250 Message accepted"
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server():
+    handler = RecordingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=free_port())
+    controller.start()
+    yield controller, handler
+    controller.stop()
+
+
+def make_app(port):
+    app = Flask(__name__)
+    app.config.update(
+        MAIL_SERVER="127.0.0.1",
+        MAIL_PORT=port,
+        MAIL_USE_TLS=False,
+        MAIL_USE_SSL=False,
+        MAIL_DEFAULT_SENDER="interviews@example.com"
+    )
+    return app
+
+
+@pytest.fixture
+def outbox(mongo_db):
+    return mongo_db.email_outbox
+
+
+def queue(count, domain="example.com"):
+    email_outbox.enqueue_emails([
+        (f"candidate{n}@{domain}", f"Interview {n}", f"<p>{n}</p>") for n in range(count)
+    ])
+
+
+def test_batch_is_sent_over_one_smtp_session(smtp_server, outbox):
+    controller, handler = smtp_server
+    queue(3)
+
+    sent = email_outbox.process_outbox_once(make_app(controller.port))
+
+    assert sent == 3
+    assert len(handler.messages) == 3
+    assert len(handler.sessions) == 1
+    assert outbox.count_documents({"status": "sent"}) == 3
+
+
+def test_refused_recipient_is_retried_with_jittered_backoff(smtp_server, outbox, monkeypatch):
+    controller, handler = smtp_server
+    monkeypatch.setattr(email_outbox, "OUTBOX_RETRY_BASE_SECONDS", 30)
+    handler.refuse.add("candidate1@example.com")
+    queue(3)
+
+    before = datetime.utcnow()
+    sent = email_outbox.process_outbox_once(make_app(controller.port))
+
+    # The refusal does not cost the other messages their session
+    assert sent == 2
+    assert len(handler.sessions) == 1
+    entry = outbox.find_one({"to": "candidate1@example.com"})
+    assert entry["status"] == "pending"
+    assert entry["attempts"] == 1
+    assert "550" in entry["last_error"]
+    # First retry: base delay plus up to half of it again
+    delay = (entry["next_attempt_at"] - before).total_seconds()
+    assert 30 <= delay <= 45 + 1
+
+
+def test_retry_delay_doubles_and_jitters(monkeypatch):
+    monkeypatch.setattr(email_outbox, "OUTBOX_RETRY_BASE_SECONDS", 10)
+    monkeypatch.setattr(email_outbox, "OUTBOX_MAX_ATTEMPTS", 5)
+
+    delays = []
+    for _ in range(50):
+        before = datetime.utcnow()
+        update = email_outbox._retry_update({"attempts": 2}, "boom")
+        delays.append((update["next_attempt_at"] - before).total_seconds())
+
+    assert update["attempts"] == 3
+    # Third attempt: 10 * 2**2 = 40s, plus up to 20s of jitter
+    assert all(40 <= delay <= 60 + 1 for delay in delays)
+    assert len({round(delay, 3) for delay in delays}) > 1
+
+    assert email_outbox._retry_update({"attempts": 4}, "boom")["status"] == "failed"
+
+
+def test_unreachable_server_retries_the_whole_batch(outbox):
+    queue(2)
+
+    assert email_outbox.process_outbox_once(make_app(free_port())) == 0
+    assert outbox.count_documents({"status": "pending", "attempts": 1}) == 2
+
+
+def test_claim_takes_due_messages_in_order(outbox):
+    now = datetime.utcnow()
+    outbox.insert_many([
+        {"to": "later", "status": "pending", "next_attempt_at": now + timedelta(hours=1)},
+        {"to": "second", "status": "pending", "next_attempt_at": now - timedelta(minutes=1)},
+        {"to": "first", "status": "pending", "next_attempt_at": now - timedelta(minutes=2)},
+        {"to": "sent", "status": "sent", "next_attempt_at": now - timedelta(minutes=3)},
+        {"to": "third", "status": "pending", "next_attempt_at": now},
+    ])
+
+    claimed = email_outbox._claim_batch(outbox, 2)
+
+    assert [entry["to"] for entry in claimed] == ["first", "second"]
+    assert all(entry["status"] == "sending" for entry in claimed)
+    assert len({entry["claim_token"] for entry in claimed}) == 1
+    assert [entry["to"] for entry in email_outbox._claim_batch(outbox, 10)] == ["third"]
+    assert email_outbox._claim_batch(outbox, 10) == []
+
+
+def test_claim_picks_up_stale_sending_messages(outbox):
+    now = datetime.utcnow()
+    timeout = timedelta(seconds=email_outbox.OUTBOX_CLAIM_TIMEOUT_SECONDS)
+    outbox.insert_many([
+        {"to": "stuck", "status": "sending", "claimed_at": now - timeout * 2, "next_attempt_at": now},
+        {"to": "busy", "status": "sending", "claimed_at": now, "next_attempt_at": now},
+    ])
+
+    assert [entry["to"] for entry in email_outbox._claim_batch(outbox, 10)] == ["stuck"]
+
+
+def test_concurrent_senders_never_claim_the_same_message(outbox):
+    queue(40)
+    outbox = AtomicCollection(outbox)
+    claims = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(4)
+
+    def sender():
+        barrier.wait()
+        while True:
+            batch = email_outbox._claim_batch(outbox, 7)
+            if not batch:
+                return
+            with lock:
+                claims.extend(entry["_id"] for entry in batch)
+
+    threads = [threading.Thread(target=sender) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(claims) == 40
+    assert len(set(claims)) == 40
+
+
+def test_memory_outbox_waits_for_the_retry_delay(smtp_server, monkeypatch):
+    controller, handler = smtp_server
+    monkeypatch.setattr(email_outbox, "_get_outbox", lambda: None)
+    monkeypatch.setattr(email_outbox, "_memory_outbox", email_outbox.deque())
+    monkeypatch.setattr(email_outbox, "OUTBOX_RETRY_BASE_SECONDS", 30)
+    handler.refuse.add("candidate1@example.com")
+    queue(3)
+    app = make_app(controller.port)
+
+    assert email_outbox.process_outbox_once(app) == 2
+    # The refused message is still backing off, so the next pass skips it
+    handler.refuse.clear()
+    assert email_outbox.process_outbox_once(app) == 0
+    assert len(handler.messages) == 2
+    (entry,) = email_outbox._memory_outbox
+    assert entry["attempts"] == 1
+
+    entry["next_attempt_at"] = datetime.utcnow() - timedelta(seconds=1)
+    assert email_outbox.process_outbox_once(app) == 1
+    assert handler.messages[-1] == "candidate1@example.com"
+    assert not email_outbox._memory_outbox
@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from services.mongodb_service import decode_cursor, encode_cursor, list_interviews
+
+
+@pytest.fixture
+def interviews(mongo_db):
+    start = datetime(2026, 3, 1, 9)
+    documents = [
+        {"interview_id": f"dated-{n}", "interview_status": "scheduled",
+         # Pairs share a start time, so the _id tiebreak is exercised too
+         "start_time": start + timedelta(hours=n // 2)}
+        for n in range(7)
+    ]
+    documents += [
+        {"interview_id": "null-start", "interview_status": "scheduled", "start_time": None},
+        {"interview_id": "no-start", "interview_status": "scheduled"},
+    ]
+    mongo_db.scheduled_interviews.insert_many(documents)
+    return [document["interview_id"] for document in documents]
+
+
+def page_through(limit, **filters):
+    seen = []
+    after = None
+    for _ in range(20):
+        documents, cursor = list_interviews(after=after, limit=limit, **filters)
+        seen += [document["interview_id"] for document in documents]
+        if cursor is None:
+            return seen
+        after = decode_cursor(cursor)
+    raise AssertionError("pagination did not finish")
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 4, 50])
+def test_every_interview_is_listed_once(interviews, limit):
+    seen = page_through(limit)
+
+    assert sorted(seen) == sorted(interviews)
+    # Undated interviews sort first, then by start time
+    assert set(seen[:2]) == {"null-start", "no-start"}
+    assert seen[2:] == [f"dated-{n}" for n in range(7)]
+
+
+def test_cursor_after_a_null_start_time_keeps_going(interviews, mongo_db):
+    undated = mongo_db.scheduled_interviews.find_one({"interview_id": "null-start"})
+
+    after = decode_cursor(encode_cursor(undated))
+    assert after[0] is None
+
+    documents, _ = list_interviews(after=after, limit=50)
+    assert "dated-0" in [document["interview_id"] for document in documents]
+
+
+def test_route_pages_with_filters(client, interviews, mongo_db):
+    mongo_db.scheduled_interviews.update_many(
+        {"interview_id": {"$in": ["dated-1", "dated-4"]}},
+        {"$set": {"interview_status": "completed"}}
+    )
+
+    seen = []
+    url = "/api/scheduler/interviews?status=scheduled&limit=3"
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200
+        seen += [item["interview_id"] for item in response.json["interviews"]]
+        cursor = response.json["next_cursor"]
+        url = f"/api/scheduler/interviews?status=scheduled&limit=3&cursor={cursor}" if cursor else None
+
+    assert sorted(seen) == sorted(set(interviews) - {"dated-1", "dated-4"})
+    assert client.get("/api/scheduler/interviews?cursor=garbage").status_code == 400
@@ -0,0 +1,215 @@
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from routes import interviews
+from services import answer_scoring
+from services.session_store import MemorySessionStore
+
+QUESTIONS = ["Question 1", "Question 2", "Question 3"]
+
+
+def scored(technical, communication):
+    return {
+        "question": "Question",
+        "answer": "Answer",
+        "score": {"technical_score": technical, "communication_score": communication, "note": ""}
+    }
+
+
+def reply(content):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = MemorySessionStore()
+    store.create("interview-1", QUESTIONS)
+    monkeypatch.setattr(interviews, "get_session_store", lambda: store)
+    return store
+
+
+def test_build_evaluation_averages_the_answer_scores():
+    qna = [scored(9, 6), scored(6, 7), scored(4, 8)]
+
+    result = interviews.build_evaluation(
+        qna, '```json\n{"recommendation": "Maybe", "feedback": "Uneven"}\n```'
+    )
+
+    # technical 19/3 = 6.33, communication 7, overall 6.67
+    assert result == {
+        "technical_score": 6,
+        "communication_score": 7,
+        "overall_score": 7,
+        "recommendation": "Maybe",
+        "feedback": "Uneven"
+    }
+
+
+def test_build_evaluation_rejects_an_unknown_recommendation():
+    with pytest.raises(ValueError):
+        interviews.build_evaluation([scored(5, 5)], '{"recommendation": "Strong yes"}')
+
+
+def test_score_answer_clamps_the_llm_scores(monkeypatch):
+    monkeypatch.setattr(interviews.llm_client, "chat", lambda *args, **kwargs: reply(
+        '{"technical_score": 14, "communication_score": "-2", "note": "Overflow"}'
+    ))
+
+    assert interviews.score_answer({"question": "Q", "answer": "A"}) == {
+        "technical_score": 10,
+        "communication_score": 0,
+        "note": "Overflow"
+    }
+
+
+def test_collect_scores_rescores_a_failed_answer(store):
+    def flaky(qa):
+        if qa["question"] == "Question 2":
+            raise ConnectionError("rate limited")
+        return {"technical_score": 7, "communication_score": 7, "note": qa["question"]}
+
+    futures = []
+    for question in QUESTIONS:
+        qa = {"question": question, "answer": "An answer"}
+        index = store.append_answer("interview-1", qa)
+        futures.append(answer_scoring.submit_answer_scoring(store, "interview-1", index, qa, flaky))
+    for future in futures:
+        future.exception(5)
+    assert isinstance(futures[1].exception(), ConnectionError)
+
+    calls = []
+
+    def retry(qa):
+        calls.append(qa["question"])
+        return {"technical_score": 5, "communication_score": 5, "note": "retried"}
+
+    qna = answer_scoring.collect_scores(store, "interview-1", retry)
+
+    assert calls == ["Question 2"]
+    assert [qa["score"]["note"] for qa in qna] == ["Question 1", "retried", "Question 3"]
+    assert store.get("interview-1")["qna"][1]["score"]["note"] == "retried"
+
+
+def test_collect_scores_does_not_wait_past_the_timeout(store):
+    release = threading.Event()
+
+    def stuck(qa):
+        release.wait(5)
+        return {"technical_score": 1, "communication_score": 1, "note": "late"}
+
+    qa = {"question": "Question 1", "answer": "An answer"}
+    index = store.append_answer("interview-1", qa)
+    answer_scoring.submit_answer_scoring(store, "interview-1", index, qa, stuck)
+
+    try:
+        qna = answer_scoring.collect_scores(
+            store, "interview-1",
+            lambda qa: {"technical_score": 8, "communication_score": 8, "note": "on time"},
+            timeout=0.05
+        )
+    finally:
+        release.set()
+
+    assert qna[0]["score"]["note"] == "on time"
+
+
+def test_collect_scores_unknown_session():
+    assert answer_scoring.collect_scores(MemorySessionStore(), "missing", lambda qa: None) is None
+
+
+def test_submitted_answers_are_scored_before_evaluate(client, mongo_db, store, monkeypatch):
+    calls = []
+
+    def chat(call_type, messages, **kwargs):
+        calls.append(call_type)
+        if call_type == "scoring":
+            return reply('{"technical_score": 8, "communication_score": 6, "note": "ok"}')
+        return reply('{"recommendation": "Yes", "feedback": "Solid"}')
+
+    monkeypatch.setattr(interviews.llm_client, "chat", chat)
+
+    for question in QUESTIONS:
+        response = client.post("/api/interviews/submit-answer/interview-1",
+                               json={"question": question, "answer": "An answer"})
+        assert response.status_code == 200
+
+    response = client.get("/api/interviews/evaluate/interview-1")
+
+    assert response.status_code == 200
+    assert response.json["overall_score"] == 7
+    # One small call per answer, then only the summary
+    assert calls.count("scoring") == 3
+    assert calls[-1] == "summary"
+    saved = mongo_db.interview_results.find_one({"interview_id": "interview-1"})
+    assert [qa["score"] for qa in saved["qna"]] == [
+        {"technical_score": 8, "communication_score": 6, "note": "ok"}
+    ] * 3
+
+
+def stream_chunk(token):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=token))])
+
+
+def sse_events(body):
+    """(event, data) pairs from a text/event-stream body"""
+    events = []
+    for block in body.strip().split("\n\n"):
+        event, data = block.split("\n")
+        events.append((event[len("event: "):], json.loads(data[len("data: "):])))
+    return events
+
+
+def test_evaluate_stream_sends_progress_tokens_then_the_result(client, mongo_db, store, monkeypatch):
+    summary = ['{"recommendation": ', '"Yes", "feedback": ', '"Solid"}']
+    # The final usage chunk has no choices
+    monkeypatch.setattr(interviews.llm_client, "chat_stream", lambda *args, **kwargs: iter(
+        [stream_chunk(token) for token in summary] + [SimpleNamespace(choices=[])]
+    ))
+    monkeypatch.setattr(interviews, "score_answer", lambda qa: {
+        "technical_score": 8, "communication_score": 6, "note": "ok"
+    })
+    for question in QUESTIONS:
+        store.append_answer("interview-1", {"question": question, "answer": "An answer"})
+
+    response = client.get("/api/interviews/evaluate-stream/interview-1")
+
+    assert response.mimetype == "text/event-stream"
+    assert response.headers["Cache-Control"] == "no-cache"
+    events = sse_events(response.get_data(as_text=True))
+    assert events == [
+        ("progress", {"stage": "scoring", "answers": 3}),
+        ("progress", {"stage": "summarizing"}),
+        *[("token", {"text": token}) for token in summary],
+        ("progress", {"stage": "saving"}),
+        ("result", {
+            "technical_score": 8,
+            "communication_score": 6,
+            "overall_score": 7,
+            "recommendation": "Yes",
+            "feedback": "Solid"
+        })
+    ]
+    assert mongo_db.interview_results.find_one({"interview_id": "interview-1"})["evaluation"] == events[-1][1]
+
+
+def test_evaluate_stream_reports_errors_in_the_stream(client, store, monkeypatch):
+    monkeypatch.setattr(interviews.llm_client, "chat_stream", lambda *args, **kwargs: iter(
+        [stream_chunk("not json")]
+    ))
+    monkeypatch.setattr(interviews, "score_answer", lambda qa: {
+        "technical_score": 8, "communication_score": 6, "note": "ok"
+    })
+
+    assert client.get("/api/interviews/evaluate-stream/missing").status_code == 404
+    assert client.get("/api/interviews/evaluate-stream/interview-1").status_code == 400
+
+    store.append_answer("interview-1", {"question": "Question 1", "answer": "An answer"})
+    response = client.get("/api/interviews/evaluate-stream/interview-1")
+
+    assert response.status_code == 200
+    event, data = sse_events(response.get_data(as_text=True))[-1]
+    assert event == "error"
+    assert data["error"]
@@ -0,0 +1,155 @@
+import asyncio
+import json
+import threading
+from datetime import datetime
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+import asgi
+from routes import interviews_async
+from services.question_cache import QuestionCache
+from services.session_store import MemorySessionStore
+
+QUESTIONS = ["Question 1", "Question 2"]
+SCORE = {"technical_score": 8, "communication_score": 6, "note": "ok"}
+
+
+class AsyncCollection:
+    """The motor calls the async handlers make, answered by a mongomock collection"""
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    async def find_one_and_update(self, *args, **kwargs):
+        return self.collection.find_one_and_update(*args, **kwargs)
+
+    async def find_one(self, *args, **kwargs):
+        return self.collection.find_one(*args, **kwargs)
+
+
+def reply(content):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+@pytest.fixture
+def service(mongo_db, monkeypatch):
+    """The async routes with MongoDB, OpenAI and the session store replaced"""
+    state = SimpleNamespace(
+        store=MemorySessionStore(),
+        cache=QuestionCache(),
+        calls=[],
+        saved=[],
+        blocking_threads=[]
+    )
+
+    async def achat(call_type, messages, **kwargs):
+        state.calls.append(call_type)
+        if call_type == "questions":
+            return reply("1. Generated one\n2. Generated two")
+        return reply(json.dumps({"recommendation": "Yes", "feedback": "Solid"}))
+
+    async def save(interview_data):
+        state.saved.append(interview_data)
+        return "result-id"
+
+    def off_loop(fn):
+        # Record which thread the blocking helpers run on
+        def wrapper(*args):
+            state.blocking_threads.append(threading.current_thread())
+            return fn(*args)
+        return wrapper
+
+    monkeypatch.setattr(interviews_async, "get_async_collection",
+                        lambda name: AsyncCollection(mongo_db[name]))
+    monkeypatch.setattr(interviews_async.llm_client, "achat", achat)
+    monkeypatch.setattr(interviews_async, "save_interview_result_async", save)
+    monkeypatch.setattr(interviews_async, "score_answer", lambda qa: SCORE)
+    monkeypatch.setattr(interviews_async, "get_session_store", off_loop(lambda: state.store))
+    monkeypatch.setattr(interviews_async, "get_question_cache", off_loop(lambda: state.cache))
+    monkeypatch.setattr(interviews_async.status_cache, "invalidate", off_loop(lambda interview_id: None))
+    return state
+
+
+def request(method, path, **kwargs):
+    async def send():
+        transport = httpx.ASGITransport(app=asgi.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            return await client.request(method, path, **kwargs)
+    return asyncio.run(send())
+
+
+def schedule(mongo_db, interview_id, questions=None, status="scheduled"):
+    mongo_db.scheduled_interviews.insert_one({
+        "interview_id": interview_id,
+        "interview_status": status,
+        "start_time": datetime.utcnow(),
+        "questions": questions
+    })
+
+
+def test_generate_questions_uses_pregenerated_questions(service, mongo_db):
+    schedule(mongo_db, "interview-1", QUESTIONS)
+
+    response = request("POST", "/api/interviews/generate-questions",
+                       json={"jd": "Python developer", "interview_id": "interview-1"})
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "success", "total": 2, "questions": QUESTIONS}
+    assert service.calls == []
+    assert service.store.get("interview-1")["questions"] == QUESTIONS
+    assert mongo_db.scheduled_interviews.find_one()["interview_status"] == "started"
+    # invalidate and get_session_store never ran on the event loop's thread
+    assert service.blocking_threads
+    assert threading.main_thread() not in service.blocking_threads
+
+
+def test_generate_questions_falls_back_to_the_llm(service, mongo_db):
+    schedule(mongo_db, "interview-1")
+
+    response = request("POST", "/api/interviews/generate-questions",
+                       json={"jd": "Python developer", "interview_id": "interview-1"})
+
+    assert response.status_code == 200
+    assert response.json()["questions"] == ["Generated one", "Generated two"]
+    assert service.calls == ["questions"]
+    assert threading.main_thread() not in service.blocking_threads
+
+
+def test_generate_questions_rejects_a_second_start(service, mongo_db):
+    schedule(mongo_db, "interview-1", QUESTIONS, status="started")
+
+    response = request("POST", "/api/interviews/generate-questions",
+                       json={"jd": "Python developer", "interview_id": "interview-1"})
+
+    assert response.status_code == 403
+    assert response.json()["status"] == "already_started"
+    assert request("POST", "/api/interviews/generate-questions", json={}).status_code == 400
+
+
+def test_evaluate_scores_and_summarizes(service):
+    service.store.create("interview-1", QUESTIONS)
+    for question in QUESTIONS:
+        service.store.append_answer("interview-1", {"question": question, "answer": "An answer"})
+
+    response = request("GET", "/api/interviews/evaluate/interview-1")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "technical_score": 8,
+        "communication_score": 6,
+        "overall_score": 7,
+        "recommendation": "Yes",
+        "feedback": "Solid"
+    }
+    assert service.calls == ["summary"]
+    assert [qa["score"] for qa in service.saved[0]["qna"]] == [SCORE, SCORE]
+    assert threading.main_thread() not in service.blocking_threads
+
+
+def test_evaluate_unknown_or_empty_session(service):
+    assert request("GET", "/api/interviews/evaluate/missing").status_code == 404
+
+    service.store.create("interview-1", QUESTIONS)
+    assert request("GET", "/api/interviews/evaluate/interview-1").status_code == 400
@@ -0,0 +1,120 @@
+import io
+from datetime import datetime, timedelta
+
+import pytest
+
+from services import answer_scoring, lifecycle_sweeper, recording_chunks, status_cache
+from services.session_store import MemorySessionStore
+
+NOW = datetime(2030, 1, 1, 12, 0)
+GRACE = timedelta(seconds=lifecycle_sweeper.ABANDONED_GRACE_SECONDS)
+
+
+@pytest.fixture
+def sessions(mongo_db, tmp_path, monkeypatch):
+    store = MemorySessionStore()
+    monkeypatch.setattr("services.session_store.get_session_store", lambda: store)
+    monkeypatch.setattr(recording_chunks, "CHUNK_DIR", tmp_path / "recording_chunks")
+    monkeypatch.setattr(status_cache, "_entries", status_cache.OrderedDict())
+    return store
+
+
+def schedule(mongo_db, interview_id, status, end_time):
+    mongo_db.scheduled_interviews.insert_one({
+        "interview_id": interview_id,
+        "interview_status": status,
+        "start_time": end_time - timedelta(hours=1),
+        "end_time": end_time
+    })
+
+
+def status(mongo_db, interview_id):
+    return mongo_db.scheduled_interviews.find_one({"interview_id": interview_id})["interview_status"]
+
+
+def test_sweep_moves_only_closed_interviews(mongo_db, sessions):
+    schedule(mongo_db, "missed", "scheduled", NOW - timedelta(minutes=1))
+    schedule(mongo_db, "upcoming", "scheduled", NOW + timedelta(minutes=1))
+    schedule(mongo_db, "left", "started", NOW - GRACE - timedelta(minutes=1))
+    schedule(mongo_db, "in-grace", "started", NOW - GRACE + timedelta(minutes=1))
+    schedule(mongo_db, "done", "completed", NOW - GRACE - timedelta(days=1))
+
+    report = lifecycle_sweeper.sweep_once(now=NOW)
+
+    assert (report["expired"], report["abandoned"]) == (1, 1)
+    assert {interview_id: status(mongo_db, interview_id) for interview_id in
+            ("missed", "upcoming", "left", "in-grace", "done")} == {
+        "missed": "expired",
+        "upcoming": "scheduled",
+        "left": "abandoned",
+        "in-grace": "started",
+        "done": "completed"
+    }
+    assert mongo_db.scheduled_interviews.find_one({"interview_id": "missed"})["expired_at"]
+    assert mongo_db.scheduled_interviews.find_one({"interview_id": "left"})["abandoned_at"]
+
+    # A second pass has nothing left to move
+    report = lifecycle_sweeper.sweep_once(now=NOW)
+    assert (report["expired"], report["abandoned"]) == (0, 0)
+
+
+def test_abandoned_interviews_lose_their_session_state(mongo_db, sessions):
+    schedule(mongo_db, "left", "started", NOW - GRACE - timedelta(minutes=1))
+    schedule(mongo_db, "in-grace", "started", NOW - GRACE + timedelta(minutes=1))
+    for interview_id in ("left", "in-grace"):
+        sessions.create(interview_id, ["Question 1"])
+        recording_chunks.store_chunk(interview_id, 0, io.BytesIO(b"<chunk>"))
+    answer_scoring._pending["left"] = {}
+
+    lifecycle_sweeper.sweep_once(now=NOW)
+
+    assert sessions.get("left") is None
+    assert "left" not in answer_scoring._pending
+    assert not (recording_chunks.CHUNK_DIR / "left").exists()
+    assert sessions.get("in-grace") is not None
+    assert recording_chunks.get_progress("in-grace")["received"] == 1
+
+
+def test_sweep_works_through_several_batches(mongo_db, sessions, monkeypatch):
+    monkeypatch.setattr(lifecycle_sweeper, "SWEEP_BATCH_SIZE", 2)
+    for n in range(5):
+        schedule(mongo_db, f"missed-{n}", "scheduled", NOW - timedelta(minutes=n + 1))
+
+    assert lifecycle_sweeper.sweep_once(now=NOW)["expired"] == 5
+    assert mongo_db.scheduled_interviews.count_documents({"interview_status": "expired"}) == 5
+
+
+def test_sweep_invalidates_cached_statuses(mongo_db, sessions):
+    schedule(mongo_db, "missed", "scheduled", NOW - timedelta(minutes=1))
+    assert status_cache.get_status_doc("missed")["interview_status"] == "scheduled"
+
+    lifecycle_sweeper.sweep_once(now=NOW)
+
+    assert status_cache.get_status_doc("missed")["interview_status"] == "expired"
+
+
+def test_concurrent_transition_is_not_overwritten(mongo_db, sessions):
+    schedule(mongo_db, "missed", "scheduled", NOW - timedelta(minutes=2))
+    schedule(mongo_db, "starting", "scheduled", NOW - timedelta(minutes=1))
+
+    class StartsDuringSweep:
+        """The candidate starts between the sweeper's find and its update"""
+
+        def __init__(self, collection):
+            self.collection = collection
+
+        def find(self, *args, **kwargs):
+            return self.collection.find(*args, **kwargs)
+
+        def update_many(self, *args, **kwargs):
+            self.collection.update_one({"interview_id": "starting"},
+                                       {"$set": {"interview_status": "started"}})
+            return self.collection.update_many(*args, **kwargs)
+
+    moved = lifecycle_sweeper._transition(
+        StartsDuringSweep(mongo_db.scheduled_interviews), "scheduled", "expired", NOW, "expired_at"
+    )
+
+    assert moved == 1
+    assert status(mongo_db, "missed") == "expired"
+    assert status(mongo_db, "starting") == "started"
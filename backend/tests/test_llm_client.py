@@ -0,0 +1,125 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import openai
+import pytest
+
+from services import llm_client as llm_module
+from services.llm_client import LLMClient, MongoRateLimiter, TokenBucket
+
+MESSAGES = [{"role": "user", "content": "x" * 400}]
+
+
+def connection_error():
+    return openai.APIConnectionError(request=httpx.Request("POST", "https://api.invalid/v1/chat"))
+
+
+class FakeCompletions:
+    """Fails the first `failures` calls, then answers with the given usage"""
+
+    def __init__(self, failures, error=connection_error, total_tokens=150):
+        self.failures = failures
+        self.error = error
+        self.total_tokens = total_tokens
+        self.calls = 0
+
+    def _next(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error()
+        return SimpleNamespace(usage=SimpleNamespace(
+            prompt_tokens=100, completion_tokens=self.total_tokens - 100, total_tokens=self.total_tokens
+        ))
+
+    def create(self, **request):
+        return self._next()
+
+
+class AsyncFakeCompletions(FakeCompletions):
+    async def create(self, **request):
+        return self._next()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(llm_module, "LLM_RETRY_BASE_SECONDS", 0.001)
+    client = LLMClient()
+    client._rpm = TokenBucket(600)
+    client._tpm = TokenBucket(60_000)
+    # No refill, so the buckets show exactly what was charged
+    client._rpm.rate = client._tpm.rate = 0
+    client._global_checked = True
+    return client
+
+
+def fake_client(completions):
+    return SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+
+def spent(bucket):
+    return bucket.capacity - bucket.available
+
+
+def test_concurrency_binds_before_the_pool():
+    assert llm_module.LLM_MAX_CONCURRENCY < llm_module.LLM_POOL_SIZE
+
+
+def test_failed_attempts_are_refunded(client, monkeypatch):
+    completions = FakeCompletions(failures=2)
+    monkeypatch.setattr(client, "get_client", lambda: fake_client(completions))
+
+    client.chat("scoring", MESSAGES, max_tokens=50)
+
+    assert completions.calls == 3
+    # Only the attempt that went through is charged, at its real usage
+    assert spent(client._rpm) == 1
+    assert spent(client._tpm) == 150
+
+
+def test_non_retryable_failure_is_refunded(client, monkeypatch):
+    completions = FakeCompletions(failures=1, error=lambda: ValueError("bad request"))
+    monkeypatch.setattr(client, "get_client", lambda: fake_client(completions))
+
+    with pytest.raises(ValueError):
+        client.chat("scoring", MESSAGES, max_tokens=50)
+
+    assert spent(client._rpm) == 0
+    assert spent(client._tpm) == 0
+
+
+def test_async_failed_attempts_are_refunded(client, monkeypatch):
+    completions = AsyncFakeCompletions(failures=2)
+    monkeypatch.setattr(client, "get_async_client", lambda: fake_client(completions))
+
+    asyncio.run(client.achat("scoring", MESSAGES, max_tokens=50))
+
+    assert completions.calls == 3
+    assert spent(client._rpm) == 1
+    assert spent(client._tpm) == 150
+
+
+def test_failed_attempts_are_released_from_the_global_window(client, mongo_db, monkeypatch):
+    client._global = MongoRateLimiter(mongo_db.llm_rate_limits, rpm=100, tpm=100_000)
+    completions = FakeCompletions(failures=2)
+    monkeypatch.setattr(client, "get_client", lambda: fake_client(completions))
+
+    client.chat("scoring", MESSAGES, max_tokens=50)
+
+    # Three attempts, but only the one that went through stays counted
+    (window,) = mongo_db.llm_rate_limits.find()
+    assert window["requests"] == 1
+    assert window["tokens"] == 150
+
+
+def test_async_failed_attempts_are_released_from_the_global_window(client, mongo_db, monkeypatch):
+    client._global = MongoRateLimiter(mongo_db.llm_rate_limits, rpm=100, tpm=100_000)
+    completions = AsyncFakeCompletions(failures=1, error=lambda: ValueError("bad request"))
+    monkeypatch.setattr(client, "get_async_client", lambda: fake_client(completions))
+
+    with pytest.raises(ValueError):
+        asyncio.run(client.achat("scoring", MESSAGES, max_tokens=50))
+
+    (window,) = mongo_db.llm_rate_limits.find()
+    assert window["requests"] == 0
+    assert window["tokens"] == 0
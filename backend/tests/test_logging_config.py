@@ -0,0 +1,49 @@
+import ast
+import logging
+import queue
+from pathlib import Path
+
+from utils import logging_config
+
+API_DIR = Path(__file__).resolve().parent.parent / "api"
+
+
+def test_no_call_site_passes_a_reserved_extra_key():
+    # logging raises KeyError for extra={"filename": ...} once the level is enabled
+    reserved = logging_config._RESERVED_ATTRS
+    found = []
+    for path in API_DIR.rglob("*.py"):
+        for node in ast.walk(ast.parse(path.read_text())):
+            if not isinstance(node, ast.Call):
+                continue
+            for keyword in node.keywords:
+                if keyword.arg == "extra" and isinstance(keyword.value, ast.Dict):
+                    found += [
+                        f"{path.name}:{node.lineno} {key.value}"
+                        for key in keyword.value.keys
+                        if isinstance(key, ast.Constant) and key.value in reserved
+                    ]
+
+    assert found == []
+
+
+def test_queue_handler_leaves_formatting_to_listener():
+    formatted = []
+
+    class RecordingFormatter(logging_config.JsonFormatter):
+        def format(self, record):
+            formatted.append(record)
+            return super().format(record)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging_config.DeferredQueueHandler(log_queue)
+    queue_handler.setFormatter(RecordingFormatter())
+
+    record = logging.LogRecord("tests", logging.INFO, __file__, 1, "hello %s", ("world",), None)
+    record.interview_id = "i-1"
+    queue_handler.handle(record)
+
+    queued = log_queue.get_nowait()
+    assert formatted == []
+    assert queued.getMessage() == "hello world"
+    assert '"interview_id": "i-1"' in logging_config.JsonFormatter().format(queued)
@@ -0,0 +1,70 @@
+import multiprocessing
+
+import pytest
+
+from services import metrics
+
+
+@pytest.fixture
+def multiproc_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(metrics, "MULTIPROC_DIR", str(tmp_path))
+    # No background flusher: the tests flush explicitly
+    monkeypatch.setattr(metrics, "_ensure_flusher", lambda: None)
+    metrics.reset()
+    yield tmp_path
+    metrics.reset()
+
+
+def _worker(requests):
+    """A gunicorn worker stand-in: record, flush its snapshot, exit"""
+    for _ in range(requests):
+        metrics.inc("http_requests_total", route="/api/health", method="GET", status=200)
+        metrics.observe("http_request_duration_seconds", 0.02, route="/api/health", method="GET")
+    metrics.set_gauge("drive_upload_throughput_bytes_per_second", 100.0)
+    metrics._flush()
+
+
+def run_worker(requests):
+    # fork: the child inherits the patched MULTIPROC_DIR
+    process = multiprocessing.get_context("fork").Process(target=_worker, args=(requests,))
+    process.start()
+    process.join()
+    assert process.exitcode == 0
+
+
+def test_one_scrape_covers_every_worker(multiproc_dir):
+    run_worker(3)
+    run_worker(4)
+    metrics.inc("http_requests_total", route="/api/health", method="GET", status=200)
+    metrics.observe("http_request_duration_seconds", 0.02, route="/api/health", method="GET")
+
+    text = metrics.render_prometheus()
+
+    assert 'http_requests_total{method="GET",route="/api/health",status="200"} 8' in text
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/health"} 8' in text
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/api/health",le="0.025"} 8' in text
+    assert len(list(multiproc_dir.glob("metrics_*.json"))) == 3
+
+
+def test_gauges_of_exited_workers_are_dropped(multiproc_dir):
+    run_worker(1)
+    metrics.set_gauge("drive_upload_throughput_bytes_per_second", 250.0)
+
+    text = metrics.render_prometheus()
+
+    gauge_lines = [line for line in text.splitlines()
+                   if line.startswith("drive_upload_throughput_bytes_per_second")]
+    assert gauge_lines == [f'drive_upload_throughput_bytes_per_second{{pid="{multiprocessing.current_process().pid}"}} 250.0']
+
+
+def test_single_process_mode_is_unchanged(monkeypatch):
+    monkeypatch.setattr(metrics, "MULTIPROC_DIR", None)
+    metrics.reset()
+    metrics.inc("recording_chunks_total", outcome="stored")
+    metrics.set_gauge("drive_upload_throughput_bytes_per_second", 1.5)
+
+    text = metrics.render_prometheus()
+
+    assert 'recording_chunks_total{outcome="stored"} 1' in text
+    assert "drive_upload_throughput_bytes_per_second 1.5" in text
+    metrics.reset()
@@ -0,0 +1,152 @@
+import threading
+from types import SimpleNamespace
+
+import mongomock
+import pytest
+from pymongo.errors import DuplicateKeyError, ServerSelectionTimeoutError
+
+from services import mongodb_service
+
+
+def index_names(collection):
+    return set(collection.index_information()) - {"_id_"}
+
+
+def test_ensure_indexes_creates_every_spec(mongo_db):
+    assert mongodb_service.ensure_indexes() is True
+    # Idempotent: a second worker or a restart runs it again
+    assert mongodb_service.ensure_indexes() is True
+
+    for collection_name, specs in mongodb_service.INDEX_SPECS.items():
+        information = mongo_db[collection_name].index_information()
+        assert index_names(mongo_db[collection_name]) == {options["name"] for _, options in specs}
+        for keys, options in specs:
+            assert information[options["name"]]["key"] == keys
+
+    mongo_db.scheduled_interviews.insert_one({"interview_id": "interview-1"})
+    with pytest.raises(DuplicateKeyError):
+        mongo_db.scheduled_interviews.insert_one({"interview_id": "interview-1"})
+
+
+def test_ensure_indexes_keeps_going_after_a_failure(mongo_db, monkeypatch):
+    create_index = type(mongo_db.scheduled_interviews).create_index
+
+    def failing_create_index(self, keys, **options):
+        if options["name"] == "start_time_id":
+            raise RuntimeError("index build aborted")
+        return create_index(self, keys, **options)
+
+    monkeypatch.setattr(type(mongo_db.scheduled_interviews), "create_index", failing_create_index)
+
+    assert mongodb_service.ensure_indexes() is False
+    assert "start_time_id" not in index_names(mongo_db.scheduled_interviews)
+    assert "status_end_time" in index_names(mongo_db.scheduled_interviews)
+    assert index_names(mongo_db.interview_results) == {"interview_id_unique"}
+
+
+def test_every_hot_query_starts_with_an_indexed_field():
+    for name, collection_name, query in mongodb_service.HOT_QUERIES:
+        leading_fields = {keys[0][0] for keys, _ in mongodb_service.INDEX_SPECS[collection_name]}
+        assert leading_fields & set(query), name
+
+
+class ExplainedCollection:
+    """find(query).explain() answers with a canned winning plan"""
+
+    def __init__(self, plans):
+        self.plans = plans
+
+    def find(self, query):
+        plan = self.plans(query)
+        if isinstance(plan, Exception):
+            def explain():
+                raise plan
+        else:
+            def explain():
+                return {"queryPlanner": {"winningPlan": plan}}
+        return SimpleNamespace(explain=explain)
+
+
+def test_explain_hot_queries_flags_collection_scans(monkeypatch):
+    fetch_ixscan = {"stage": "FETCH", "inputStage": {"stage": "IXSCAN"}}
+    or_plan = {"stage": "SUBPLAN", "inputStage": {"stage": "OR", "inputStages": [
+        {"stage": "IXSCAN"}, {"stage": "COLLSCAN"}
+    ]}}
+
+    def plans(query):
+        if "end_time" in query:
+            return {"stage": "COLLSCAN"}
+        if "start_time" in query and "interview_status" not in query:
+            return or_plan
+        return fetch_ixscan
+
+    db = {
+        "scheduled_interviews": ExplainedCollection(plans),
+        "interview_results": ExplainedCollection(lambda query: OSError("connection reset"))
+    }
+    monkeypatch.setattr(mongodb_service, "_db", db)
+
+    report = {entry["query"]: entry for entry in mongodb_service.explain_hot_queries()}
+
+    assert set(report) == {name for name, _, _ in mongodb_service.HOT_QUERIES}
+    assert report["get_interview_by_id"]["stages"] == ["FETCH", "IXSCAN"]
+    assert report["get_interview_by_id"]["collscan"] is False
+    assert report["scheduled by end_time"]["collscan"] is True
+    assert report["listing page"]["stages"] == ["SUBPLAN", "OR", "IXSCAN", "COLLSCAN"]
+    assert report["listing page"]["collscan"] is True
+    assert report["result by interview_id"]["collscan"] is None
+    assert report["result by interview_id"]["error"] == "connection reset"
+
+
+@pytest.fixture
+def disconnected(monkeypatch):
+    monkeypatch.setattr(mongodb_service, "CLIENT_URI", "mongodb://mongo.test:27017/")
+    monkeypatch.setattr(mongodb_service, "_mongo_client", None)
+    monkeypatch.setattr(mongodb_service, "_db", None)
+    monkeypatch.setattr(mongodb_service, "_connect_failed_at", None)
+
+
+def test_indexes_are_ensured_in_the_background_after_connecting(disconnected, monkeypatch):
+    ensured = threading.Event()
+    monkeypatch.setattr(mongodb_service, "MongoClient", lambda uri, **kwargs: mongomock.MongoClient())
+    monkeypatch.setattr(mongodb_service, "ensure_indexes", ensured.set)
+
+    assert mongodb_service.get_db() is not None
+    assert ensured.wait(5)
+
+
+def test_index_bootstrap_can_be_switched_off(disconnected, monkeypatch):
+    calls = []
+    monkeypatch.setattr(mongodb_service, "ENSURE_INDEXES", False)
+    monkeypatch.setattr(mongodb_service, "MongoClient", lambda uri, **kwargs: mongomock.MongoClient())
+    monkeypatch.setattr(mongodb_service, "ensure_indexes", lambda: calls.append("ensure"))
+
+    assert mongodb_service.get_db() is not None
+    assert calls == []
+
+
+def test_unreachable_server_is_retried_after_a_pause(disconnected, monkeypatch):
+    attempts = []
+
+    class Unreachable:
+        def __init__(self, uri, **kwargs):
+            attempts.append(uri)
+            self.admin = SimpleNamespace(command=self.ping)
+
+        def ping(self, name):
+            raise ServerSelectionTimeoutError("no servers found")
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(mongodb_service, "MongoClient", Unreachable)
+
+    assert mongodb_service.get_db() is None
+    assert mongodb_service.get_db() is None
+    assert len(attempts) == 1
+    assert mongodb_service.ensure_indexes() is False
+    assert mongodb_service.explain_hot_queries() == []
+
+    monkeypatch.setattr(mongodb_service, "MONGO_RETRY_SECONDS", 0)
+    assert mongodb_service.get_db() is None
+    assert len(attempts) == 2
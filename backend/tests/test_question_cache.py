@@ -0,0 +1,163 @@
+import threading
+from itertools import cycle
+
+import mongomock
+import pytest
+
+from services import question_cache
+from services.question_cache import QuestionCache, jd_hash
+
+JD = "Backend engineer, Python and MongoDB"
+
+
+class Generator:
+    """generate_fn that numbers each fresh question set"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, jd_text):
+        self.calls.append(jd_text)
+        return [f"Question set {len(self.calls)}"]
+
+
+@pytest.fixture
+def variants(monkeypatch):
+    """Make variant selection follow the given sequence"""
+    def pick(*sequence):
+        choices = cycle(sequence)
+        monkeypatch.setattr(question_cache.random, "randrange", lambda n: next(choices))
+    return pick
+
+
+def test_trivial_jd_edits_share_a_key():
+    assert jd_hash(JD) == jd_hash("  backend ENGINEER,\n python and   mongodb ")
+    assert jd_hash(JD) != jd_hash("Frontend engineer")
+
+
+def test_each_variant_is_generated_once(variants):
+    cache = QuestionCache(variants=3)
+    generate = Generator()
+    variants(0, 1, 0, 2, 1, 2)
+
+    sets = [cache.get_or_generate(JD, generate)[0] for _ in range(6)]
+
+    assert sets == [
+        "Question set 1", "Question set 2", "Question set 1",
+        "Question set 3", "Question set 2", "Question set 3"
+    ]
+    assert len(generate.calls) == 3
+    stats = cache.stats()
+    assert (stats["misses"], stats["memory_hits"], stats["variants"]) == (3, 3, 3)
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_variants_are_shared_through_mongo(variants):
+    collection = mongomock.MongoClient().db.question_cache
+    generate = Generator()
+    variants(0, 1)
+    QuestionCache(collection=collection, variants=2).get_or_generate(JD, generate)
+    QuestionCache(collection=collection, variants=2).get_or_generate(JD, generate)
+
+    assert sorted((doc["jd_hash"], doc["variant"]) for doc in collection.find()) == [
+        (jd_hash(JD), 0), (jd_hash(JD), 1)
+    ]
+
+    # Another worker with an empty memory tier reads both from Mongo
+    other = QuestionCache(collection=collection, variants=2)
+    variants(1, 0)
+    assert other.get_or_generate(JD, generate) == ["Question set 2"]
+    assert other.get_or_generate(JD, generate) == ["Question set 1"]
+    assert other.stats()["mongo_hits"] == 2
+    assert len(generate.calls) == 2
+
+
+def test_lookup_then_store(variants):
+    cache = QuestionCache(variants=2)
+    variants(1)
+
+    key, questions = cache.lookup(JD)
+    assert (key, questions) == (f"{jd_hash(JD)}:1", None)
+
+    cache.store(key, ["Generated elsewhere"])
+    assert cache.lookup(JD) == (key, ["Generated elsewhere"])
+
+
+def test_memory_tier_is_bounded_and_expires(variants, monkeypatch):
+    variants(0)
+    cache = QuestionCache(max_entries=2, variants=1)
+    generate = Generator()
+    for jd in ("Role A", "Role B", "Role A", "Role C"):
+        cache.get_or_generate(jd, generate)
+
+    # Role B was least recently used when Role C came in
+    assert cache.stats()["memory_entries"] == 2
+    cache.get_or_generate("Role B", generate)
+    assert generate.calls == ["Role A", "Role B", "Role C", "Role B"]
+
+    clock = [1000.0]
+    monkeypatch.setattr(question_cache.time, "monotonic", lambda: clock[0])
+    cache = QuestionCache(ttl_seconds=60, variants=1)
+    cache.get_or_generate(JD, generate)
+    clock[0] += 61
+    cache.get_or_generate(JD, generate)
+    assert generate.calls[-2:] == [JD, JD]
+
+
+def test_concurrent_misses_generate_once(variants):
+    variants(0)
+    cache = QuestionCache(variants=1)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow_generate(jd_text):
+        calls.append(jd_text)
+        started.set()
+        release.wait(5)
+        return ["Shared question"]
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_generate(JD, slow_generate)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    assert started.wait(5)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [JD]
+    assert results == [["Shared question"]] * 4
+
+
+def test_key_locks_are_bounded(variants):
+    variants(0)
+    cache = QuestionCache(max_entries=2, variants=1)
+    generate = Generator()
+
+    for n in range(10):
+        cache.get_or_generate(f"Role {n}", generate)
+        assert len(cache._key_locks) <= 3
+
+    # A key whose lock was dropped still gets one and is served from memory
+    assert cache.get_or_generate("Role 9", generate) == ["Question set 10"]
+
+
+def test_mongo_errors_fall_back_to_generation(variants):
+    class Down:
+        def create_index(self, *args, **kwargs):
+            raise ConnectionError("no primary")
+
+        find_one = replace_one = create_index
+
+    variants(0)
+    cache = QuestionCache(collection=Down(), variants=1)
+    generate = Generator()
+
+    assert cache.get_or_generate(JD, generate) == ["Question set 1"]
+    assert cache.get_or_generate(JD, generate) == ["Question set 1"]
+    # The read and the write of the first miss
+    assert cache.stats()["errors"] == 2
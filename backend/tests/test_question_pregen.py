@@ -0,0 +1,128 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from routes import interviews
+from services import question_pregen
+from services.question_cache import QuestionCache
+from services.session_store import MemorySessionStore
+
+JD = "Backend engineer, Python and MongoDB"
+QUESTIONS = ["Pre-generated one", "Pre-generated two"]
+
+
+@pytest.fixture
+def pregen(mongo_db, monkeypatch):
+    """Runs pre-generation enabled, on a pool that is drained before returning"""
+    cache = QuestionCache(variants=1)
+    monkeypatch.setattr(question_pregen, "QUESTION_PREGEN_ENABLED", True)
+    monkeypatch.setattr(question_pregen, "get_question_cache", lambda: cache)
+
+    def run(interviews, generate_fn):
+        executor = ThreadPoolExecutor(max_workers=2)
+        monkeypatch.setattr(question_pregen, "_executor", executor)
+        question_pregen.schedule_pregeneration(interviews, generate_fn)
+        executor.shutdown(wait=True)
+
+    return run
+
+
+def schedule(mongo_db, interview_id, status="scheduled"):
+    mongo_db.scheduled_interviews.insert_one({
+        "interview_id": interview_id,
+        "job_description": JD,
+        "interview_status": status,
+        "start_time": datetime.utcnow()
+    })
+
+
+def stored(mongo_db, interview_id):
+    return mongo_db.scheduled_interviews.find_one({"interview_id": interview_id})
+
+
+def test_questions_are_stored_on_the_interview(mongo_db, pregen):
+    schedule(mongo_db, "interview-1")
+    schedule(mongo_db, "interview-2")
+    calls = []
+
+    def generate(jd_text):
+        calls.append(jd_text)
+        return QUESTIONS
+
+    pregen([("interview-1", JD), ("interview-2", f"  {JD}\n")], generate)
+
+    for interview_id in ("interview-1", "interview-2"):
+        assert stored(mongo_db, interview_id)["questions"] == QUESTIONS
+        assert stored(mongo_db, interview_id)["questions_status"] == "ready"
+    # Both interviews share a job description, so it is generated once
+    assert calls == [JD]
+
+
+def test_failed_generation_is_recorded(mongo_db, pregen):
+    schedule(mongo_db, "interview-1")
+    schedule(mongo_db, "interview-2")
+
+    def generate(jd_text):
+        raise TimeoutError("LLM unavailable")
+
+    pregen([("interview-1", JD)], generate)
+    pregen([("interview-2", JD)], lambda jd_text: [])
+
+    for interview_id in ("interview-1", "interview-2"):
+        assert stored(mongo_db, interview_id)["questions_status"] == "failed"
+        assert "questions" not in stored(mongo_db, interview_id)
+
+
+def test_started_interview_keeps_its_questions(mongo_db, pregen):
+    schedule(mongo_db, "interview-1", status="started")
+
+    pregen([("interview-1", JD)], lambda jd_text: QUESTIONS)
+
+    assert "questions_status" not in stored(mongo_db, "interview-1")
+    assert "questions" not in stored(mongo_db, "interview-1")
+
+
+def test_disabled_or_blank_jd_submits_nothing(mongo_db, pregen, monkeypatch):
+    schedule(mongo_db, "interview-1")
+    calls = []
+
+    pregen([("interview-1", "   "), ("interview-2", None)], calls.append)
+    monkeypatch.setattr(question_pregen, "QUESTION_PREGEN_ENABLED", False)
+    question_pregen.schedule_pregeneration([("interview-1", JD)], calls.append)
+
+    assert calls == []
+    assert "questions_status" not in stored(mongo_db, "interview-1")
+
+
+def test_start_falls_back_to_live_generation(client, mongo_db, pregen, monkeypatch):
+    schedule(mongo_db, "interview-1")
+    schedule(mongo_db, "interview-2")
+    pregen([("interview-1", JD)], lambda jd_text: QUESTIONS)
+
+    store = MemorySessionStore()
+    llm_calls = []
+
+    def chat(call_type, messages, **kwargs):
+        llm_calls.append(call_type)
+        content = "1. Live one\n2. Live two"
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+    monkeypatch.setattr(interviews, "get_session_store", lambda: store)
+    monkeypatch.setattr(interviews, "get_question_cache", lambda: QuestionCache(variants=1))
+    monkeypatch.setattr(interviews.llm_client, "chat", chat)
+
+    # Pre-generated: no LLM call at start
+    response = client.post("/api/interviews/generate-questions",
+                           json={"jd": JD, "interview_id": "interview-1"})
+    assert response.json["questions"] == QUESTIONS
+    assert llm_calls == []
+
+    # Not pre-generated (failed, or still running): generated on demand
+    response = client.post("/api/interviews/generate-questions",
+                           json={"jd": JD, "interview_id": "interview-2"})
+    assert response.status_code == 200
+    assert response.json["questions"] == ["Live one", "Live two"]
+    assert llm_calls == ["questions"]
+    assert store.get("interview-2")["questions"] == ["Live one", "Live two"]
@@ -0,0 +1,180 @@
+import io
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from routes import interviews
+from services import recording_chunks
+from services.recording_chunks import IncompleteRecording, RecordingCompleted
+
+
+@pytest.fixture(autouse=True)
+def chunk_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "recording_chunks"
+    monkeypatch.setattr(recording_chunks, "CHUNK_DIR", directory)
+    return directory
+
+
+def chunk(index):
+    return f"<chunk {index}>".encode()
+
+
+def store(index, interview_id="interview-1"):
+    return recording_chunks.store_chunk(interview_id, index, io.BytesIO(chunk(index)))
+
+
+def assembled(count):
+    return b"".join(chunk(index) for index in range(count))
+
+
+class Submit:
+    """Stands in for upload_queue.submit: keeps what it was handed"""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.contents = []
+
+    def __call__(self, path):
+        if self.error:
+            raise self.error
+        with open(path, "rb") as f:
+            self.contents.append(f.read())
+        return f"job-{len(self.contents)}"
+
+
+def test_out_of_order_chunks_are_appended_in_order():
+    assert store(2)[1]["next_index"] == 0
+    assert recording_chunks.get_progress("interview-1")["pending"] == [2]
+    assert store(0)[1]["next_index"] == 1
+    assert store(1)[1]["next_index"] == 3
+
+    progress = recording_chunks.get_progress("interview-1")
+    assert progress["pending"] == []
+    assert progress["bytes"] == len(assembled(3))
+
+    submit = Submit()
+    assert recording_chunks.complete("interview-1", 3, submit) == "job-1"
+    assert submit.contents == [assembled(3)]
+
+
+def test_retried_chunks_are_ignored():
+    assert store(1)[0] is True
+    # Retried while still waiting for the gap, and again after being appended
+    assert store(1)[0] is False
+    store(0)
+    stored, state = store(1)
+    assert stored is False
+    assert state["next_index"] == 2
+
+    submit = Submit()
+    recording_chunks.complete("interview-1", 2, submit)
+    assert submit.contents == [assembled(2)]
+
+
+def test_gap_is_reported_until_filled():
+    store(0)
+    store(2)
+    store(4)
+
+    with pytest.raises(IncompleteRecording) as missing:
+        recording_chunks.complete("interview-1", 5, Submit())
+    assert missing.value.missing == [1, 3]
+
+    store(1)
+    store(3)
+    submit = Submit()
+    recording_chunks.complete("interview-1", 5, submit)
+    assert submit.contents == [assembled(5)]
+
+
+def test_complete_can_be_retried_after_submit_fails():
+    for index in range(3):
+        store(index)
+
+    with pytest.raises(ConnectionError):
+        recording_chunks.complete("interview-1", 3, Submit(ConnectionError("queue down")))
+    assert recording_chunks.get_progress("interview-1")["bytes"] == len(assembled(3))
+
+    submit = Submit()
+    assert recording_chunks.complete("interview-1", 3, submit) == "job-1"
+    assert submit.contents == [assembled(3)]
+
+
+def test_completed_recording_rejects_late_chunks(chunk_dir):
+    store(0)
+    recording_chunks.complete("interview-1", 1, Submit())
+
+    with pytest.raises(RecordingCompleted):
+        store(1)
+    with pytest.raises(RecordingCompleted):
+        recording_chunks.complete("interview-1", 1, Submit())
+
+    directory = chunk_dir / "interview-1"
+    assert not (directory / recording_chunks.SPOOL_NAME).exists()
+    assert not list(directory.glob("*.part"))
+    assert recording_chunks.get_progress("interview-1")["completed"] is True
+    assert recording_chunks.purge_stale(max_age_seconds=-1) == 1
+
+
+def test_chunk_racing_complete_is_rejected(chunk_dir):
+    store(0)
+    submitting = threading.Event()
+    release = threading.Event()
+    errors = []
+
+    def slow_submit(path):
+        submitting.set()
+        release.wait(5)
+        return "job-1"
+
+    def late_chunk():
+        try:
+            store(1)
+        except RecordingCompleted as e:
+            errors.append(e)
+
+    completer = threading.Thread(
+        target=lambda: recording_chunks.complete("interview-1", 1, slow_submit)
+    )
+    completer.start()
+    assert submitting.wait(5)
+
+    # The late chunk passes the completed check, then waits on the spool lock
+    sender = threading.Thread(target=late_chunk)
+    sender.start()
+    time.sleep(0.1)
+    release.set()
+    completer.join()
+    sender.join()
+
+    assert len(errors) == 1
+    directory = chunk_dir / "interview-1"
+    assert not (directory / recording_chunks.SPOOL_NAME).exists()
+    assert not list(directory.glob("*.part"))
+
+
+def test_chunk_routes(client, monkeypatch):
+    submitted = []
+    monkeypatch.setattr(interviews, "upload_queue", SimpleNamespace(
+        submit=lambda path, filename, interview_id: submitted.append(filename) or "job-1"
+    ))
+    url = "/api/interviews/recording-chunks/interview-1"
+
+    assert client.put(f"{url}/1", data=chunk(1)).json["received"] == 0
+    response = client.post(f"{url}/complete", json={"total_chunks": 2})
+    assert response.status_code == 409
+    assert response.json["missing"] == [0]
+
+    assert client.put(f"{url}/0", data=chunk(0)).json["received"] == 2
+    response = client.post(f"{url}/complete", json={"total_chunks": 2, "candidate_name": "Ada"})
+    assert response.status_code == 202
+    assert response.json["job_id"] == "job-1"
+    assert submitted == ["Interview_Ada_interview-1.webm"]
+
+    assert client.put(f"{url}/2", data=chunk(2)).status_code == 409
+    response = client.post(f"{url}/complete", json={"total_chunks": 2})
+    assert response.status_code == 200
+    assert response.json["status"] == "completed"
+    assert submitted == ["Interview_Ada_interview-1.webm"]
@@ -0,0 +1,103 @@
+import logging
+
+import pytest
+
+from services import recording_storage
+from services.recording_storage import LocalRecordingStorage, RecordingStorage, iter_file_range
+
+
+@pytest.fixture
+def local_storage(tmp_path, monkeypatch):
+    storage = LocalRecordingStorage(tmp_path / "recordings")
+    monkeypatch.setattr(recording_storage, "_storages", {"local": storage})
+    return storage
+
+
+def save(storage, tmp_path, content):
+    source = tmp_path / "spool.webm"
+    source.write_bytes(content)
+    return storage.save_file(str(source), "Interview_Test.webm")
+
+
+def test_local_storage_deduplicates_by_sha256(local_storage, tmp_path, caplog):
+    caplog.set_level(logging.INFO)
+
+    first = save(local_storage, tmp_path, b"same bytes")
+    second = save(local_storage, tmp_path, b"same bytes")
+    other = save(local_storage, tmp_path, b"other bytes")
+
+    assert first["id"] == second["id"] != other["id"]
+    assert len(list((tmp_path / "recordings").rglob("*.webm"))) == 2
+    assert local_storage.local_path(first["id"]).read_bytes() == b"same bytes"
+    assert local_storage.local_path("../" + first["id"]) is None
+
+
+def test_iter_file_range_handles_empty_file(tmp_path):
+    path = tmp_path / "empty.webm"
+    path.write_bytes(b"")
+
+    assert list(iter_file_range(path, 0, 0)) == []
+
+
+def schedule_with_recording(mongo_db, storage, tmp_path, content):
+    recording = save(storage, tmp_path, content)
+    mongo_db.scheduled_interviews.insert_one({
+        "interview_id": "interview-1",
+        "recording_id": recording["id"],
+        "recording_backend": "local"
+    })
+    return recording["id"]
+
+
+def test_recording_endpoint_serves_ranges(client, mongo_db, local_storage, tmp_path):
+    content = bytes(range(256)) * 4096  # 1 MiB
+    recording_id = schedule_with_recording(mongo_db, local_storage, tmp_path, content)
+
+    full = client.get("/api/interviews/recording/interview-1")
+    assert full.status_code == 200
+    assert full.headers["Accept-Ranges"] == "bytes"
+    assert full.headers["ETag"] == f'"{recording_id}"'
+    assert full.data == content
+
+    partial = client.get("/api/interviews/recording/interview-1", headers={"Range": "bytes=1000-1999"})
+    assert partial.status_code == 206
+    assert partial.headers["Content-Range"] == f"bytes 1000-1999/{len(content)}"
+    assert partial.data == content[1000:2000]
+
+    suffix = client.get("/api/interviews/recording/interview-1", headers={"Range": "bytes=-10"})
+    assert suffix.data == content[-10:]
+
+    beyond = client.get("/api/interviews/recording/interview-1", headers={"Range": f"bytes={len(content)}-"})
+    assert beyond.status_code == 416
+    assert beyond.headers["Content-Range"] == f"bytes */{len(content)}"
+
+
+def test_recording_endpoint_empty_file(client, mongo_db, local_storage, tmp_path):
+    schedule_with_recording(mongo_db, local_storage, tmp_path, b"")
+
+    response = client.get("/api/interviews/recording/interview-1")
+    assert response.status_code == 200
+    assert response.data == b""
+
+    ranged = client.get("/api/interviews/recording/interview-1", headers={"Range": "bytes=0-10"})
+    assert ranged.status_code == 416
+
+
+def test_recording_endpoint_redirects_drive_recordings(client, mongo_db):
+    mongo_db.scheduled_interviews.insert_one({
+        "interview_id": "interview-2",
+        "recording_id": "drive-file-id",
+        "recording_backend": "drive"
+    })
+
+    response = client.get("/api/interviews/recording/interview-2")
+    assert response.status_code == 302
+    assert response.headers["Location"] == "https://drive.google.com/file/d/drive-file-id/view"
+
+
+def test_storage_without_save_file_fails_when_built():
+    class ReadOnlyStorage(RecordingStorage):
+        name = "read-only"
+
+    with pytest.raises(TypeError, match="save_file"):
+        ReadOnlyStorage()
@@ -0,0 +1,93 @@
+import csv
+import gzip
+import io
+import json
+from datetime import datetime
+
+import pytest
+
+from services import results_export
+
+
+@pytest.fixture
+def client(mongo_db):
+    from index import app
+    return app.test_client()
+
+
+@pytest.fixture
+def interviews(mongo_db):
+    for i in range(3):
+        interview_id = f"interview-{i}"
+        mongo_db.scheduled_interviews.insert_one({
+            "interview_id": interview_id,
+            "candidate_name": f"Candidate {i}",
+            "candidate_email": f"c{i}@example.com",
+            "interview_status": "completed",
+            "start_time": datetime(2026, 1, 1 + i, 9),
+            "end_time": datetime(2026, 1, 1 + i, 10),
+            "video_link": f"https://drive.invalid/{i}"
+        })
+        if i < 2:  # interview-2 has no result and is not exported
+            mongo_db.interview_results.insert_one({
+                "interview_id": interview_id,
+                "timestamp": "2026-01-01T10:00:00",
+                "qna": [{"question": "Q1", "answer": "A1"}, {"question": "Q2", "answer": "A2"}],
+                "evaluation": {"overall_score": 7 + i, "recommendation": "Yes", "feedback": "Good"}
+            })
+
+
+def test_csv_export(client, interviews):
+    response = client.get("/api/scheduler/export?format=csv")
+
+    assert response.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+    assert [row["interview_id"] for row in rows] == ["interview-0", "interview-1"]
+    assert rows[0]["answers"] == "2"
+    assert rows[1]["overall_score"] == "8"
+    assert rows[0]["video_link"] == "https://drive.invalid/0"
+
+
+def test_ndjson_gzip_export_with_qna(client, interviews):
+    response = client.get("/api/scheduler/export?format=ndjson&qna=1&gzip=1")
+
+    assert response.status_code == 200
+    lines = gzip.decompress(response.data).decode().splitlines()
+    rows = [json.loads(line) for line in lines]
+    assert len(rows) == 2
+    assert rows[0]["qna"][1] == {"question": "Q2", "answer": "A2"}
+    assert "error" not in rows[-1]
+
+
+def test_export_that_cannot_start_is_an_error_response(client, monkeypatch):
+    class BrokenCollection:
+        def aggregate(self, *args, **kwargs):
+            raise RuntimeError("pipeline rejected")
+
+    from services import mongodb_service
+    monkeypatch.setattr(mongodb_service, "get_collection", lambda name: BrokenCollection())
+
+    response = client.get("/api/scheduler/export?format=csv")
+
+    assert response.status_code == 500
+    assert "pipeline rejected" in response.get_json()["error"]
+
+
+def test_mid_stream_failure_is_marked(client, interviews, monkeypatch):
+    flatten = results_export.flatten_document
+    calls = []
+
+    def flaky(document, include_qna=False):
+        calls.append(document)
+        if len(calls) == 2:
+            raise RuntimeError("connection reset")
+        return flatten(document, include_qna)
+
+    monkeypatch.setattr(results_export, "flatten_document", flaky)
+
+    ndjson = client.get("/api/scheduler/export?format=ndjson").get_data(as_text=True).splitlines()
+    assert json.loads(ndjson[-1]) == {"error": "export incomplete: connection reset"}
+
+    calls.clear()
+    text = client.get("/api/scheduler/export?format=csv").get_data(as_text=True)
+    assert text.endswith("# export incomplete: connection reset\r\n")
@@ -0,0 +1,129 @@
+import io
+from types import SimpleNamespace
+
+import pytest
+
+from routes import scheduler
+
+URL = "/api/scheduler/schedule-batch"
+BACKEND_JD = "Backend engineer, Python and MongoDB"
+CSV = (
+    "candidateName,candidateEmail,jobDescription,startTime,endTime\n"
+    f"Ada,ada@example.com,\"{BACKEND_JD}\",2030-01-01T10:00:00Z,2030-01-01T11:00:00Z\n"
+    f"Grace,grace@example.com,\"{BACKEND_JD}\",2030-01-01T12:00:00Z,2030-01-01T13:00:00Z\n"
+)
+
+
+def row(name, email=None, start="2030-01-01T10:00:00Z", end="2030-01-01T11:00:00Z"):
+    return {
+        "candidateName": name,
+        "candidateEmail": email or f"{name.lower()}@example.com",
+        "jobDescription": BACKEND_JD,
+        "startTime": start,
+        "endTime": end
+    }
+
+
+@pytest.fixture
+def pregen(monkeypatch):
+    """The (interview_id, job_description) pairs handed to pre-generation"""
+    scheduled = []
+    monkeypatch.setattr(scheduler, "schedule_pregeneration",
+                        lambda interviews, generate_fn: scheduled.extend(interviews))
+    return scheduled
+
+
+def test_json_batch_reports_each_row(client, mongo_db, pregen):
+    response = client.post(URL, json=[
+        row("Ada"),
+        row("Grace", email="not-an-email"),
+        row("Linus", start="2030-01-01T12:00:00Z", end="2030-01-01T11:00:00Z"),
+        {"candidateName": "Missing fields"},
+        row("Alan")
+    ])
+
+    assert response.status_code == 201
+    body = response.json
+    assert (body["total"], body["scheduled"], body["failed"]) == (5, 2, 3)
+    assert [result["status"] for result in body["results"]] == [
+        "scheduled", "error", "error", "error", "scheduled"
+    ]
+    assert body["results"][1]["error"] == "Invalid email address"
+    assert body["results"][2]["error"] == "Start time must be before end time"
+    assert body["results"][3]["error"] == "Missing required fields"
+
+    saved = {doc["interview_id"]: doc for doc in mongo_db.scheduled_interviews.find()}
+    assert set(saved) == {body["results"][0]["interviewId"], body["results"][4]["interviewId"]}
+    assert {doc["candidate_email"] for doc in saved.values()} == {"ada@example.com", "alan@example.com"}
+
+    # One outbox entry and one pre-generation per scheduled row
+    assert sorted(entry["to"] for entry in mongo_db.email_outbox.find()) == [
+        "ada@example.com", "alan@example.com"
+    ]
+    assert all(entry["status"] == "pending" for entry in mongo_db.email_outbox.find())
+    assert sorted(pregen) == sorted((interview_id, BACKEND_JD) for interview_id in saved)
+
+
+def test_json_object_with_an_interviews_list(client, mongo_db, pregen):
+    response = client.post(URL, json={"interviews": [row("Ada")]})
+
+    assert response.status_code == 201
+    assert response.json["scheduled"] == 1
+
+
+def test_csv_upload_and_csv_body(client, mongo_db, pregen):
+    response = client.post(URL, data={"file": (io.BytesIO(("\ufeff" + CSV).encode()), "drive.csv")},
+                           content_type="multipart/form-data")
+
+    assert response.status_code == 201
+    assert response.json["scheduled"] == 2
+    assert [result["candidateEmail"] for result in response.json["results"]] == [
+        "ada@example.com", "grace@example.com"
+    ]
+
+    response = client.post(URL, data=CSV, content_type="text/csv")
+
+    assert response.status_code == 201
+    assert response.json["scheduled"] == 2
+    assert mongo_db.scheduled_interviews.count_documents({}) == 4
+    assert mongo_db.email_outbox.count_documents({}) == 4
+    assert len(pregen) == 4
+
+
+def test_duplicate_rows_fail_alone(client, mongo_db, pregen, monkeypatch):
+    mongo_db.scheduled_interviews.create_index("interview_id", unique=True)
+    mongo_db.scheduled_interviews.insert_one({"interview_id": "taken"})
+    ids = iter(["fresh-1", "taken", "fresh-2"])
+    monkeypatch.setattr(scheduler, "uuid", SimpleNamespace(uuid4=lambda: next(ids)))
+
+    response = client.post(URL, json=[row("Ada"), row("Grace"), row("Alan")])
+
+    assert response.status_code == 201
+    results = response.json["results"]
+    assert [result["status"] for result in results] == ["scheduled", "error", "scheduled"]
+    assert results[1]["error"] == "Failed to save interview"
+    assert [result.get("interviewId") for result in results] == ["fresh-1", None, "fresh-2"]
+
+    # The failed row gets neither an email nor pre-generated questions
+    assert sorted(entry["to"] for entry in mongo_db.email_outbox.find()) == [
+        "ada@example.com", "alan@example.com"
+    ]
+    assert [interview_id for interview_id, _ in pregen] == ["fresh-1", "fresh-2"]
+
+
+def test_rejected_batches(client, mongo_db, pregen, monkeypatch):
+    assert client.post(URL, data="not json", content_type="application/json").status_code == 400
+    assert client.post(URL, json={"rows": []}).status_code == 400
+
+    response = client.post(URL, json=[{"candidateName": "Missing fields"}])
+    assert response.status_code == 400
+    assert response.json["scheduled"] == 0
+
+    monkeypatch.setattr(scheduler, "BATCH_MAX_ROWS", 2)
+    response = client.post(URL, json=[row("Ada"), row("Grace"), row("Alan")])
+    assert response.status_code == 400
+    assert "limited to 2" in response.json["error"]
+
+    assert mongo_db.scheduled_interviews.count_documents({}) == 0
+    assert mongo_db.email_outbox.count_documents({}) == 0
+    assert pregen == []
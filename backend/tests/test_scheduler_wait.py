@@ -0,0 +1,133 @@
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import httpx
+import pytz
+
+from routes import scheduler, scheduler_async
+
+
+def schedule(mongo_db, starts_in, status="scheduled"):
+    interview_id = uuid.uuid4().hex
+    start_time = datetime.now(pytz.utc) + timedelta(seconds=starts_in)
+    mongo_db.scheduled_interviews.insert_one({
+        "interview_id": interview_id,
+        "candidate_name": "Test Candidate",
+        "candidate_email": "candidate@example.com",
+        "interview_status": status,
+        "start_time": start_time.replace(tzinfo=None),
+        "end_time": (start_time + timedelta(hours=1)).replace(tzinfo=None)
+    })
+    return interview_id
+
+
+def wait(client, interview_id):
+    started = time.perf_counter()
+    response = client.get(f"/api/scheduler/wait?id={interview_id}")
+    return response, time.perf_counter() - started
+
+
+def test_far_off_start_returns_at_once_with_capped_retry(client, mongo_db):
+    response, elapsed = wait(client, schedule(mongo_db, starts_in=3600))
+
+    assert response.status_code == 200
+    assert response.json["status"] == "waiting"
+    assert response.json["retry_after"] == scheduler.WAIT_MAX_RETRY_SECONDS
+    assert elapsed < 1
+
+
+def test_near_start_retry_lands_just_after_start(client, mongo_db, monkeypatch):
+    monkeypatch.setattr(scheduler, "WAIT_JITTER_SECONDS", 3)
+
+    retries = []
+    for _ in range(20):
+        response, elapsed = wait(client, schedule(mongo_db, starts_in=10))
+        assert response.json["status"] == "waiting"
+        assert elapsed < 1
+        retries.append(response.json["retry_after"])
+
+    # time_remaining is whole seconds, so 9-10s until start plus 0-3s of jitter
+    assert all(9 <= retry <= 13 for retry in retries)
+    assert len(set(retries)) > 1
+
+
+def test_started_interview_is_live(client, mongo_db):
+    response, _ = wait(client, schedule(mongo_db, starts_in=-5))
+
+    assert response.json["status"] == "live"
+    assert "retry_after" not in response.json
+
+
+def test_completed_and_unknown_interviews(client, mongo_db):
+    response, _ = wait(client, schedule(mongo_db, starts_in=60, status="completed"))
+    assert response.json["status"] == "completed"
+
+    assert client.get("/api/scheduler/wait?id=missing").status_code == 404
+    assert client.get("/api/scheduler/wait").status_code == 400
+
+
+def held_wait(interview_id):
+    """GET /wait through asgi.py, where the long-poll handler serves it"""
+    import asgi
+
+    async def send():
+        transport = httpx.ASGITransport(app=asgi.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            return await client.get("/api/scheduler/wait", params={"id": interview_id})
+
+    started = time.perf_counter()
+    response = asyncio.run(send())
+    return response, time.perf_counter() - started
+
+
+def test_async_wait_holds_until_the_start(mongo_db, monkeypatch):
+    monkeypatch.setattr(scheduler_async, "WAIT_JITTER_SECONDS", 0.3)
+    interview_id = schedule(mongo_db, starts_in=1)
+
+    response, elapsed = held_wait(interview_id)
+
+    assert response.json()["status"] == "live"
+    # Released after the start time, within the jitter window
+    assert 0.9 <= elapsed <= 1.3 + 0.5
+
+
+def test_async_wait_is_bounded_by_the_hold_time(mongo_db, monkeypatch):
+    monkeypatch.setattr(scheduler_async, "WAIT_HOLD_SECONDS", 0.3)
+    monkeypatch.setattr(scheduler_async, "WAIT_RECHECK_SECONDS", 0.1)
+
+    response, elapsed = held_wait(schedule(mongo_db, starts_in=3600))
+
+    assert response.json()["status"] == "waiting"
+    assert response.json()["retry_after"] == 0
+    assert 0.3 <= elapsed < 1
+
+
+def test_async_wait_answers_at_once_when_not_waiting(mongo_db):
+    response, elapsed = held_wait(schedule(mongo_db, starts_in=60, status="completed"))
+    assert response.json()["status"] == "completed"
+    assert elapsed < 1
+
+    assert held_wait("missing")[0].status_code == 404
+    assert held_wait("")[0].status_code == 400
+
+
+def test_async_wake_ups_are_spread_over_the_jitter(mongo_db, monkeypatch):
+    monkeypatch.setattr(scheduler_async, "WAIT_JITTER_SECONDS", 1)
+    import asgi
+
+    interview_ids = [schedule(mongo_db, starts_in=0.5) for _ in range(10)]
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        transport = httpx.ASGITransport(app=asgi.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            async def one(interview_id):
+                await client.get("/api/scheduler/wait", params={"id": interview_id})
+                return loop.time()
+            return await asyncio.gather(*(one(interview_id) for interview_id in interview_ids))
+
+    finished = asyncio.run(run())
+
+    assert max(finished) - min(finished) > 0.2
@@ -0,0 +1,140 @@
+import multiprocessing
+import os
+import threading
+import uuid
+
+import pytest
+
+from conftest import AtomicCollection
+from services.session_store import MemorySessionStore, MongoSessionStore, SessionStore
+
+QUESTIONS = [f"Question {n}" for n in range(1, 6)]
+WORKERS = 4
+# More calls than questions, so the conditional $inc is raced past the end
+CALLS_PER_WORKER = 6
+
+
+def run_workers(stores, interview_id):
+    """Each store plays one gunicorn worker: take questions, then answer them"""
+    handed_out = []
+    indexes = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(len(stores))
+
+    def worker(store):
+        barrier.wait()
+        for _ in range(CALLS_PER_WORKER):
+            result = store.next_question(interview_id)
+            if not result["done"]:
+                index = store.append_answer(interview_id, {"question": result["question"]})
+                with lock:
+                    handed_out.append(result["questionNumber"])
+                    indexes.append(index)
+
+    threads = [threading.Thread(target=worker, args=(store,)) for store in stores]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return handed_out, indexes
+
+
+def assert_each_question_once(session, handed_out, indexes):
+    assert sorted(handed_out) == list(range(1, len(QUESTIONS) + 1))
+    assert session["current_index"] == len(QUESTIONS)
+    # Every $push got its own slot and answer_count gave back that slot
+    assert sorted(indexes) == list(range(len(QUESTIONS)))
+    assert sorted(qa["question"] for qa in session["qna"]) == QUESTIONS
+
+
+def test_memory_store_hands_out_each_question_once():
+    store = MemorySessionStore()
+    store.create("interview-1", QUESTIONS)
+
+    handed_out, indexes = run_workers([store] * WORKERS, "interview-1")
+
+    assert_each_question_once(store.get("interview-1"), handed_out, indexes)
+
+
+def test_mongo_stores_share_one_session(mongo_db):
+    # Separate store instances on one collection, as in separate workers
+    collection = AtomicCollection(mongo_db.interview_sessions)
+    stores = [MongoSessionStore(collection) for _ in range(WORKERS)]
+    stores[0].create("interview-1", QUESTIONS)
+
+    handed_out, indexes = run_workers(stores, "interview-1")
+
+    assert_each_question_once(stores[1].get("interview-1"), handed_out, indexes)
+    assert stores[2].next_question("interview-1") == {"done": True, "question": ""}
+    assert stores[3].next_question("missing") is None
+    assert stores[3].append_answer("missing", {}) is None
+
+
+def test_mongo_scores_land_on_the_pushed_answer(mongo_db):
+    first = MongoSessionStore(mongo_db.interview_sessions)
+    second = MongoSessionStore(mongo_db.interview_sessions)
+    first.create("interview-1", QUESTIONS)
+
+    a = first.append_answer("interview-1", {"question": "a"})
+    b = second.append_answer("interview-1", {"question": "b"})
+    second.set_answer_score("interview-1", a, 7)
+    first.set_answer_score("interview-1", b, 3)
+
+    qna = first.get("interview-1")["qna"]
+    assert [(qa["question"], qa["score"]) for qa in qna] == [("a", 7), ("b", 3)]
+
+
+def _process_worker(uri, db_name, interview_id, results):
+    from pymongo import MongoClient
+
+    store = MongoSessionStore(MongoClient(uri)[db_name].interview_sessions)
+    handed_out = []
+    indexes = []
+    for _ in range(CALLS_PER_WORKER):
+        result = store.next_question(interview_id)
+        if not result["done"]:
+            indexes.append(store.append_answer(interview_id, {"question": result["question"]}))
+            handed_out.append(result["questionNumber"])
+    results.put((handed_out, indexes))
+
+
+@pytest.mark.skipif(not os.getenv("TEST_MONGO_URI"),
+                    reason="set TEST_MONGO_URI to run against a real MongoDB")
+def test_mongo_store_across_processes():
+    """Same check with real worker processes; mongomock cannot be shared between them"""
+    from pymongo import MongoClient
+
+    uri = os.environ["TEST_MONGO_URI"]
+    db_name = f"session_store_test_{uuid.uuid4().hex[:8]}"
+    client = MongoClient(uri)
+    try:
+        store = MongoSessionStore(client[db_name].interview_sessions)
+        store.create("interview-1", QUESTIONS)
+
+        # fork: the children need this module's worker function and sys.path
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        processes = [
+            context.Process(target=_process_worker, args=(uri, db_name, "interview-1", results))
+            for _ in range(WORKERS)
+        ]
+        for process in processes:
+            process.start()
+        outcomes = [results.get(timeout=60) for _ in processes]
+        for process in processes:
+            process.join()
+
+        handed_out = [number for numbers, _ in outcomes for number in numbers]
+        indexes = [index for _, found in outcomes for index in found]
+        assert_each_question_once(store.get("interview-1"), handed_out, indexes)
+    finally:
+        client.drop_database(db_name)
+
+
+def test_incomplete_store_fails_when_built():
+    class PartialStore(SessionStore):
+        def create(self, interview_id, questions):
+            pass
+
+    with pytest.raises(TypeError, match="next_question"):
+        PartialStore()
@@ -0,0 +1,70 @@
+import time
+from datetime import datetime
+
+import pytest
+
+from services import status_cache
+
+
+@pytest.fixture
+def cache(mongo_db, monkeypatch):
+    monkeypatch.setattr(status_cache, "_entries", status_cache.OrderedDict())
+    monkeypatch.setattr(status_cache, "STATUS_CACHE_TTL_SECONDS", 60)
+    for n in (1, 2):
+        mongo_db.scheduled_interviews.insert_one({
+            "interview_id": f"interview-{n}",
+            "interview_status": "scheduled",
+            "start_time": datetime(2030, 1, 1, 10, 0),
+            "end_time": datetime(2030, 1, 1, 11, 0)
+        })
+    return mongo_db
+
+
+def set_status(mongo_db, status, interview_id="interview-1"):
+    mongo_db.scheduled_interviews.update_one(
+        {"interview_id": interview_id}, {"$set": {"interview_status": status}}
+    )
+
+
+def test_cached_until_invalidated(cache):
+    assert status_cache.get_status_doc("interview-1")["interview_status"] == "scheduled"
+    set_status(cache, "started")
+    assert status_cache.get_status_doc("interview-1")["interview_status"] == "scheduled"
+
+    status_cache.invalidate("interview-1")
+
+    assert status_cache.get_status_doc("interview-1")["interview_status"] == "started"
+
+
+def test_invalidate_many_drops_each_entry(cache):
+    for interview_id in ("interview-1", "interview-2"):
+        status_cache.get_status_doc(interview_id)
+        set_status(cache, "expired", interview_id)
+
+    status_cache.invalidate_many(["interview-1", "interview-2", "never-cached"])
+    status_cache.invalidate_many([])
+
+    assert status_cache.get_status_doc("interview-1")["interview_status"] == "expired"
+    assert status_cache.get_status_doc("interview-2")["interview_status"] == "expired"
+    # Invalidation stays in this process: nothing is written to MongoDB
+    assert "status_invalidations" not in cache.list_collection_names()
+
+
+def test_change_made_elsewhere_shows_once_the_ttl_runs_out(cache, monkeypatch):
+    monkeypatch.setattr(status_cache, "STATUS_CACHE_TTL_SECONDS", 0.1)
+    status_cache.get_status_doc("interview-1")
+
+    # Another worker starts the interview; this worker is not told
+    set_status(cache, "started")
+    assert status_cache.get_status_doc("interview-1")["interview_status"] == "scheduled"
+
+    time.sleep(0.15)
+    assert status_cache.get_status_doc("interview-1")["interview_status"] == "started"
+
+
+def test_times_are_normalized_to_utc(cache):
+    document = status_cache.get_status_doc("interview-1")
+
+    assert document["start_time"].tzinfo is not None
+    assert document["start_time_ist"] == "01 Jan 2030, 03:30 PM IST"
+    assert status_cache.get_status_doc("missing") is None
@@ -0,0 +1,160 @@
+import time
+from datetime import datetime
+
+import pytest
+
+from services.upload_queue import (
+    MemoryJobStore, MongoJobStore, UploadQueue, UploadQueueFull, create_job_store
+)
+
+
+class FakeDrive:
+    """Stand-in for the Drive upload: fails the first `failures` calls"""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.calls = []
+
+    def __call__(self, file_path, filename):
+        self.calls.append(filename)
+        if len(self.calls) <= self.failures:
+            raise ConnectionError("Drive unavailable")
+        with open(file_path, "rb") as f:
+            size = len(f.read())
+        return {"id": f"drive-{len(self.calls)}", "webViewLink": f"https://drive.invalid/{size}",
+                "backend": "drive"}
+
+
+def spool(tmp_path, name="upload.webm", size=1024):
+    path = tmp_path / name
+    path.write_bytes(b"\x1a" * size)
+    return str(path)
+
+
+def wait_for(predicate, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_job_is_visible_from_another_worker(mongo_db, tmp_path):
+    finished = []
+    drive = FakeDrive()
+    # Two queues on one collection stand in for two gunicorn workers
+    uploading = UploadQueue(upload_fn=drive, on_finished=finished.append, workers=1, retry_base=0,
+                            job_store=MongoJobStore(mongo_db.upload_jobs))
+    polling = UploadQueue(upload_fn=drive, workers=1, job_store=MongoJobStore(mongo_db.upload_jobs))
+
+    job_id = uploading.submit(spool(tmp_path), "Interview_A.webm", "interview-a")
+    assert polling.get_job(job_id)["status"] in ("queued", "running", "succeeded")
+
+    assert wait_for(lambda: finished)
+    job = polling.get_job(job_id)
+    assert job["status"] == "succeeded"
+    assert job["file_id"] == "drive-1"
+    assert job["interview_id"] == "interview-a"
+    assert "_id" not in job and "expires_at" not in job
+    assert polling.get_job("missing") is None
+
+
+def test_mongo_jobs_expire_through_ttl_index(mongo_db):
+    store = MongoJobStore(mongo_db.upload_jobs, ttl_seconds=60)
+    store.insert({"job_id": "job-1", "status": "queued"})
+
+    document = mongo_db.upload_jobs.find_one({"_id": "job-1"})
+    assert document["expires_at"] > datetime.utcnow()
+    assert wait_for(lambda: any(
+        index.get("expireAfterSeconds") == 0 and index["key"] == [("expires_at", 1)]
+        for index in mongo_db.upload_jobs.index_information().values()
+    ))
+
+
+def test_retries_then_succeeds(mongo_db, tmp_path):
+    finished = []
+    drive = FakeDrive(failures=2)
+    uploads = UploadQueue(upload_fn=drive, on_finished=finished.append, workers=1, retry_base=0,
+                          job_store=MongoJobStore(mongo_db.upload_jobs))
+
+    path = spool(tmp_path)
+    job_id = uploads.submit(path, "Interview_B.webm", "interview-b")
+
+    assert wait_for(lambda: finished)
+    job = uploads.get_job(job_id)
+    assert job["status"] == "succeeded"
+    assert job["attempts"] == 3
+    assert len(drive.calls) == 3
+    assert not (tmp_path / "upload.webm").exists()
+
+
+def test_fails_after_max_attempts(tmp_path):
+    finished = []
+    drive = FakeDrive(failures=10)
+    uploads = UploadQueue(upload_fn=drive, on_finished=finished.append, workers=1,
+                          max_attempts=2, retry_base=0, job_store=MemoryJobStore())
+
+    job_id = uploads.submit(spool(tmp_path), "Interview_C.webm", "interview-c")
+
+    assert wait_for(lambda: finished)
+    job = uploads.get_job(job_id)
+    assert job["status"] == "failed"
+    assert job["attempts"] == 2
+    assert job["error"] == "Failed to store video"
+
+
+def test_full_queue_drops_the_job(mongo_db, tmp_path, monkeypatch):
+    uploads = UploadQueue(upload_fn=FakeDrive(), maxsize=1,
+                          job_store=MongoJobStore(mongo_db.upload_jobs))
+    # No workers, so the first job stays queued
+    monkeypatch.setattr(uploads, "_ensure_workers", lambda: None)
+
+    uploads.submit(spool(tmp_path, "a.webm"), "a.webm", "interview-d")
+    with pytest.raises(UploadQueueFull):
+        uploads.submit(spool(tmp_path, "b.webm"), "b.webm", "interview-d")
+
+    assert mongo_db.upload_jobs.count_documents({}) == 1
+
+
+def test_memory_store_prunes_finished_jobs():
+    store = MemoryJobStore(max_jobs=2)
+    store.insert({"job_id": "old", "status": "succeeded"})
+    store.insert({"job_id": "running", "status": "running"})
+    store.insert({"job_id": "new", "status": "queued"})
+
+    assert store.get("old") is None
+    assert store.get("running")["status"] == "running"
+    assert store.update("new", {"status": "failed"})["status"] == "failed"
+
+
+def test_store_falls_back_to_memory_without_mongo(monkeypatch):
+    from services import mongodb_service
+
+    monkeypatch.setattr(mongodb_service, "get_collection", lambda name: None)
+    assert isinstance(create_job_store(), MemoryJobStore)
+
+
+def test_store_uses_mongo_when_connected(mongo_db):
+    store = create_job_store()
+    assert isinstance(store, MongoJobStore)
+    assert store.collection.name == "upload_jobs"
+
+
+def test_job_record_dropped_during_upload_still_finishes(tmp_path):
+    finished = []
+    store = MemoryJobStore()
+
+    def upload_and_expire(file_path, filename):
+        # The TTL index (or a prune) removes the record while Drive is busy
+        for tracked in list(store._jobs):
+            store.delete(tracked)
+        return {"id": "drive-1", "webViewLink": None, "backend": "drive"}
+
+    uploads = UploadQueue(upload_fn=upload_and_expire, on_finished=finished.append, workers=1,
+                          retry_base=0, job_store=store)
+    job_id = uploads.submit(spool(tmp_path), "Interview_E.webm", "interview-e")
+
+    assert wait_for(lambda: finished)
+    assert finished[0]["status"] == "succeeded"
+    assert finished[0]["interview_id"] == "interview-e"
+    assert finished[0]["file_id"] == "drive-1"
+    assert uploads.get_job(job_id) is None
@@ -8,15 +8,27 @@ recognition.lang = 'en-US';
 let interviewData = null;
 let interviewStartTime = null;
 let mediaRecorder = null;
-let recordedChunks = [];
 let isListening = false;
 let currentTranscript = '';
 let timerInterval = null;
-let videoBlob = null;
 let recordedStream = null;
 let waitingInterval = null;
 let currentQuestion = '';
 
+// First /wait poll at a random point this far before the start, so a batch of
+// candidates doesn't connect at once; the server holds or sets retry_after after that
+const WAIT_POLL_MIN_LEAD_MS = 10000;
+const WAIT_POLL_MAX_LEAD_MS = 45000;
+
+// The recording is uploaded in chunks while the interview runs
+const RECORDING_TIMESLICE_MS = 5000;
+const CHUNK_MAX_ATTEMPTS = 5;
+const CHUNK_RETRY_BASE_MS = 1000;
+let chunkCount = 0;
+let unsentChunks = new Map();  // index -> Blob, until the server has it
+let chunkUploads = Promise.resolve();
+let recordingStopped = Promise.resolve();
+
 document.addEventListener('DOMContentLoaded', async () => {
     const params = new URLSearchParams(window.location.search);
     const interviewId = params.get("id");
@@ -32,76 +44,80 @@ document.addEventListener('DOMContentLoaded', async () => {
 
         console.log('[DEBUG] Status Response:', statusData);
 
-        // ✅ CRITICAL FIX: Check for already-used interviews FIRST
-        // These should be checked BEFORE checking time window
-        if (statusData.status === "completed") {
-            document.body.innerHTML = `
-                <div style="height:100vh;display:flex;align-items:center;justify-content:center;
-                background:#030712;color:white;text-align:center;">
-                    <div>
-                        <div style="font-size:48px;margin-bottom:20px;">✅</div>
-                        <h2 style="color:#FFFFFF;">Interview Already Completed</h2>
-                        <p style="color:#94a3b8;margin-top:10px;">
-                            Thank you for attending. Our team will get back to you shortly.
-                        </p>
-                    </div>
+        await handleStatus(statusData, interviewId);
+    } catch (error) {
+        console.error('[ERROR] Status check failed:', error);
+        showError('Failed to validate session');
+    }
+});
+
+async function handleStatus(statusData, interviewId) {
+    // ✅ CRITICAL FIX: Check for already-used interviews FIRST
+    // These should be checked BEFORE checking time window
+    if (statusData.status === "completed") {
+        document.body.innerHTML = `
+            <div style="height:100vh;display:flex;align-items:center;justify-content:center;
+            background:#030712;color:white;text-align:center;">
+                <div>
+                    <div style="font-size:48px;margin-bottom:20px;">✅</div>
+                    <h2 style="color:#FFFFFF;">Interview Already Completed</h2>
+                    <p style="color:#94a3b8;margin-top:10px;">
+                        Thank you for attending. Our team will get back to you shortly.
+                    </p>
                 </div>
-            `;
-            return;
-        }
+            </div>
+        `;
+        return;
+    }
 
-        if (statusData.status === "already_started") {
-            document.body.innerHTML = `
-                <div style="height:100vh;display:flex;align-items:center;justify-content:center;
-                background:#030712;color:white;text-align:center;">
-                    <div>
-                        <div style="font-size:48px;margin-bottom:20px;">⚠️</div>
-                        <h2 style="color:#FFFFFF;">Interview Already Started</h2>
-                        <p style="color:#94a3b8;margin-top:10px;">
-                            This interview is already in progress from another device or window.
-                        </p>
-                        <p style="color:#94a3b8;margin-top:15px; font-size: 14px;">
-                            If you think this is an error, please contact your recruiter.
-                        </p>
-                    </div>
+    if (statusData.status === "already_started") {
+        document.body.innerHTML = `
+            <div style="height:100vh;display:flex;align-items:center;justify-content:center;
+            background:#030712;color:white;text-align:center;">
+                <div>
+                    <div style="font-size:48px;margin-bottom:20px;">⚠️</div>
+                    <h2 style="color:#FFFFFF;">Interview Already Started</h2>
+                    <p style="color:#94a3b8;margin-top:10px;">
+                        This interview is already in progress from another device or window.
+                    </p>
+                    <p style="color:#94a3b8;margin-top:15px; font-size: 14px;">
+                        If you think this is an error, please contact your recruiter.
+                    </p>
                 </div>
-            `;
-            return;
-        }
+            </div>
+        `;
+        return;
+    }
 
-        // Now check time-based status (waiting, expired, live)
-        if (statusData.status === "waiting") {
-            showWaitingScreen(new Date(statusData.start_time), statusData.start_time_ist);
-            return;
-        }
+    // Now check time-based status (waiting, expired, live)
+    if (statusData.status === "waiting") {
+        showWaitingScreen(new Date(statusData.start_time), statusData.start_time_ist, interviewId);
+        return;
+    }
 
-        if (statusData.status === "expired") {
-            document.body.innerHTML = `
-                <div style="height: 100vh; display: flex; align-items: center; justify-content: center; background: #030712; color: white; text-align: center;">
-                    <div>
-                        <div style="font-size: 40px; margin-bottom: 20px;">⏰</div>
-                        <h2 style="color:#FFFFFF;">Interview window has closed</h2>
-                        <p style="color: #94a3b8; margin-top: 10px;">Please contact your recruiter to reschedule</p>
-                    </div>
+    if (statusData.status === "expired") {
+        document.body.innerHTML = `
+            <div style="height: 100vh; display: flex; align-items: center; justify-content: center; background: #030712; color: white; text-align: center;">
+                <div>
+                    <div style="font-size: 40px; margin-bottom: 20px;">⏰</div>
+                    <h2 style="color:#FFFFFF;">Interview window has closed</h2>
+                    <p style="color: #94a3b8; margin-top: 10px;">Please contact your recruiter to reschedule</p>
                 </div>
-            `;
-            return;
-        }
+            </div>
+        `;
+        return;
+    }
 
-        if (statusData.status === "live") {
-            interviewData = {
-                interviewId: statusData.interviewId,
-                candidateName: statusData.candidateName,
-                candidateEmail: statusData.candidateEmail,
-                jobDescription: statusData.jobDescription
-            };
-            await initializeInterview();
-        }
-    } catch (error) {
-        console.error('[ERROR] Status check failed:', error);
-        showError('Failed to validate session');
+    if (statusData.status === "live") {
+        interviewData = {
+            interviewId: statusData.interviewId,
+            candidateName: statusData.candidateName,
+            candidateEmail: statusData.candidateEmail,
+            jobDescription: statusData.jobDescription
+        };
+        await initializeInterview();
     }
-});
+}
 
 async function initializeInterview() {
     document.getElementById('waitingScreen').classList.remove('active');
@@ -115,7 +131,7 @@ async function initializeInterview() {
     await loadNextQuestion();
 }
 
-function showWaitingScreen(startTime, startTimeIST) {
+function showWaitingScreen(startTime, startTimeIST, interviewId) {
     document.getElementById('waitingScreen').classList.add('active');
     if (startTimeIST) {
         // Update the scheduled time display with coral color
@@ -125,15 +141,43 @@ function showWaitingScreen(startTime, startTimeIST) {
         timeDisplay.style.fontWeight = '700';
     }
     
-    updateWaitingCountdown(startTime);
-    waitingInterval = setInterval(() => {
-        const now = new Date();
-        if (now >= startTime) {
-            clearInterval(waitingInterval);
-            window.location.reload();
-        }
+    // The countdown is purely local; /wait tells us when to check again
+    if (!waitingInterval) {
         updateWaitingCountdown(startTime);
-    }, 1000);
+        waitingInterval = setInterval(() => updateWaitingCountdown(startTime), 1000);
+    }
+
+    scheduleWaitForLive(startTime, interviewId);
+}
+
+function scheduleWaitForLive(startTime, interviewId) {
+    // Poll shortly before the start time instead of reloading the page
+    const lead = WAIT_POLL_MIN_LEAD_MS + Math.random() * (WAIT_POLL_MAX_LEAD_MS - WAIT_POLL_MIN_LEAD_MS);
+    const untilFirstPoll = startTime - new Date() - lead;
+    setTimeout(() => waitForLive(interviewId), Math.max(0, untilFirstPoll));
+}
+
+async function waitForLive(interviewId) {
+    let statusData;
+    try {
+        const response = await fetch(`${API_BASE}/api/scheduler/wait?id=${interviewId}`);
+        statusData = await response.json();
+    } catch (error) {
+        console.error('[ERROR] Wait for live failed:', error);
+        // Back off with jitter so failed clients don't retry in lockstep
+        setTimeout(() => waitForLive(interviewId), 2000 + Math.random() * 3000);
+        return;
+    }
+
+    if (statusData.status === "waiting") {
+        // The server spreads retry_after so a whole batch doesn't come back at once
+        setTimeout(() => waitForLive(interviewId), statusData.retry_after * 1000);
+        return;
+    }
+
+    clearInterval(waitingInterval);
+    waitingInterval = null;
+    await handleStatus(statusData, interviewId);
 }
 
 function updateWaitingCountdown(startTime) {
@@ -177,13 +221,15 @@ function startRecording(stream) {
         mediaRecorder = new MediaRecorder(stream);
         mediaRecorder.ondataavailable = (event) => {
             if (event.data.size > 0) {
-                recordedChunks.push(event.data);
+                const index = chunkCount++;
+                unsentChunks.set(index, event.data);
+                // One chunk in flight at a time, in recording order
+                chunkUploads = chunkUploads.then(() => uploadChunk(index));
             }
         };
-        mediaRecorder.onstop = () => {
-            videoBlob = new Blob(recordedChunks, { type: 'video/webm' });
-        };
-        mediaRecorder.start();
+        // onstop fires after the last dataavailable
+        recordingStopped = new Promise(resolve => { mediaRecorder.onstop = resolve; });
+        mediaRecorder.start(RECORDING_TIMESLICE_MS);
     } catch (error) {
         console.error('Recording error:', error);
     }
@@ -353,11 +399,11 @@ async function endInterview() {
     document.getElementById('interviewSection').classList.remove('active');
     document.getElementById('feedbackSection').classList.add('active');
 
-    // Wait for recording to finish
-    await new Promise(resolve => setTimeout(resolve, 1000));
+    // Wait for the last chunk of the recording
+    await recordingStopped;
     
-    // Upload video
-    if (videoBlob) {
+    // Finish the video upload
+    if (chunkCount > 0) {
         await uploadVideo();
     }
 
@@ -365,33 +411,116 @@ async function endInterview() {
     await getEvaluation();
 }
 
+async function uploadChunk(index) {
+    const url = `${API_BASE}/api/interviews/recording-chunks/${interviewData.interviewId}/${index}`;
+
+    for (let attempt = 1; attempt <= CHUNK_MAX_ATTEMPTS; attempt++) {
+        try {
+            const response = await fetch(url, {
+                method: 'PUT',
+                headers: { 'Content-Type': 'application/octet-stream' },
+                body: unsentChunks.get(index)
+            });
+            if (response.ok) {
+                unsentChunks.delete(index);
+                return true;
+            }
+            // Only server errors and throttling are worth retrying
+            if (response.status < 500 && response.status !== 429) break;
+        } catch (error) {
+            console.warn(`Recording chunk ${index} attempt ${attempt} failed:`, error);
+        }
+        if (attempt < CHUNK_MAX_ATTEMPTS) {
+            await new Promise(resolve => setTimeout(resolve, CHUNK_RETRY_BASE_MS * 2 ** (attempt - 1)));
+        }
+    }
+
+    console.error(`Recording chunk ${index} not uploaded, will retry at the end`);
+    return false;
+}
+
 async function uploadVideo() {
     try {
-        const formData = new FormData();
-        formData.append('video', videoBlob, `interview_${interviewData.interviewId}.webm`);
-        formData.append('candidate_name', interviewData.candidateName);
-        formData.append('candidate_email', interviewData.candidateEmail);
+        await chunkUploads;
 
-        const response = await fetch(`${API_BASE}/api/interviews/upload-video/${interviewData.interviewId}`, {
-            method: 'POST',
-            body: formData
-        });
-        const result = await response.json();
-        console.log('Video upload:', result.status);
+        // Most of the recording is already on the server, so this is usually one small request
+        for (let round = 1; round <= 3; round++) {
+            for (const index of [...unsentChunks.keys()]) {
+                await uploadChunk(index);
+            }
+
+            const response = await fetch(`${API_BASE}/api/interviews/recording-chunks/${interviewData.interviewId}/complete`, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({
+                    total_chunks: chunkCount,
+                    candidate_name: interviewData.candidateName
+                })
+            });
+            const result = await response.json();
+
+            if (response.status === 409 || response.status === 503) {
+                console.warn('Video upload not complete yet:', result.missing || result.message);
+                await new Promise(resolve => setTimeout(resolve, CHUNK_RETRY_BASE_MS * round));
+                continue;
+            }
+            console.log('Video upload:', result.status, result.job_id || '');
+            return;
+        }
+        console.error('Video upload could not be completed');
     } catch (error) {
         console.error('Video upload error:', error);
     }
 }
 
 async function getEvaluation() {
+    // Update loading spinner with coral theme
+    const loadingDiv = document.getElementById('loadingFeedback');
+    loadingDiv.innerHTML = `
+        <div class="loading-spinner"></div>
+        <p id="evaluationProgress" style="font-weight: 600; color: #777777;">Generating AI Evaluation...</p>
+    `;
+
+    if (!window.EventSource) {
+        await getEvaluationOnce();
+        return;
+    }
+
+    // Stream progress and partial tokens, the final event carries the result
+    await new Promise(resolve => {
+        const source = new EventSource(`${API_BASE}/api/interviews/evaluate-stream/${interviewData.interviewId}`);
+        let receivedChars = 0;
+        let finished = false;
+
+        const finish = async (fallback) => {
+            if (finished) return;
+            finished = true;
+            source.close();
+            if (fallback) await getEvaluationOnce();
+            resolve();
+        };
+
+        source.addEventListener('token', (event) => {
+            receivedChars += JSON.parse(event.data).text.length;
+            document.getElementById('evaluationProgress').textContent =
+                `Generating AI Evaluation... (${receivedChars} chars)`;
+        });
+
+        source.addEventListener('result', (event) => {
+            displayFeedback(JSON.parse(event.data));
+            finish(false);
+        });
+
+        source.addEventListener('error', (event) => {
+            // Server-sent error events carry data, connection failures don't
+            if (event.data) console.error('Evaluation stream error:', event.data);
+            finish(true);
+        });
+    });
+}
+
+async function getEvaluationOnce() {
     try {
-        // Update loading spinner with coral theme
-        const loadingDiv = document.getElementById('loadingFeedback');
-        loadingDiv.innerHTML = `
-            <div class="loading-spinner"></div>
-            <p style="font-weight: 600; color: #777777;">Generating AI Evaluation...</p>
-        `;
-        
         const response = await fetch(`${API_BASE}/api/interviews/evaluate/${interviewData.interviewId}`);
         const evaluation = await response.json();
         displayFeedback(evaluation);